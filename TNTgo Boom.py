@@ -1,9 +1,18 @@
-import threading
 import rumps
 import time
-from datetime import datetime
 from threading import Timer
-import subprocess
+import os
+import sys
+import alerts
+import chart
+import driver
+import estimate
+import history
+import rollup
+import sessions
+import snapshot
+import startup
+import wear
 
 
 all_percentage = None
@@ -11,60 +20,261 @@ all_battery = None
 
 
 
-def script1_function():
-    print(subprocess.call('kext/kext-load', shell=True))
-    global all_percentage
-    global all_battery
-    class AwesomeStatusBarApp(rumps.App):
-        def __init__(self):
-            super(AwesomeStatusBarApp, self).__init__("Awesome App", icon='battery_icon.png', title=f"{all_percentage}")
+# 还没有读到电量时状态栏显示的占位文字
+PLACEHOLDER = "--%"
+# 还估算不出剩余时间时菜单中显示的文字
+ESTIMATE_PLACEHOLDER = "正在估算剩余时间…"
+WEAR_PLACEHOLDER = "正在统计电池循环…"
+# 显示的是快照中的旧电量时加上的前缀
+STALE_PREFIX = "~"
+STARTUP = startup.Startup()
+APP_SUPPORT = rumps.application_support("Awesome App")
+DRIVER_CACHE = os.path.join(APP_SUPPORT, 'driver.json')
+SNAPSHOT = snapshot.Snapshot(os.path.join(APP_SUPPORT, 'snapshot.json'))
+# 全部原始读数按天保存在 history 目录下，后台线程每 5 秒提交一次
+HISTORY = history.HistoryStore(os.path.join(APP_SUPPORT, 'history'))
+# 分钟 / 小时 / 天汇总和充放电过程，在历史的写入线程中随每次提交增量更新
+ROLLUPS = rollup.RollupStore(HISTORY.directory, HISTORY)
+SESSIONS = sessions.SessionStore(HISTORY.directory, HISTORY)
+# 电池循环次数（雨流计数），菜单中显示损耗
+WEAR = wear.WearTracker(HISTORY.directory, HISTORY)
+# “电量历史”子菜单中的图，打开子菜单时才绘制
+CHART_SPANS = [("最近 1 小时", chart.HOUR), ("最近 1 天", chart.DAY), ("最近 1 周", chart.WEEK)]
+CHART = None
+
+
+def history_committed(samples):
+    ROLLUPS.add(samples)
+    SESSIONS.add(samples)
+    WEAR.add(samples)
+
+
+HISTORY.on_commit = history_committed
+# 电量提醒通过系统通知发送：同类提醒只保留最新一条，每分钟最多 3 条
+NOTIFICATIONS = rumps.NotificationQueue(limit=3, period=60)
+ALERT_TEXT = {
+    alerts.LOW: ("电量低", "剩余电量 {0}%，请连接充电器"),
+    alerts.CRITICAL: ("电量严重不足", "剩余电量 {0}%，即将关机"),
+    alerts.FULL: ("电量已充满", "当前电量 {0}%"),
+    alerts.CHARGER_CONNECTED: ("充电器已连接", "当前电量 {0}%"),
+    alerts.CHARGER_DISCONNECTED: ("充电器已断开", "当前电量 {0}%"),
+}
+# 在这个时间之前的读数视为旧数据（启动时间或最近一次唤醒时间）
+fresh_after = time.time()
+latest = None
+# 最近一次的剩余时间估算（estimate.Estimate）
+remaining = None
+# 当前图标对应的 icon_key，变化时才重新加载图标
+icon_key = None
+app = None
+
+
+def is_stale():
+    return latest is None or latest.timestamp < fresh_after
+
+
+def battery_title():
+    if all_percentage is None:
+        return PLACEHOLDER
+    return f"{STALE_PREFIX if is_stale() else ''}{all_percentage}"
+
+
+def estimate_title():
+    if is_stale():
+        return ESTIMATE_PLACEHOLDER
+    return estimate.format_estimate(remaining) or ESTIMATE_PLACEHOLDER
+
+
+def wear_title():
+    return wear.format_wear(WEAR.value) or WEAR_PLACEHOLDER
+
+
+def history_charts(sender):
+    # 在主线程中打开“电量历史”子菜单之前调用；画出来的图没有变化时 rumps 不会再调用
+    global CHART
+    import serialread
+    if CHART is None:
+        CHART = chart.HistoryChart(os.path.join(APP_SUPPORT, 'charts'), serialread.RECENT, ROLLUPS)
+    items = []
+    for title, span in CHART_SPANS:
+        item = sender.get(title)
+        if item is None:
+            item = rumps.MenuItem(title, callback=open_chart)
+            item.span = span
+        item.set_icon(CHART.path(span), dimensions=chart.SIZE)
+        items.append(item)
+    return items
+
+
+def chart_version():
+    return None if CHART is None else CHART.version()
+
+
+def open_chart(sender):
+    # 点击时用“预览”打开原尺寸的图
+    import subprocess
+    subprocess.Popen(['open', CHART.path(sender.span)])
 
 
-            self.update_timer = rumps.Timer(self.update_battery_icon, 1)  # 每隔 1 秒更新一次
-            self.update_timer.start()
-            self.icon_index = 0
-            self.icons = ['battery_icon.png']  # 假设有多个图标文件
+def refresh_ui():
+    # 任意线程都可以调用，界面更新交给主线程合并执行
+    if app is not None:
+        rumps.main_thread.call('refresh', app.refresh)
 
-            self.update_timer = rumps.Timer(self.update_battery_title, 1)  # 每隔 1 秒更新一次
-            self.update_timer.start()
-            self.title_index = 0
-            self.titles = f"{all_percentage}"  # 假设有多个图标文件
 
+def send_alert(alert):
+    # 在读取线程中调用，NotificationQueue 会在主线程中发送
+    title, message = ALERT_TEXT[alert.kind]
+    key = 'charger' if alert.kind in (alerts.CHARGER_CONNECTED, alerts.CHARGER_DISCONNECTED) else 'level'
+    NOTIFICATIONS.push("TNTgo Boom", title, message.format(alert.reading.percentage), key=key)
 
-        def update_battery_icon(self, sender):
+
+def load_snapshot():
+    global all_percentage
+    global latest
+    global icon_key
+    reading, key = SNAPSHOT.load()
+    if reading is not None:
+        latest = reading
+        icon_key = key
+        all_percentage = f"{reading.percentage}%"
+
+
+# 放在模块级别，测试可以在 RUMPS_BACKEND=headless 下直接创建和软重启
+class AwesomeStatusBarApp(rumps.App):
+    def __init__(self):
+        super(AwesomeStatusBarApp, self).__init__("Awesome App", icon='battery_icon.png', title=battery_title())
+        self.icon_index = 0
+        self.icons = ['battery_icon.png']  # 假设有多个图标文件
+        self.shown_icon_key = icon_key
+        self.estimate_item = rumps.MenuItem(estimate_title())
+        self.wear_item = rumps.MenuItem(wear_title())
+        self.history_item = rumps.MenuItem("电量历史")
+        self.history_item.set_provider(history_charts, version=chart_version)
+        self.menu.add(self.estimate_item)
+        self.menu.add(self.wear_item)
+        self.menu.add(self.history_item)
+
+    def refresh(self):
+        # 由读取线程通过 rumps.main_thread 排队，在主线程中执行；连续多次读数只刷新一次
+        # 显示内容没有变化时不重绘
+        if icon_key != self.shown_icon_key:
             self.icon = self.icons[self.icon_index]
-        def update_battery_title(self, sender):
-            self.title = f"{all_percentage}"
+            self.shown_icon_key = icon_key
+        title = battery_title()
+        if title != self.title:
+            self.title = title
+        title = estimate_title()
+        if title != self.estimate_item.title:
+            self.estimate_item.title = title
+        title = wear_title()
+        if title != self.wear_item.title:
+            self.wear_item.title = title
+        if not is_stale() and STARTUP.mark('first_percentage'):
+            print(STARTUP.report())
+
+    def soft_restart(self):
+        # 在当前进程内重建串口读取、图标和菜单，不再启动 reast.app
+        global all_percentage
+        global all_battery
+        global latest
+        global fresh_after
+        global remaining
+        import serialread
+        serialread.stop()
+        all_percentage = None
+        all_battery = None
+        latest = None
+        remaining = None
+        fresh_after = time.time()
+        load_snapshot()
 
+        self.icon_index = 0
+        self.shown_icon_key = None
+        self.refresh()
 
+        self.menu.clear()
+        self.menu.add(self.estimate_item)
+        self.menu.add(self.wear_item)
+        self.menu.add(self.history_item)
+        for register_click in getattr(rumps.clicked, '*buttons', []):
+            register_click(self)
+        if self.quit_button is not None:
+            self.menu.add(self.quit_button)
 
-        @rumps.clicked("加载驱动")
-        def sayhi(self, _):
-            print(subprocess.call('kext/kext-load', shell=True))
-            if subprocess.call:
-                rumps.alert("驱动加载成功!")
-        
-        @rumps.clicked("重启TNTgo Boom")
-        def sayhi(self, _):
-            print(subprocess.call('kext/reast', shell=True))
+        serialread.start()
 
+    @rumps.clicked("加载驱动")
+    def load_driver(self, _):
+        code, output = driver.ensure_loaded(cache_path=DRIVER_CACHE, force=True)
+        if code == 0:
+            rumps.alert("驱动加载成功!")
+        else:
+            rumps.alert("驱动加载失败", output)
+    
+    @rumps.clicked("重启TNTgo Boom")
+    def restart(self, _):
+        try:
+            self.soft_restart()
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            # 软重启失败时重新执行整个程序，先把还没提交的历史写入磁盘
+            HISTORY.commit()
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+def script1_function():
+    global all_percentage
+    global all_battery
+    global app
+    @rumps.events.before_start.register
+    def status_item_shown():
+        STARTUP.mark('status_item')
+        refresh_ui()
 
+    @rumps.events.on_wake.register
+    def mark_stale_on_wake():
+        # 唤醒后先显示睡眠前的电量，读到新数据后再去掉旧数据标记
+        global fresh_after
+        fresh_after = time.time()
+        refresh_ui()
 
+    @rumps.events.before_quit.register
+    def close_history():
+        HISTORY.close()
+        ROLLUPS.close()
+        SESSIONS.close()
+        WEAR.close()
 
     if __name__ == '__main__':
-        AwesomeStatusBarApp().run()
-    battery_percentage = script2_function()
+        with STARTUP.timed('app'):
+            app = AwesomeStatusBarApp()
+        app.run()
 
 
 
 def task():
     import serialread
+    serialread.start()
     global all_percentage
     global all_battery
+    global latest
+    global icon_key
+    global remaining
+    if serialread.latest is None:
+        # 还没有读到新数据时继续显示快照中的电量
+        return
     percentage = serialread.all_percentage
     battery = serialread.all_battery
     all_percentage = percentage
     all_battery = battery
+    latest = serialread.latest
+    remaining = serialread.ESTIMATE
+    # 快照保存平滑后显示的读数，原始读数只用来判断是否为旧数据
+    icon_key = serialread.icon_key(serialread.display, serialread.ALERTS.low)
+    SNAPSHOT.save(serialread.display, icon_key)
+    refresh_ui()
 
 def func():
     task()
@@ -77,13 +287,35 @@ def func():
 def script2_function():
     func()
 
+
+def load_driver():
+    # 驱动已加载且权限正确时跳过 kext-load，执行了 kext-load 时输出和启动耗时一起打印
+    code, output = driver.ensure_loaded(cache_path=DRIVER_CACHE)
+    if output:
+        print('kext-load exited with {0}:\n{1}'.format(code, output.rstrip()))
+
+
+def open_port():
+    import serialread
+    serialread.ALERTS.on_alert = send_alert
+    serialread.HISTORY = HISTORY
+    serialread.open_port()
+
+
+def warm_icon():
+    import serialread
+    serialread.create_battery_icon(100)
+
+
 if __name__ == "__main__":
-    # 创建并启动后台线程
-    t2 = threading.Thread(target=script2_function)
-    t2.start()
+    load_snapshot()
 
-    # 在主线程中运行UI相关的代码
-    script1_function()
+    # 驱动加载、串口打开、图标预热互不依赖，在后台并行执行
+    STARTUP.add('driver', load_driver)
+    STARTUP.add('port', open_port)
+    STARTUP.add('icon', warm_icon)
+    STARTUP.add('reader', script2_function, deps=['port'])
+    STARTUP.start()
 
-    # 等待后台线程结束（可选）
-    t2.join()
+    # 在主线程中运行UI相关的代码，状态栏先显示占位文字
+    script1_function()
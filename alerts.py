@@ -0,0 +1,108 @@
+from collections import namedtuple
+
+import battery
+
+# 电量提醒：低电量、严重低电量、充满、充电器接入 / 断开
+# 每个阈值都有回差和去抖：例如低电量在 <= 20% 时进入，回到 >= 23% 才解除，
+# 而且条件要连续满足 debounce 秒才切换，电量在 19% 和 20% 之间来回跳时不会重复提醒
+
+LOW = 'low'
+CRITICAL = 'critical'
+FULL = 'full'
+CHARGER_CONNECTED = 'charger_connected'
+CHARGER_DISCONNECTED = 'charger_disconnected'
+
+Alert = namedtuple('Alert', ['kind', 'timestamp', 'reading'])
+
+
+class Band(object):
+    """带回差和去抖的阈值。enter < leave 时值小于等于 enter 进入（低电量），enter > leave 时值大于等于 enter 进入（充满）。"""
+
+    def __init__(self, enter, leave, debounce=0.0):
+        self.enter = enter
+        self.leave = leave
+        self.debounce = debounce
+        self.active = False
+        self._since = None  # 开始满足切换条件的时间
+
+    def _beyond(self, value, active):
+        # active 为 False 时判断是否越过进入阈值，为 True 时判断是否越过解除阈值
+        falling = self.enter <= self.leave
+        if active:
+            return value >= self.leave if falling else value <= self.leave
+        return value <= self.enter if falling else value >= self.enter
+
+    def prime(self, value):
+        # 第一个读数不需要去抖，直接确定初始状态
+        self.active = self._beyond(value, False)
+        self._since = None
+        return self.active
+
+    def update(self, value, timestamp):
+        """返回 True（进入）、False（解除）或 None（没有变化）。"""
+        if self._beyond(value, self.active):
+            if self._since is None:
+                self._since = timestamp
+        elif self._beyond(value, not self.active):
+            # 只在回到另一个阈值之外时取消，值在回差区间内来回跳不会重新开始去抖
+            self._since = None
+        if self._since is None or timestamp - self._since < self.debounce:
+            return None
+        self._since = None
+        self.active = not self.active
+        return self.active
+
+
+class AlertEngine(object):
+    def __init__(self, low=20, critical=10, full=100, hysteresis=3, debounce=30.0, charger_debounce=3.0,
+                 on_alert=None):
+        self.levels = [
+            (CRITICAL, Band(critical, critical + hysteresis, debounce)),
+            (LOW, Band(low, low + hysteresis, debounce)),
+            (FULL, Band(full, full - hysteresis, debounce)),
+        ]
+        self.charger = Band(1, 0, charger_debounce)
+        self.on_alert = on_alert
+        self._primed = False
+
+    @property
+    def low(self):
+        # 带回差的低电量状态，图标颜色也用它，避免在 20% 附近来回切换
+        return self.levels[1][1].active
+
+    def update(self, reading):
+        """每个读数 O(1)，返回这次触发的提醒列表。"""
+        alerts = []
+        charging = battery.is_charging(reading)
+        if self._primed:
+            changed = self.charger.update(1 if charging else 0, reading.timestamp)
+        else:
+            # 启动时已经插着充电器不算“接入”
+            self.charger.prime(1 if charging else 0)
+            changed = None
+        if changed is not None:
+            alerts.append(Alert(CHARGER_CONNECTED if changed else CHARGER_DISCONNECTED, reading.timestamp, reading))
+        for kind, band in self.levels:
+            if self._primed:
+                entered = band.update(reading.percentage, reading.timestamp)
+            else:
+                # 启动时电量已经很低则立即提醒，不等待去抖
+                entered = band.prime(reading.percentage)
+            # 充电时不再提醒低电量，同时进入严重低电量时只提醒一次，但状态照常更新
+            if not entered or (kind != FULL and self.charger.active):
+                continue
+            if kind == LOW and alerts and alerts[-1].kind == CRITICAL:
+                continue
+            alerts.append(Alert(kind, reading.timestamp, reading))
+        self._primed = True
+        if self.on_alert is not None:
+            for alert in alerts:
+                self.on_alert(alert)
+        return alerts
+
+    def replay(self, readings):
+        """按顺序处理记录下来的读数，返回全部提醒，用于检查阈值设置。"""
+        alerts = []
+        for reading in readings:
+            alerts.extend(self.update(reading))
+        return alerts
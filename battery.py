@@ -0,0 +1,27 @@
+import time
+from collections import namedtuple
+
+# 串口返回的电池信息，例如：+BATCG=0,85,3950,-120,25,0
+# fields 保存 +BATCG 的全部 6 个字段，percentage 为第 2 个字段，charge 为第 4 个字段（大于 0 表示正在充电）
+BatteryReading = namedtuple('BatteryReading', ['timestamp', 'percentage', 'charge', 'fields'])
+
+BATCG_PATTERN = r'\+BATCG=' + ','.join([r'([-+]?\d+)'] * 6)
+_batcg = None
+
+
+def parse_line(line, timestamp=None):
+    """解析一行串口数据，不是 +BATCG 电量信息时返回 None。"""
+    global _batcg
+    if _batcg is None:
+        # 第一次解析时才导入 re，缩短启动时的导入时间
+        import re
+        _batcg = re.compile(BATCG_PATTERN)
+    match = _batcg.search(line)
+    if match is None:
+        return None
+    fields = tuple(int(value) for value in match.groups())
+    return BatteryReading(time.time() if timestamp is None else timestamp, fields[1], fields[3], fields)
+
+
+def is_charging(reading):
+    return reading.charge > 0
@@ -0,0 +1,765 @@
+"""性能基准测试。
+
+用法：python bench.py [名称 ...]，不带参数时运行全部基准。
+不需要 macOS、串口或 TNTgo 设备，耗时的外部步骤用 sleep 模拟。
+没有 PyObjC 时 rumps 使用 headless 后端（RUMPS_BACKEND=headless，虚拟时钟）。
+"""
+
+import importlib.util
+import os
+import sys
+import time
+
+if importlib.util.find_spec('AppKit') is None:
+    os.environ.setdefault('RUMPS_BACKEND', 'headless')
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__[len('bench_'):]] = func
+    return func
+
+
+def timeit(func, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+# 启动基准中代替驱动和串口的桩的耗时（秒）：kextstat 探测和 at+adb 握手，其余步骤都是真实执行的
+STARTUP_STUBS = {'driver': 0.30, 'port': 0.12}
+STARTUP_LINE = '+BATCG=0,85,3950,-120,25,0\r\n'
+# 在子进程中运行真正的 TNTgo Boom.py（headless 后端、真实时钟），驱动和串口换成桩，
+# 第一次显示正确电量后退出，把 STARTUP 的计时以 JSON 输出到最后一行
+_STARTUP_SCRIPT = r"""
+import json, os, runpy, sys, time
+import driver, serialread, startup
+from rumps import _headless
+
+stubs = json.loads(sys.argv[2])
+
+
+def ensure_loaded(**options):
+    time.sleep(stubs['driver'])
+    return 0, None
+
+
+class FakeSerial(object):
+    def readline(self):
+        return sys.argv[3].encode()
+
+    def close(self):
+        pass
+
+
+def open_port():
+    with serialread._lock:
+        if serialread.ser is None:
+            time.sleep(stubs['port'])
+            serialread.ser = FakeSerial()
+
+
+mark = startup.Startup.mark
+
+
+def mark_and_stop(self, name):
+    if name == 'first_percentage':
+        _headless.AppHelper.stopEventLoop()
+    return mark(self, name)
+
+
+driver.ensure_loaded = ensure_loaded
+serialread.open_port = open_port
+startup.Startup.mark = mark_and_stop
+app = runpy.run_path(sys.argv[1], run_name='__main__')
+# 驱动等步骤可能比第一次显示电量晚结束，等它们结束再输出
+app['STARTUP'].wait(timeout=30)
+sys.stdout.write('\n' + json.dumps({'timings': app['STARTUP'].timings, 'marks': app['STARTUP'].marks}) + '\n')
+sys.stdout.flush()
+# 读取线程用的是非守护的 threading.Timer，直接退出
+os._exit(0)
+"""
+
+
+@benchmark
+def bench_startup(runs=3):
+    import json
+    import shutil
+    import subprocess
+    import tempfile
+    root = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as home:
+            env = dict(os.environ, RUMPS_BACKEND='headless', RUMPS_HEADLESS_CLOCK='real', RUMPS_HEADLESS_RUN_FOR='30',
+                       RUMPS_HEADLESS_HOME=home)
+            # 每次都在新的工作目录中运行，不覆盖仓库中的 battery_icon.png
+            shutil.copy(os.path.join(root, 'battery_icon.png'), home)
+            env['PYTHONPATH'] = os.pathsep.join([root] + [p for p in [env.get('PYTHONPATH')] if p])
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, '-c', _STARTUP_SCRIPT, os.path.join(root, 'TNTgo Boom.py'),
+                                   json.dumps(STARTUP_STUBS), STARTUP_LINE],
+                                  cwd=home, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                  timeout=60)
+            wall = time.perf_counter() - start
+        if proc.returncode != 0:
+            return {'failed': proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode}
+        data = json.loads(proc.stdout.strip().splitlines()[-1])
+        if 'first_percentage' not in data['marks']:
+            return {'failed': 'no first_percentage mark'}
+        if best is None or data['marks']['first_percentage'] < best[0]['marks']['first_percentage']:
+            best = (data, wall)
+    data, wall = best
+    result = {'process_wall': wall}
+    for name, (start, end) in sorted(data['timings'].items()):
+        result['{0}_seconds'.format(name)] = end - start
+    for name, at in sorted(data['marks'].items()):
+        result['time_to_{0}'.format(name)] = at
+    return result
+
+
+# 启动时在主线程导入的模块，以及它们的导入时间预算（微秒，-X importtime 的 cumulative 之和）
+STARTUP_MODULES = ['driver', 'snapshot', 'startup', 'alerts', 'smoothing', 'ringbuffer', 'estimate', 'history', 'rollup',
+                   'sessions', 'wear', 'chart', 'serialread']
+IMPORT_BUDGET_US = 30000
+# 这些模块只能在第一次使用时导入，不应出现在启动导入中
+DEFERRED_MODULES = ['PIL', 'serial', 'pickle', 'datetime', 'plistlib', 'subprocess', 'inspect', 'numpy']
+
+
+def import_times(modules, runs=5):
+    import os
+    import subprocess
+    best = {}
+    loaded = set()
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              stderr=subprocess.PIPE, text=True, check=True)
+        for line in proc.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            _, cumulative, name = line.split('|')
+            if not cumulative.strip().isdigit():
+                continue
+            loaded.add(name.strip())
+            if name.strip() in modules and not name[1:].startswith(' '):
+                us = int(cumulative)
+                best[name.strip()] = min(best.get(name.strip(), us), us)
+    return best, loaded
+
+
+@benchmark
+def bench_imports():
+    modules = list(STARTUP_MODULES)
+    if importlib.util.find_spec('AppKit') is not None:
+        modules.insert(0, 'rumps')
+    best, loaded = import_times(modules)
+    total = sum(us for name, us in best.items() if name != 'rumps')
+    result = dict(('{0}_us'.format(name), us) for name, us in best.items())
+    result.update({
+        'total_us': total,
+        'budget_us': IMPORT_BUDGET_US,
+        'within_budget': total <= IMPORT_BUDGET_US,
+        'eager_deferred_modules': ','.join(sorted(set(DEFERRED_MODULES) & loaded)) or '-',
+    })
+    return result
+
+
+@benchmark
+def bench_dispatch():
+    # rumps 回调分发：缓存查找 vs. 原来每次 inspect.getmembers 反射整个 App 实例
+    try:
+        from rumps import _internal
+        from rumps import rumps as rumps_module
+    except ImportError as e:
+        return {'skipped': str(e)}
+    import inspect
+
+    class BenchApp(rumps_module.App):
+        def tick(self, sender):
+            pass
+
+    app = object.__new__(BenchApp)
+    app.__dict__.update(_name='bench', _title=None, _icon=None, _icon_nsimage=None, _template=None,
+                        _menu=None, _quit_button=None, _application_support=None)
+
+    def reflect():
+        for name, method in inspect.getmembers(app, predicate=inspect.ismethod):
+            if method.__func__ is BenchApp.tick:
+                return method(None)
+
+    previous = getattr(rumps_module.App, '*app_instance', None)
+    setattr(rumps_module.App, '*app_instance', app)
+    try:
+        _internal.build_method_cache(app)
+        cached = timeit(lambda: _internal.call_as_function_or_method(BenchApp.tick, None), 20000)
+        reflected = timeit(reflect, 500)
+    finally:
+        if previous is None:
+            delattr(rumps_module.App, '*app_instance')
+        else:
+            setattr(rumps_module.App, '*app_instance', previous)
+        _internal.invalidate_method_cache()
+    return {'cached_per_call': cached, 'reflection_per_call': reflected, 'speedup': reflected / cached}
+
+
+MENU_ITEMS = 2000
+
+
+@benchmark
+def bench_menu():
+    # 通过 Menu.update 建立、重新排序并删除包含几千个菜单项的菜单
+    try:
+        import rumps
+    except ImportError as e:
+        return {'skipped': str(e)}
+    titles = ['item {0}'.format(i) for i in range(MENU_ITEMS)]
+
+    start = time.perf_counter()
+    menu = rumps.MenuItem('bench')
+    menu.update(titles)
+    built = time.perf_counter()
+    for i in range(2, MENU_ITEMS, 2):
+        menu.insert_before(titles[0], menu[titles[i]])
+    for i in range(1, MENU_ITEMS - 1, 2):
+        menu.insert_after(titles[-1], menu[titles[i]])
+    reordered = time.perf_counter()
+    for title in titles:
+        del menu[title]
+    torn_down = time.perf_counter()
+    return {
+        'items': MENU_ITEMS,
+        'build_per_item': (built - start) / MENU_ITEMS,
+        'reorder_per_item': (reordered - built) / MENU_ITEMS,
+        'delete_per_item': (torn_down - reordered) / MENU_ITEMS,
+    }
+
+
+ALERT_READINGS = 100000
+
+
+@benchmark
+def bench_alerts():
+    # 在 19% 和 20% 之间来回跳的放电记录：回差和去抖使每个阈值只提醒一次
+    import alerts
+    import battery
+    readings = [battery.BatteryReading(i, max(5, 30 - i // 2000) + i % 2, -100, ()) for i in range(ALERT_READINGS)]
+    engine = alerts.AlertEngine()
+    start = time.perf_counter()
+    fired = engine.replay(readings)
+    elapsed = time.perf_counter() - start
+    naive = sum(1 for a, b in zip(readings, readings[1:]) if (a.percentage <= 20) != (b.percentage <= 20))
+    return {
+        'readings': ALERT_READINGS,
+        'per_reading': elapsed / ALERT_READINGS,
+        'alerts': ','.join(alert.kind for alert in fired),
+        'threshold_flips_without_hysteresis': naive,
+    }
+
+
+SMOOTHING_READINGS = 36000
+
+
+@benchmark
+def bench_smoothing():
+    # 一小时（每秒一个读数）电量和电流 ±1 跳动的放电记录：比较各滤波器需要的界面更新次数
+    import random
+    import battery
+    import smoothing
+    rng = random.Random(0)
+    readings = [battery.BatteryReading(i, 80 - i // 600 + rng.choice((-1, 0, 1)), rng.choice((-1, 1)), ())
+                for i in range(SMOOTHING_READINGS)]
+    result = {}
+    for kind in sorted(smoothing.FILTERS):
+        smoother = smoothing.Smoother(kind)
+        start = time.perf_counter()
+        for reading in readings:
+            smoother.update(reading)
+        metrics = smoother.metrics()
+        result[kind + '_per_reading'] = (time.perf_counter() - start) / SMOOTHING_READINGS
+        result[kind + '_updates'] = metrics['updates']
+        result['raw_updates'] = metrics['raw_changes']
+    return result
+
+
+@benchmark
+def bench_ringbuffer():
+    # 写满 24 小时的读数，然后读取最近一小时的窗口（零复制视图）
+    import battery
+    import ringbuffer
+    buffer = ringbuffer.RingBuffer()
+    readings = [battery.BatteryReading(float(i), 80, -120, (0, 80, 3950, -120, 25, 0))
+                for i in range(ringbuffer.CAPACITY + 1000)]
+    start = time.perf_counter()
+    for reading in readings:
+        buffer.append(reading)
+    appended = time.perf_counter()
+    window_time = timeit(lambda: buffer.last(3600), 1000)
+    since_time = timeit(lambda: buffer.since(ringbuffer.CAPACITY - 2600.0), 1000)
+    return {
+        'numpy': buffer.use_numpy,
+        'append_per_reading': (appended - start) / len(readings),
+        'last_hour_window': window_time,
+        'since_window': since_time,
+        'megabytes': buffer.nbytes / 1e6,
+    }
+
+
+HISTORY_DAYS = 3
+
+
+def history_trace(days, jitter):
+    # 每秒一个读数：电量每 10 分钟左右变化 1%，jitter 为时间戳偏移 1 秒的比例
+    import random
+    rng = random.Random(1)
+    t = 1700006400
+    percentage = 100
+    samples = []
+    for i in range(days * 86400):
+        if i % 600 == 599:
+            percentage = max(percentage - 1, 5)
+        samples.append((t + i + (rng.random() < jitter), (0, percentage, 3950, -120, 25, 0)))
+    return samples
+
+
+@benchmark
+def bench_history():
+    # 每 5 秒提交一次，按天分段；过去的分段压缩后换算成 30 天的大小
+    import shutil
+    import tempfile
+    import battery
+    import history
+    result = {}
+    directory = tempfile.mkdtemp()
+    try:
+        for name, jitter in (('flat', 0.0), ('jitter', 0.02)):
+            store = history.HistoryStore(os.path.join(directory, name), commit_interval=3600)
+            samples = history_trace(HISTORY_DAYS, jitter)
+            readings = [battery.BatteryReading(t, f[1], f[3], f) for t, f in samples]
+            start = time.perf_counter()
+            for i, reading in enumerate(readings):
+                store.append(reading)
+                if i % 5 == 4:
+                    store.commit()
+            elapsed = time.perf_counter() - start
+            store.close()
+            store.compact_sealed()
+            # 写入线程每次启动都会检查过去的分段，已经压缩过的不应再解码
+            start = time.perf_counter()
+            store.compact_sealed()
+            recheck = time.perf_counter() - start
+            size = sum(os.path.getsize(os.path.join(store.directory, s)) for s in store.segments())
+            start = time.perf_counter()
+            count = sum(1 for _ in store.read())
+            result[name] = {
+                'compacted_recheck_per_segment': recheck / len(store.segments()),
+                'append_and_commit_per_reading': elapsed / len(readings),
+                'bytes_per_reading': size / len(readings),
+                'month_kilobytes': size / HISTORY_DAYS * 30 / 1e3,
+                'read_per_reading': (time.perf_counter() - start) / count,
+                'roundtrip': count == len(readings),
+            }
+    finally:
+        shutil.rmtree(directory)
+    return result
+
+
+@benchmark
+def bench_rollup():
+    # 增量汇总 3 天的读数，然后按点数预算查询整个范围、查询 5 分钟的原始读数、导出分钟汇总
+    import io
+    import shutil
+    import tempfile
+    import battery
+    import history
+    import rollup
+    directory = tempfile.mkdtemp()
+    try:
+        samples = history_trace(HISTORY_DAYS, 0.0)
+        store = history.HistoryStore(directory, commit_interval=3600)
+        for t, fields in samples:
+            store.append(battery.BatteryReading(t, fields[1], fields[3], fields))
+        store.commit()
+        rollups = rollup.RollupStore(directory, store)
+        start = time.perf_counter()
+        for i in range(0, len(samples), 5):
+            rollups.add(samples[i:i + 5])
+        added = time.perf_counter() - start
+        first, last = samples[0][0], samples[-1][0] + 1
+        query_time = timeit(lambda: rollups.query(first, last, rollup.POINTS), 100)
+        raw_time = timeit(lambda: rollups.query(last - 300, last, rollup.POINTS), 100)
+        out = io.StringIO()
+        start = time.perf_counter()
+        rows = rollups.export(out, first, last, rollup.MINUTE)
+        export_time = time.perf_counter() - start
+        rollups.close()
+        store.close()
+    finally:
+        shutil.rmtree(directory)
+    return {
+        'add_per_reading': added / len(samples),
+        'query_days': query_time,
+        'query_raw_5_minutes': raw_time,
+        'export_minute_rows_per_second': rows / export_time,
+    }
+
+
+def estimate_trace(seconds, rate, start, charge, bounce=0.0):
+    # 以 rate %/秒 匀速变化的读数，电量取整，约 2% 的读数有 ±1 的跳动；bounce 为充电字段单独跳成相反符号的比例
+    import random
+    import battery
+    rng = random.Random(2)
+    readings = []
+    for i in range(seconds):
+        exact = start + rate * i
+        percentage = int(exact) + (rng.random() < 0.02) * rng.choice((-1, 1))
+        value = -charge if rng.random() < bounce else charge
+        readings.append(battery.BatteryReading(float(i), percentage, value, (0, percentage, 3950, value, 25, 0)))
+    return readings
+
+
+@benchmark
+def bench_estimate():
+    # 放电 100% -> 20%（每 6 分钟 1%），再充电 20% -> 100%（每 90 秒 1%）；和真实剩余时间比较
+    import estimate
+    discharge = 1 / 360.0
+    charge = 1 / 90.0
+    traces = [
+        ('discharge', estimate_trace(80 * 360, -discharge, 100.0, -120), lambda i: (100 - discharge * i) / discharge),
+        ('charge', estimate_trace(80 * 90, charge, 20.0, 500), lambda i: (80 - charge * i) / charge),
+        # 充电字段每分钟左右跳动一次（单个读数），估算不应因此一直重新开始
+        ('bouncing', estimate_trace(80 * 360, -discharge, 100.0, -120, bounce=0.02),
+         lambda i: (100 - discharge * i) / discharge),
+    ]
+    result = {}
+    for name, readings, truth in traces:
+        estimator = estimate.Estimator()
+        errors = []
+        start = time.perf_counter()
+        for i, reading in enumerate(readings):
+            value = estimator.update(reading)
+            if value is not None and truth(i) > 0:
+                errors.append(abs(value.seconds - truth(i)) / truth(i))
+        elapsed = time.perf_counter() - start
+        errors.sort()
+        result[name] = {
+            'per_update': elapsed / len(readings),
+            'coverage': len(errors) / float(len(readings)),
+            'median_error': errors[len(errors) // 2],
+            'p90_error': errors[int(len(errors) * 0.9)],
+            'resets': estimator.resets,
+        }
+    return result
+
+
+@benchmark
+def bench_sessions():
+    # 放电 8 小时、充电 2 小时交替 30 天，流式切分成 59 个过程（最后一个没有结束）
+    import random
+    import sessions
+    rng = random.Random(3)
+    tracker = sessions.SessionTracker()
+    samples = []
+    percentage = 100.0
+    t = 1700006400
+    for cycle in range(30):
+        for seconds, rate, charge in ((8 * 3600, -1 / 360.0, -120), (2 * 3600, 1 / 90.0, 500)):
+            for _ in range(seconds):
+                percentage = min(max(percentage + rate, 0.0), 100.0)
+                # 充电电流偶尔跳到另一侧，由去抖过滤
+                samples.append((t, int(percentage), (charge > 0) != (rng.random() < 0.001)))
+                t += 1
+    closed = []
+    start = time.perf_counter()
+    for sample in samples:
+        session = tracker.update(*sample)
+        if session is not None and session.count > 1:
+            closed.append(session)
+    elapsed = time.perf_counter() - start
+    summary = sessions.summary(closed)
+    return {
+        'per_reading': elapsed / len(samples),
+        'sessions': len(closed),
+        'expected_sessions': 59,
+        'charge_hours_per_100': summary[sessions.CHARGE]['hours_per_100'],
+    }
+
+
+WEAR_DAYS = 90
+WEAR_BUDGET = 1.0
+
+
+@benchmark
+def bench_wear():
+    # 90 天 1 Hz 的历史（放电 8 小时、充电 2 小时，带 ±1 跳动）按天写成压缩过的分段，计时 wear.analyze 的批量计算
+    # （读取历史、提取拐点、雨流计数、每个充电过程的容量），以及逐个读数的增量计数
+    import random
+    import shutil
+    import tempfile
+    import history
+    import sessions
+    import wear
+    rng = random.Random(4)
+    directory = tempfile.mkdtemp()
+    try:
+        t = 1700006400
+        percentage = 100.0
+        fields = {}
+        day, samples, charges, first_day = None, [], [], None
+        for _ in range(WEAR_DAYS * 24 // 10):
+            for seconds, rate, current in ((8 * 3600, -1 / 360.0, -120), (2 * 3600, 1 / 90.0, 500)):
+                begin = t
+                first = int(percentage)
+                for _ in range(seconds):
+                    percentage = min(max(percentage + rate, 0.0), 100.0)
+                    value = int(percentage) + (rng.random() < 0.02) * rng.choice((-1, 1))
+                    key = (value, current)
+                    f = fields.get(key)
+                    if f is None:
+                        f = fields[key] = (0, value, 3950, current, 25, 0)
+                    name = history.segment_name(t)
+                    if name != day:
+                        if samples:
+                            first_day = first_day or samples
+                            with open(os.path.join(directory, day), 'wb') as out:
+                                out.write(history.encode_segment(samples))
+                        day, samples = name, []
+                    samples.append((t, f))
+                    t += 1
+                if current > 0:
+                    charges.append(sessions.Session(sessions.CHARGE, begin, t - 1, first, int(percentage),
+                                                    (int(percentage) - first) * 3600.0 / seconds, 0.0, seconds))
+        with open(os.path.join(directory, day), 'wb') as out:
+            out.write(history.encode_segment(samples))
+        with open(os.path.join(directory, 'sessions.bin'), 'wb') as out:
+            for session in charges:
+                out.write(sessions._record(session))
+        store = history.HistoryStore(directory)
+        start = time.perf_counter()
+        result = wear.analyze(store, sessions.SessionStore(directory, store, readonly=True))
+        batch = time.perf_counter() - start
+    finally:
+        shutil.rmtree(directory)
+    incremental = wear.RainflowCounter()
+    sample = [f[1] for _, f in first_day[:10 * 3600]]
+    start = time.perf_counter()
+    for value in sample:
+        incremental.update(value)
+    per_update_us = (time.perf_counter() - start) / len(sample) * 1e6
+    return {
+        'numpy': bool(wear.load_numpy()),
+        'readings': result['readings'],
+        'batch_seconds': batch,
+        'per_update_us': per_update_us,
+        'cycles': result['cycles'],
+        'expected_cycles': WEAR_DAYS * 24 // 10 * 0.8,
+        'capacity_points': result['capacity_points'],
+        'within_budget': batch < WEAR_BUDGET,
+    }
+
+
+@benchmark
+def bench_chart():
+    # 1 小时（RingBuffer）、1 天和 1 周（分钟汇总）的历史图：首次绘制和数据没有变化时的缓存命中
+    import shutil
+    import tempfile
+    import battery
+    import chart
+    import ringbuffer
+    import rollup
+    try:
+        import PIL
+    except ImportError as e:
+        return {'skipped': str(e)}
+    directory = tempfile.mkdtemp()
+    try:
+        samples = history_trace(7, 0.02)
+        now = samples[-1][0] + 1
+        recent = ringbuffer.RingBuffer()
+        for t, fields in samples[-ringbuffer.CAPACITY:]:
+            recent.append(battery.BatteryReading(t, fields[1], fields[3], fields))
+        rollups = rollup.RollupStore(directory)
+        for i in range(0, len(samples), 3600):
+            rollups.add(samples[i:i + 3600])
+        history_chart = chart.HistoryChart(directory, recent, rollups)
+        result = {}
+        for name, span in chart.SPANS:
+            start = time.perf_counter()
+            history_chart.path(span, now)
+            result[name + '_render'] = time.perf_counter() - start
+            result[name + '_cached'] = timeit(lambda: history_chart.path(span, now), 1000)
+        result['renders'] = history_chart.renders
+        # 每秒一个新读数、每秒打开一次菜单：只有曲线移动了像素时才重新绘制
+        renders = history_chart.renders
+        start = time.perf_counter()
+        for i in range(60):
+            t, fields = now + i, samples[-1][1]
+            recent.append(battery.BatteryReading(t, fields[1], fields[3], fields))
+            history_chart.path(chart.HOUR, t + 0.5)
+        result['hour_per_reading'] = (time.perf_counter() - start) / 60
+        result['hour_renders_per_minute'] = history_chart.renders - renders
+        rollups.close()
+    finally:
+        shutil.rmtree(directory)
+    return result
+
+
+INGEST_FILES = 8
+INGEST_LINES = 50000
+
+
+@benchmark
+def bench_ingest():
+    # 4 台设备各 2 个带时间戳的串口记录和 2 天的 .bhist 历史，单进程和进程池解析的吞吐量
+    import shutil
+    import tempfile
+    import history
+    import ingest
+    try:
+        import numpy
+    except ImportError as e:
+        return {'skipped': str(e)}
+    directory = tempfile.mkdtemp()
+    try:
+        readings = 0
+        for n in range(INGEST_FILES):
+            device = os.path.join(directory, 'mac-{0:02d}'.format(n // 2))
+            os.makedirs(os.path.join(device, 'history'), exist_ok=True)
+            with open(os.path.join(device, 'capture-{0}.log'.format(n)), 'w') as f:
+                start = 1700000000 + n % 2 * INGEST_LINES
+                for i in range(INGEST_LINES):
+                    f.write('{0} +BATCG=0,{1},3950,-120,25,0\nOK\n'.format(start + i, 100 - i // 600))
+            samples = [(t, (0, 100 - i // 600 % 100, 3950, -120, 25, 0))
+                       for i, t in enumerate(range(1700006400 + n % 2 * 86400, 1700006400 + (n % 2 + 1) * 86400))]
+            with open(os.path.join(device, 'history', history.segment_name(samples[0][0])), 'wb') as f:
+                f.write(history.encode_segment(samples))
+            readings += INGEST_LINES + len(samples)
+        result = {}
+        for name, jobs in (('serial', 1), ('pool', None)):
+            start = time.perf_counter()
+            columns = ingest.ingest([directory], jobs)
+            result[name + '_readings_per_second'] = readings / (time.perf_counter() - start)
+        result['devices'] = len(columns['device'])
+        result['readings'] = sum(columns['readings'])
+        result['drain_p50'] = columns['drain_p50'][0]
+    finally:
+        shutil.rmtree(directory)
+    return result
+
+
+TIMER_COUNT = 20
+TIMER_SECONDS = 600
+
+
+@benchmark
+def bench_timers():
+    # headless 后端的虚拟时钟：20 个 0.1 秒的定时器运行 10 分钟，测量每次分发的耗时
+    try:
+        import rumps
+        from rumps import _headless
+    except ImportError as e:
+        return {'skipped': str(e)}
+    fired = []
+    timers = [rumps.Timer(fired.append, 0.1) for _ in range(TIMER_COUNT)]
+    for t in timers:
+        t.start()
+    start = time.perf_counter()
+    _headless.advance(TIMER_SECONDS)
+    elapsed = time.perf_counter() - start
+    for t in timers:
+        t.stop()
+    return {
+        'fires': len(fired),
+        'per_fire': elapsed / len(fired),
+        'virtual_seconds': TIMER_SECONDS,
+    }
+
+
+EVENT_HANDLER_DELAY = 0.05
+
+
+@benchmark
+def bench_events():
+    # 慢的 on_wake 回调（例如重连串口）放到后台线程池后，emit 不再阻塞主线程
+    try:
+        from rumps import events
+    except ImportError as e:
+        return {'skipped': str(e)}
+    order = []
+    done = []
+    emitter = events.EventEmitter('bench')
+    emitter.register(lambda: order.append('low'), priority=-1)
+    emitter.register(lambda: order.append('high'), priority=10)
+    emitter.register(lambda: (time.sleep(EVENT_HANDLER_DELAY), done.append(True)), background=True, timeout=1)
+
+    start = time.perf_counter()
+    emitter.emit()
+    emitted = time.perf_counter()
+    while not done:
+        time.sleep(0.001)
+    metrics = emitter.metrics()
+    return {
+        'emit_time': emitted - start,
+        'handler_delay': EVENT_HANDLER_DELAY,
+        'ordered': order == ['high', 'low'],
+        'latency_max': metrics['latency_max'],
+        'duration_max': metrics['duration_max'],
+    }
+
+
+UI_UPDATES = 1000
+
+
+@benchmark
+def bench_ui_updates():
+    # 后台线程连续写入标题：合并后主线程只执行一次赋值
+    try:
+        from rumps import dispatch
+    except ImportError as e:
+        return {'skipped': str(e)}
+    import threading
+    queue = dispatch.UpdateQueue()
+    flushes = []
+    dispatch.AppHelper, real_helper = type('AppHelper', (), {'callAfter': staticmethod(flushes.append)}), dispatch.AppHelper
+
+    class Target(object):
+        title = None
+
+    target = Target()
+    try:
+        start = time.perf_counter()
+        writer = threading.Thread(target=lambda: [queue.set(target, 'title', i) for i in range(UI_UPDATES)])
+        writer.start()
+        writer.join()
+        queued = time.perf_counter()
+        applied = sum(flush() for flush in flushes)
+    finally:
+        dispatch.AppHelper = real_helper
+    return {
+        'updates': UI_UPDATES,
+        'queue_per_update': (queued - start) / UI_UPDATES,
+        'applied': applied,
+        'coalesced': queue.coalesced,
+        'last_value_applied': target.title == UI_UPDATES - 1,
+    }
+
+
+def main(argv):
+    names = argv or sorted(BENCHMARKS)
+    failed = []
+    for name in names:
+        result = BENCHMARKS[name]()
+        for key, value in result.items():
+            if isinstance(value, float):
+                value = '{0:.6f}'.format(value)
+            print('{0}.{1}: {2}'.format(name, key, value))
+        if result.get('within_budget') is False:
+            failed.append(name)
+    if failed:
+        sys.exit('over budget: ' + ', '.join(failed))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
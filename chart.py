@@ -0,0 +1,189 @@
+import bisect
+import os
+import time
+
+import rollup
+
+# 电量历史图：最近 1 小时来自内存中的 RingBuffer，1 天和 1 周来自分钟汇总，
+# 用 Largest-Triangle-Three-Buckets 降采样到像素宽度，再用和电池图标相同的 PIL 绘制。
+# 图片按换算到像素后的折线缓存，新读数没有让曲线移动一个像素时直接返回上次的文件
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+SPANS = [('hour', HOUR), ('day', DAY), ('week', WEEK)]
+# 菜单中的显示尺寸（点），按 SCALE 倍像素绘制，Retina 屏幕上也清晰
+SIZE = (240, 60)
+SCALE = 2
+# 从汇总中读取的点数上限，超出时使用更粗的分辨率
+MAX_SOURCE_POINTS = 20000
+LINE_COLOR = (70, 175, 168)
+FRAME_COLOR = (80, 80, 80)
+GUIDE_COLOR = (80, 80, 80, 60)
+LOW_COLOR = (255, 0, 0, 40)
+
+
+def lttb(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets：保留形状地把 (xs, ys) 降采样到 threshold 个点。"""
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(zip(xs, ys))
+    every = (n - 2) / float(threshold - 2)
+    points = [(xs[0], ys[0])]
+    a = 0
+    for i in range(threshold - 2):
+        # 下一个桶的平均点
+        start = int((i + 1) * every) + 1
+        end = min(int((i + 2) * every) + 1, n)
+        count = end - start
+        avg_x = sum(xs[start:end]) / count
+        avg_y = sum(ys[start:end]) / count
+        # 当前桶中和上一个选中点、下一个桶平均点组成的三角形面积最大的点
+        ax, ay = xs[a], ys[a]
+        best = best_area = -1
+        for j in range(int(i * every) + 1, start):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        points.append((xs[best], ys[best]))
+        a = best
+    points.append((xs[n - 1], ys[n - 1]))
+    return points
+
+
+def layout(points, start, span, size=SIZE, scale=SCALE):
+    """把 [(时间, 电量), ...] 换算成像素坐标的折线：((x, y), ...) 的元组，中断处分成多条。
+    结果只取决于最终画出来的像素，可以直接用作图片缓存的键。"""
+    width, height = size[0] * scale, size[1] * scale
+    inner = height - 2 * scale
+    # 相邻两点间隔超过 1/20 的时间范围（睡眠、断开）时断开曲线
+    gap = span / 20.0
+    lines = []
+    line = []
+    last = None
+    for t, percentage in points:
+        if last is not None and t - last > gap:
+            lines.append(tuple(line))
+            line = []
+        point = (int(round((t - start) * (width - 1) / float(span))),
+                 int(round(scale + inner * (100 - percentage) / 100.0)))
+        last = t
+        # 同一个像素只保留一次，水平线段中间的点不改变画出来的线
+        if line and point == line[-1]:
+            continue
+        if len(line) > 1 and point[1] == line[-1][1] == line[-2][1]:
+            line[-1] = point
+            continue
+        line.append(point)
+    if line:
+        lines.append(tuple(line))
+    return tuple(lines)
+
+
+def render(points, start, span, size=SIZE, scale=SCALE):
+    """把 [(时间, 电量), ...] 画成 RGBA 图片，横轴为 [start, start + span]，纵轴为 0% ~ 100%。"""
+    return draw(layout(points, start, span, size, scale), size, scale)
+
+
+def draw(lines, size=SIZE, scale=SCALE):
+    """画出 layout() 返回的折线。"""
+    # PIL 在第一次绘制时才导入
+    from PIL import Image, ImageDraw
+    width, height = size[0] * scale, size[1] * scale
+    image = Image.new("RGBA", (width, height), (255, 255, 255, 0))
+    canvas = ImageDraw.Draw(image)
+    inner = height - 2 * scale
+
+    def y(percentage):
+        return scale + inner * (100 - percentage) / 100.0
+
+    canvas.rectangle([(0, y(20)), (width - 1, height - scale)], fill=LOW_COLOR)
+    for level in (50, 80):
+        canvas.line([(0, y(level)), (width - 1, y(level))], fill=GUIDE_COLOR, width=1)
+    for line in lines:
+        _polyline(canvas, list(line), scale)
+    canvas.rounded_rectangle([(0, 0), (width - 1, height - 1)], outline=FRAME_COLOR, width=scale, radius=2 * scale)
+    return image
+
+
+def _polyline(draw, line, scale):
+    if len(line) > 1:
+        draw.line(line, fill=LINE_COLOR, width=scale, joint='curve')
+    elif line:
+        x, y = line[0]
+        draw.ellipse([(x - scale, y - scale), (x + scale, y + scale)], fill=LINE_COLOR)
+
+
+def _column(values):
+    # RingBuffer 的列可能是 numpy 数组或 memoryview
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+class HistoryChart(object):
+    def __init__(self, directory, recent, rollups, size=SIZE, scale=SCALE):
+        self.directory = directory
+        self.recent = recent
+        self.rollups = rollups
+        self.size = size
+        self.scale = scale
+        self._layouts = {}  # span -> ((数据版本, 右边界), 折线)
+        self._cache = {}  # span -> (折线, 图片路径)
+        self.renders = 0
+
+    def data_version(self, span):
+        """1 小时的图只取决于 RingBuffer，更长的图只取决于汇总。"""
+        return self.recent.version if span <= HOUR else self.rollups.version
+
+    def layout(self, span, now=None):
+        """最近 span 秒的图在像素坐标下的折线。
+        右边界对齐到像素列，还没有结束的一列不画（1 小时的图中为 7.5 秒），
+        同一列中新来的读数不改变降采样的输入；数据版本和像素列都没有变化时不重新降采样。"""
+        if now is None:
+            now = time.time()
+        step = float(span) / (self.size[0] * self.scale - 1)
+        now = now // step * step
+        key = (self.data_version(span), now)
+        cached = self._layouts.get(span)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        xs, ys = self.series(span, now)
+        lines = layout(lttb(xs, ys, self.size[0] * self.scale), now - span, span, self.size, self.scale)
+        self._layouts[span] = (key, lines)
+        return lines
+
+    def version(self, span=None, now=None):
+        """图片内容的版本：每秒一个的新读数只有移动了像素时才改变版本；span 为 None 时返回全部 SPANS 的。"""
+        if span is None:
+            return tuple(self.layout(span, now) for _, span in SPANS)
+        return self.layout(span, now)
+
+    def series(self, span, now):
+        """[now - span, now) 之间的 (时间列, 电量列)。"""
+        start = now - span
+        if span <= HOUR:
+            window = self.recent.since(start)
+            xs = _column(window.timestamp)
+            end = bisect.bisect_left(xs, now)
+            return xs[:end], _column(window.percentage)[:end]
+        resolution = max(self.rollups.select(start, now, MAX_SOURCE_POINTS), rollup.MINUTE)
+        xs, ys = [], []
+        for bucket in self.rollups.buckets(start, now, resolution):
+            xs.append(bucket.start + bucket.resolution / 2.0)
+            ys.append(bucket.mean)
+        return xs, ys
+
+    def path(self, span, now=None):
+        """返回最近 span 秒的图片文件路径；画出来的像素没有变化时不重新绘制。"""
+        lines = self.layout(span, now)
+        cached = self._cache.get(span)
+        if cached is not None and cached[0] == lines:
+            return cached[1]
+        image = draw(lines, self.size, self.scale)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, 'chart-{0}.png'.format(span))
+        tmp_path = path + '.tmp'
+        image.save(tmp_path, 'PNG')
+        os.replace(tmp_path, path)
+        self._cache[span] = (lines, path)
+        self.renders += 1
+        return path
@@ -0,0 +1,113 @@
+import os
+import stat
+
+# 驱动状态探测：只执行还没完成的 kext-load 步骤（修复权限 / kextload）
+
+KEXT_DIR = 'kext'
+KEXTS = ['VoodooI2C.kext', 'VoodooI2CHID.kext']
+LOAD_SCRIPT = 'kext-load'
+
+
+def _run(argv):
+    import subprocess
+    try:
+        proc = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except OSError as e:
+        # 命令不存在或不能执行时和执行失败一样处理，不抛出异常
+        return 127, str(e)
+    return proc.returncode, proc.stdout
+
+
+def bundle_id(kext_path):
+    import plistlib
+    with open(os.path.join(kext_path, 'Contents', 'Info.plist'), 'rb') as f:
+        return plistlib.load(f)['CFBundleIdentifier']
+
+
+def bundle_stamp(kext_path):
+    # kext 内容被替换时 Info.plist 或包目录的 mtime 会变化；chmod / chown 不改 mtime，
+    # 但会改 ctime，所以再加上包目录的 ctime、权限和所有者
+    root = os.stat(kext_path)
+    plist = os.stat(os.path.join(kext_path, 'Contents', 'Info.plist'))
+    return [max(root.st_mtime, plist.st_mtime), max(root.st_ctime, plist.st_ctime),
+            stat.S_IMODE(root.st_mode), root.st_uid, root.st_gid]
+
+
+def permissions_ok(kext_path):
+    # 对应 kext-load 中的 chown -R root:wheel 和 chmod -R 755
+    for root, dirs, files in os.walk(kext_path):
+        for name in [root] + [os.path.join(root, f) for f in files]:
+            st = os.lstat(name)
+            if st.st_uid != 0 or st.st_gid != 0 or stat.S_IMODE(st.st_mode) != 0o755:
+                return False
+    return True
+
+
+def loaded_bundle_ids(runner=_run):
+    code, output = runner(['kextstat', '-l'])
+    if code != 0:
+        return set()
+    ids = set()
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) > 5:
+            ids.add(fields[5])
+    return ids
+
+
+def _load_cache(cache_path):
+    if cache_path is None:
+        return {}
+    import json
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_cache(cache_path, cache):
+    if cache_path is None:
+        return
+    import json
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, cache_path)
+
+
+def probe(kext_dir=KEXT_DIR, kexts=KEXTS, runner=_run, cache_path=None):
+    """返回 (需要修复权限的驱动, 需要加载的驱动)。"""
+    cache = _load_cache(cache_path)
+    loaded = loaded_bundle_ids(runner)
+    fix, load = [], []
+    for kext in kexts:
+        path = os.path.join(kext_dir, kext)
+        entry = cache.get(kext)
+        if not (entry and entry.get('stamp') == bundle_stamp(path)) and not permissions_ok(path):
+            fix.append(kext)
+        if bundle_id(path) not in loaded:
+            load.append(kext)
+    return fix, load
+
+
+def ensure_loaded(kext_dir=KEXT_DIR, kexts=KEXTS, runner=_run, cache_path=None, force=False):
+    """只执行未满足的步骤，返回 (kext-load 的退出码, 输出)，无需执行时为 (0, None)。"""
+    if force:
+        fix, load = list(kexts), list(kexts)
+    else:
+        fix, load = probe(kext_dir, kexts, runner, cache_path)
+    code, output = 0, None
+    if fix or load:
+        argv = [os.path.join(kext_dir, LOAD_SCRIPT)]
+        if fix:
+            argv += ['fix'] + fix
+        if load:
+            argv += ['load'] + load
+        code, output = runner(argv)
+    if code == 0:
+        cache = _load_cache(cache_path)
+        for kext in kexts:
+            cache[kext] = {'stamp': bundle_stamp(os.path.join(kext_dir, kext))}
+        _save_cache(cache_path, cache)
+    return code, output
@@ -0,0 +1,118 @@
+from collections import deque, namedtuple
+
+import alerts
+import battery
+
+# 剩余时间估算：对最近 WINDOW 秒的电量做线性回归，斜率就是充放电速度
+# 回归只用累加和（n、Σx、Σy、Σxx、Σxy），新读数加进来、过期读数减出去，每个读数 O(1)，不重新扫描历史
+# 充电状态（+BATCG 第 4 个字段的正负）变化时斜率的方向也变了，窗口清空重新开始
+# 充电状态和提醒引擎一样去抖，充电字段来回跳动时不清空窗口
+
+WINDOW = 30 * 60
+# 窗口跨度不足 MIN_SPAN 秒或者电量还没有变化时不给出估算
+MIN_SPAN = 5 * 60
+FULL = 100
+DEBOUNCE = 3.0
+
+Estimate = namedtuple('Estimate', ['charging', 'seconds', 'rate'])
+
+
+class SlidingRegression(object):
+    """最近 window 秒的 y = a + b * x 最小二乘回归。"""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self._samples = deque()
+        self._origin = None  # x 以第一个读数为原点，避免时间戳的平方损失精度
+        self.n = 0
+        self.sx = self.sy = self.sxx = self.sxy = 0.0
+
+    def add(self, x, y):
+        if self._origin is None:
+            self._origin = x
+        x -= self._origin
+        self._samples.append((x, y))
+        self.n += 1
+        self.sx += x
+        self.sy += y
+        self.sxx += x * x
+        self.sxy += x * y
+        while x - self._samples[0][0] > self.window:
+            old_x, old_y = self._samples.popleft()
+            self.n -= 1
+            self.sx -= old_x
+            self.sy -= old_y
+            self.sxx -= old_x * old_x
+            self.sxy -= old_x * old_y
+
+    @property
+    def span(self):
+        return self._samples[-1][0] - self._samples[0][0] if self._samples else 0
+
+    def slope(self):
+        d = self.n * self.sxx - self.sx * self.sx
+        if self.n < 2 or d <= 0:
+            return None
+        return (self.n * self.sxy - self.sx * self.sy) / d
+
+    def value(self, x):
+        """回归直线在 x 处的值。"""
+        b = self.slope()
+        if b is None:
+            return None
+        return (self.sy - b * self.sx) / self.n + b * (x - self._origin)
+
+
+class Estimator(object):
+    def __init__(self, window=WINDOW, min_span=MIN_SPAN, debounce=DEBOUNCE):
+        self.min_span = min_span
+        self.regression = SlidingRegression(window)
+        self.charger = alerts.Band(1, 0, debounce)
+        self.charging = None
+        self.resets = 0
+
+    def reset(self):
+        self.regression.reset()
+        self.charging = None
+
+    def update(self, reading):
+        """加入一个读数，返回 Estimate（秒数为充满或用完的剩余时间），还估算不出时返回 None。"""
+        value = 1 if battery.is_charging(reading) else 0
+        if self.charging is None:
+            self.charging = self.charger.prime(value)
+        elif self.charger.update(value, reading.timestamp) is not None:
+            self.resets += 1
+            self.regression.reset()
+            self.charging = self.charger.active
+        self.regression.add(reading.timestamp, reading.percentage)
+        return self.estimate(reading.timestamp)
+
+    def estimate(self, timestamp):
+        regression = self.regression
+        if regression.span < self.min_span:
+            return None
+        rate = regression.slope()
+        if rate is None:
+            return None
+        now = min(max(regression.value(timestamp), 0.0), FULL)
+        if self.charging and rate > 0:
+            return Estimate(True, (FULL - now) / rate, rate)
+        if not self.charging and rate < 0:
+            return Estimate(False, now / -rate, rate)
+        return None
+
+
+def format_estimate(estimate):
+    """例如“剩余约 2 小时 10 分钟”“约 35 分钟后充满”，没有估算时返回 None。"""
+    if estimate is None:
+        return None
+    minutes = int(round(estimate.seconds / 60.0))
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        text = '{0} 小时 {1} 分钟'.format(hours, minutes) if minutes else '{0} 小时'.format(hours)
+    else:
+        text = '{0} 分钟'.format(max(minutes, 1))
+    return '约 {0}后充满'.format(text) if estimate.charging else '剩余约 {0}'.format(text)
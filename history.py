@@ -0,0 +1,573 @@
+import bisect
+import os
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+from battery import BatteryReading
+
+# 电量历史：按天分段的只追加二进制日志，保存在 Application Support 下
+#
+# 每次提交写入一个块：MAGIC、varint 长度、CRC32、内容。写到一半崩溃时只丢失最后一个不完整的块，下次打开时截掉它。
+# 读数保存和前一个读数的差（zigzag + varint），只写出变化了的字段；时间间隔和字段都不变的连续读数合并成一个游程，
+# 电量长时间不变时几乎不占空间。分段的第一个块（KEYFRAME）保存第一个读数的绝对值，之后的块（DELTA）接着
+# 上一个块的最后一个读数编码。时间戳精确到秒。
+# 每隔 INDEX_INTERVAL 秒写一个 KEYFRAME，这些 KEYFRAME 就是分段的稀疏时间索引，按时间范围读取时从最近的 KEYFRAME
+# 开始解码，不需要扫描整个分段。过去日期的分段会被重写成每小时一个 KEYFRAME，去掉每次提交的块头。
+
+KEYFRAME = b'\xb7'
+DELTA = b'\xb8'
+SUFFIX = '.bhist'
+COMMIT_INTERVAL = 5.0
+INDEX_INTERVAL = 3600
+FIELD_COUNT = 6
+
+# 按列解码的结果（numpy 数组），每个元素是一个游程：从 start 开始每隔 step 秒一个读数，共 count 个，字段都是 fields。
+# 数据量和变化的次数成正比，不和读数个数成正比
+Columns = namedtuple('Columns', ['start', 'step', 'count', 'fields'])
+
+
+def _put(out, value):
+    # 无符号 varint
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def encode_block(samples, state=None):
+    """samples 为 [(秒, (6 个字段)), ...]。state 为上一个块结束时的状态，为 None 时写 KEYFRAME。
+    返回 (可以直接追加到分段文件的字节串, 这个块结束时的状态)。"""
+    out = bytearray()
+    _put(out, len(samples))
+    if state is None:
+        t0, f0 = samples[0]
+        _put(out, t0)
+        for value in f0:
+            _put(out, _zigzag(value))
+        prev_t, prev_f, prev_dt = t0, f0, 1
+        samples = samples[1:]
+    else:
+        prev_t, prev_f, prev_dt = state
+    run = 0
+    for t, f in samples:
+        dt = t - prev_t
+        prev_t = t
+        if dt == prev_dt and f == prev_f:
+            run += 1
+            continue
+        if run:
+            _put(out, run << 1 | 1)
+            run = 0
+        mask = 0
+        for i in range(FIELD_COUNT):
+            if f[i] != prev_f[i]:
+                mask |= 1 << i
+        _put(out, mask << 2 | (dt == prev_dt) << 1)
+        if dt != prev_dt:
+            _put(out, _zigzag(dt))
+        for i in range(FIELD_COUNT):
+            if mask >> i & 1:
+                _put(out, _zigzag(f[i] - prev_f[i]))
+        prev_f, prev_dt = f, dt
+    if run:
+        _put(out, run << 1 | 1)
+    frame = bytearray(KEYFRAME if state is None else DELTA)
+    _put(frame, len(out))
+    frame += zlib.crc32(out).to_bytes(4, 'little')
+    return bytes(frame + out), (prev_t, prev_f, prev_dt)
+
+
+def decode_block(data, pos=0, state=None):
+    """从 pos 开始解码一个块，返回 (samples, 下一个块的位置, 状态)；
+    块不完整、损坏或者是缺少前一个块状态的 DELTA 块时返回 (None, pos, state)。"""
+    try:
+        magic = data[pos:pos + 1]
+        if magic != KEYFRAME and (magic != DELTA or state is None):
+            return None, pos, state
+        length, start = _get(data, pos + 1)
+        end = start + 4 + length
+        if end > len(data):
+            return None, pos, state
+        payload = data[start + 4:end]
+        if zlib.crc32(payload) != int.from_bytes(data[start:start + 4], 'little'):
+            return None, pos, state
+    except IndexError:
+        return None, pos, state
+    count, p = _get(payload, 0)
+    samples = []
+    if magic == KEYFRAME:
+        t, p = _get(payload, p)
+        f = []
+        for _ in range(FIELD_COUNT):
+            value, p = _get(payload, p)
+            f.append(_unzigzag(value))
+        f = tuple(f)
+        dt = 1
+        samples.append((t, f))
+    else:
+        t, f, dt = state
+    while len(samples) < count:
+        header, p = _get(payload, p)
+        if header & 1:
+            for _ in range(header >> 1):
+                t += dt
+                samples.append((t, f))
+            continue
+        if not header & 2:
+            value, p = _get(payload, p)
+            dt = _unzigzag(value)
+        mask = header >> 2
+        if mask:
+            f = list(f)
+            for i in range(FIELD_COUNT):
+                if mask >> i & 1:
+                    value, p = _get(payload, p)
+                    f[i] += _unzigzag(value)
+            f = tuple(f)
+        t += dt
+        samples.append((t, f))
+    return samples, end, (t, f, dt)
+
+
+def blocks(data, pos=0, state=None):
+    """从 pos 开始依次解码块，产生 (samples, 块结束位置, 状态)，遇到不完整或损坏的块时停止。"""
+    while pos < len(data):
+        samples, pos, state = decode_block(data, pos, state)
+        if samples is None:
+            return
+        yield samples, pos, state
+
+
+def decode(data):
+    """解码整个分段，返回 (全部读数, 最后一个完整块的结束位置, 结束时的状态, 块数)。"""
+    samples = []
+    end = count = 0
+    state = None
+    for block, end, state in blocks(data):
+        samples.extend(block)
+        count += 1
+    return samples, end, state, count
+
+
+def headers(data):
+    """依次产生 (块类型, 块位置, 载荷位置)。只读块头，不解码也不校验 CRC，遇到不完整的块时停止。"""
+    pos = 0
+    try:
+        while pos < len(data):
+            magic = data[pos:pos + 1]
+            if magic != KEYFRAME and magic != DELTA:
+                return
+            length, start = _get(data, pos + 1)
+            if start + 4 + length > len(data):
+                return
+            yield magic, pos, start + 4
+            pos = start + 4 + length
+    except IndexError:
+        return
+
+
+def keyframes(data):
+    """稀疏时间索引：[(KEYFRAME 第一个读数的时间, 位置), ...]。只读块头，不校验 CRC。"""
+    index = []
+    for magic, pos, payload in headers(data):
+        if magic == KEYFRAME:
+            _, p = _get(data, payload)
+            index.append((_get(data, p)[0], pos))
+    return index
+
+
+def encode_segment(samples, interval=INDEX_INTERVAL):
+    """把一个分段的全部读数编码成每 interval 秒一个 KEYFRAME 的块序列。"""
+    out = bytearray()
+    chunk = []
+    for sample in samples:
+        if chunk and sample[0] >= chunk[0][0] + interval:
+            out += encode_block(chunk)[0]
+            chunk = []
+        chunk.append(sample)
+    if chunk:
+        out += encode_block(chunk)[0]
+    return bytes(out)
+
+
+def _valid_payloads(data):
+    # 校验过 CRC 的连续块：[(是否 KEYFRAME, 载荷开始, 载荷结束), ...]，第一个块必须是 KEYFRAME
+    result = []
+    for magic, pos, payload in headers(data):
+        length = _get(data, pos + 1)[0]
+        if zlib.crc32(data[payload:payload + length]) != int.from_bytes(data[payload - 4:payload], 'little'):
+            break
+        if not result and magic != KEYFRAME:
+            break
+        result.append((magic == KEYFRAME, payload, payload + length))
+    return result
+
+
+# 6 位字段掩码中 1 的个数
+_POPCOUNT = [bin(mask).count('1') for mask in range(1 << FIELD_COUNT)]
+
+
+def _unzigzag_array(values):
+    return (values >> 1) ^ -(values & 1)
+
+
+def _fill_forward(numpy, has):
+    # 每个位置最近一个 has 为真的位置（第一个位置必须为真）
+    return numpy.maximum.accumulate(numpy.where(has, numpy.arange(len(has)), 0))
+
+
+def columns(data):
+    """用 numpy 向量化地解码整个分段，返回 Columns；没有完整的块时返回 None。
+    结果和 decode() 相同（按游程展开后），但不逐个读数执行 Python 代码：
+    先一次解出全部 varint，再用倍增跳转找出游程头所在的位置，时间和字段用累加和恢复。"""
+    import numpy
+    spans = _valid_payloads(data)
+    if not spans:
+        return None
+    buffer = numpy.frombuffer(data, dtype=numpy.uint8)
+    payload = numpy.concatenate([buffer[start:end] for _, start, end in spans])
+    # 全部 varint：最高位为 0 的字节是每个 varint 的最后一个字节
+    ends = numpy.flatnonzero(payload < 0x80)
+    firsts = numpy.concatenate(([0], ends[:-1] + 1))
+    shift = (numpy.arange(len(payload)) - numpy.repeat(firsts, ends - firsts + 1)) * 7
+    values = numpy.add.reduceat((payload & 0x7f).astype(numpy.int64) << shift, firsts)
+    n = len(values)
+    # 每个块第一个 varint 的编号
+    sizes = numpy.array([end - start for _, start, end in spans])
+    block_first = numpy.searchsorted(firsts, numpy.concatenate(([0], numpy.cumsum(sizes)[:-1])))
+    keyframe = numpy.array([is_keyframe for is_keyframe, _, _ in spans])
+
+    # 假设每个 varint 都是游程头时下一个游程头的位置；块的开头跳过个数（KEYFRAME 还有时间和 6 个字段）
+    table = numpy.array(_POPCOUNT)
+    popcount = table[(values >> 2) & ((1 << FIELD_COUNT) - 1)]
+    step = numpy.where(values & 1, 1, 1 + ((values & 2) == 0) + popcount)
+    step[block_first] = numpy.where(keyframe, 2 + FIELD_COUNT, 1)
+    jump = numpy.minimum(numpy.arange(n) + step, n)
+    jump = numpy.append(jump, n)
+    # 倍增：path 为从 0 开始的前 2^k 个位置，每轮用跳 2^k 步的表把它加倍
+    path = numpy.zeros(1, dtype=numpy.int64)
+    while path[-1] < n:
+        path = numpy.concatenate((path, jump[path]))
+        jump = jump[jump]
+    path = path[path < n]
+
+    is_block = numpy.zeros(n, dtype=bool)
+    is_block[block_first] = True
+    is_keyframe = numpy.zeros(n, dtype=bool)
+    is_keyframe[block_first[keyframe]] = True
+    if is_block[path].sum() != len(spans):
+        # 块内的游程头没有正好停在下一个块的开头，数据有问题，交给逐个解码
+        return _columns_slow(numpy, data)
+    header = values[path]
+    block = is_block[path]
+    key = is_keyframe[path]
+    run = ~block & (header & 1 == 1)
+    change = ~block & ~run
+    count = numpy.where(key, 1, numpy.where(block, 0, numpy.where(run, header >> 1, 1)))
+    if count.sum() != values[block_first].sum():
+        return _columns_slow(numpy, data)
+    fetch = numpy.minimum(path + 1, n - 1)
+
+    # 时间间隔：KEYFRAME 重置为 1，带间隔的游程头设置新值，其余沿用前一个
+    explicit = change & (header & 2 == 0)
+    has_step = key | explicit
+    dt = numpy.where(key, 1, _unzigzag_array(values[fetch]))[_fill_forward(numpy, has_step)]
+    # 结束时间 = KEYFRAME 的绝对时间 + 之后每个游程前进的 dt * count
+    advance = numpy.where(key, 0, dt * count)
+    total = numpy.cumsum(advance)
+    last_key = _fill_forward(numpy, key)
+    anchor = numpy.where(key, values[fetch] - total, 0)[last_key]
+    end_time = total + anchor
+
+    fields = numpy.empty((len(path), FIELD_COUNT), dtype=numpy.int64)
+    mask = numpy.where(change, header >> 2, 0)
+    offset = path + 1 + explicit
+    for i in range(FIELD_COUNT):
+        bit = (mask >> i) & 1 == 1
+        position = numpy.minimum(offset + table[mask & ((1 << i) - 1)], n - 1)
+        delta = numpy.where(bit, _unzigzag_array(values[position]), 0)
+        total = numpy.cumsum(delta)
+        absolute = _unzigzag_array(values[numpy.minimum(path + 2 + i, n - 1)])
+        fields[:, i] = total + numpy.where(key, absolute - total, 0)[last_key]
+
+    keep = count > 0
+    count, dt, end_time, fields = count[keep], dt[keep], end_time[keep], fields[keep]
+    return Columns(end_time - dt * (count - 1), dt, count, fields)
+
+
+def _columns_slow(numpy, data):
+    samples = decode(data)[0]
+    if not samples:
+        return None
+    return Columns(numpy.array([t for t, _ in samples], dtype=numpy.int64), numpy.ones(len(samples), dtype=numpy.int64),
+                   numpy.ones(len(samples), dtype=numpy.int64), numpy.array([f for _, f in samples], dtype=numpy.int64))
+
+
+def select(columns, start=None, end=None, ordered=False):
+    """从 Columns 中取出 [start, end) 之间的读数，游程跨过边界时截短。
+    ordered 表示游程按开始时间排序（时钟没有回拨），这时先二分查找，只处理范围附近的游程。"""
+    import numpy
+    if ordered:
+        lo = 0 if start is None else max(int(numpy.searchsorted(columns.start, start, 'right')) - 1, 0)
+        hi = len(columns.start) if end is None else int(numpy.searchsorted(columns.start, end, 'left'))
+        columns = Columns(*[column[lo:hi] for column in columns])
+    return _trim(numpy, columns, start, end)
+
+
+def _trim(numpy, columns, start, end):
+    lo = numpy.zeros(len(columns.count), dtype=numpy.int64)
+    hi = columns.count.copy()
+    forward = columns.step > 0
+    step = numpy.where(forward, columns.step, 1)
+    inside = numpy.ones(len(hi), dtype=bool)
+    if start is not None:
+        lo = numpy.where(forward, numpy.clip(-((columns.start - start) // step), 0, hi), 0).astype(numpy.int64)
+        inside &= forward | (columns.start >= start)
+    if end is not None:
+        hi = numpy.where(forward, numpy.clip(-((columns.start - end) // step), 0, hi), hi).astype(numpy.int64)
+        inside &= forward | (columns.start < end)
+    keep = inside & (hi > lo)
+    return Columns((columns.start + lo * columns.step)[keep], columns.step[keep], (hi - lo)[keep],
+                   columns.fields[keep])
+
+
+def expand(columns):
+    """把 Columns 展开成每个读数一行：返回 (时间列, 字段矩阵)。"""
+    import numpy
+    position = numpy.arange(columns.count.sum()) - numpy.repeat(numpy.cumsum(columns.count) - columns.count,
+                                                                 columns.count)
+    t = numpy.repeat(columns.start, columns.count) + position * numpy.repeat(columns.step, columns.count)
+    return t, numpy.repeat(columns.fields, columns.count, axis=0)
+
+
+def segment_name(timestamp):
+    return time.strftime('%Y%m%d', time.gmtime(timestamp)) + SUFFIX
+
+
+class HistoryStore(object):
+    def __init__(self, directory, commit_interval=COMMIT_INTERVAL):
+        self.directory = directory
+        self.commit_interval = commit_interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()        # 保护 _pending，串口线程只在这里停留很短的时间
+        self._write_lock = threading.Lock()  # 保证同一时间只有一个线程在写文件
+        self._pending = []
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = None
+        self._file = None
+        self._segment = None
+        self._state = None  # 当前分段最后一个块结束时的编码状态
+        self._keyframe = None  # 当前分段最后一个 KEYFRAME 的时间
+        self._index = {}  # 分段 -> ((文件大小, 修改时间), 稀疏时间索引)
+        self.on_commit = None  # 每次提交之后在写入线程中调用 on_commit(samples)，用于增量汇总
+        self.commits = 0
+
+    def append(self, reading):
+        """只把读数放进队列，由后台线程每 commit_interval 秒批量写入并 fsync 一次，不阻塞串口读取。"""
+        with self._lock:
+            self._pending.append((int(round(reading.timestamp)), tuple(reading.fields)))
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name='history-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        try:
+            self.compact_sealed()
+        except Exception:
+            import traceback
+            traceback.print_exc()
+        while not self._closed:
+            self._wakeup.wait(self.commit_interval)
+            try:
+                self.commit()
+            except Exception:
+                import traceback
+                traceback.print_exc()
+
+    def _open(self, segment):
+        if segment == self._segment:
+            return
+        previous = self._segment
+        if self._file is not None:
+            self._file.close()
+        path = os.path.join(self.directory, segment)
+        with open(path, 'ab+') as f:
+            f.seek(0)
+            data = f.read()
+        _, end, self._state, _ = decode(data)
+        index = keyframes(data[:end])
+        self._keyframe = index[-1][0] if index else None
+        self._file = open(path, 'ab')
+        if end < len(data):
+            # 截掉上次崩溃时写了一半的块
+            self._file.truncate(end)
+        self._segment = segment
+        if previous is not None and previous < segment:
+            self.compact(previous)
+
+    def commit(self):
+        """把队列中的读数写入磁盘，返回写入的读数个数。"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        with self._write_lock:
+            batch = []
+            for sample in pending:
+                segment = segment_name(sample[0])
+                if batch and segment != self._segment:
+                    self._write(batch)
+                    batch = []
+                self._open(segment)
+                batch.append(sample)
+            self._write(batch)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.commits += 1
+        if self.on_commit is not None:
+            self.on_commit(pending)
+        return len(pending)
+
+    def _write(self, batch):
+        # 每隔 INDEX_INTERVAL 秒从一个新的 KEYFRAME 开始
+        chunk = []
+        for sample in batch:
+            if self._keyframe is None or sample[0] >= self._keyframe + INDEX_INTERVAL:
+                if chunk:
+                    self._write_block(chunk)
+                    chunk = []
+                self._state = None
+                self._keyframe = sample[0]
+            chunk.append(sample)
+        self._write_block(chunk)
+
+    def _write_block(self, samples):
+        data, self._state = encode_block(samples, self._state)
+        self._file.write(data)
+
+    def compact(self, segment):
+        """把一个分段重写成每小时一个 KEYFRAME，先写临时文件再替换。调用时需要持有 _write_lock。"""
+        if segment == self._segment:
+            # 正在追加的分段不能替换，否则之后的写入会落到旧文件上
+            return False
+        import mmap
+        path = os.path.join(self.directory, segment)
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # 已经压缩过的分段没有 DELTA 块，只读块头就能判断，不解码
+                if not any(magic == DELTA for magic, _, _ in headers(data)):
+                    return False
+                samples = decode(data)[0]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_segment(samples))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+
+    def compact_sealed(self):
+        """压缩今天以前的全部分段，返回压缩了的分段个数。"""
+        today = segment_name(time.time())
+        with self._write_lock:
+            return sum(self.compact(segment) for segment in self.segments() if segment < today)
+
+    def close(self):
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.commit()
+        with self._write_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = self._segment = None
+
+    def segments(self):
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(SUFFIX))
+
+    def read_segment(self, segment, start=None, end=None):
+        """用 mmap 读取一个分段中 [start, end) 之间的读数，返回 [(秒, 字段), ...]。
+        用稀疏时间索引跳到 start 之前最近的 KEYFRAME，读到 end 之后停止。"""
+        import mmap
+        path = os.path.join(self.directory, segment)
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            if not size:
+                return []
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            version = (size, stat.st_mtime_ns)
+            cached = self._index.get(segment)
+            if cached is None or cached[0] != version:
+                cached = self._index[segment] = (version, keyframes(data))
+            index = cached[1]
+            pos = 0
+            if start is not None and index:
+                i = bisect.bisect_right(index, (start, size)) - 1
+                pos = index[max(i, 0)][1]
+            result = []
+            for block, _, _ in blocks(data, pos):
+                for sample in block:
+                    if end is not None and sample[0] >= end:
+                        return result
+                    if start is None or sample[0] >= start:
+                        result.append(sample)
+            return result
+        finally:
+            data.close()
+
+    def _segments_between(self, start, end):
+        first = None if start is None else segment_name(start)
+        last = None if end is None else segment_name(end)
+        return [segment for segment in self.segments()
+                if not ((first is not None and segment < first) or (last is not None and segment > last))]
+
+    def read(self, start=None, end=None):
+        """按时间顺序返回 [start, end) 之间已经写入磁盘的读数。"""
+        for segment in self._segments_between(start, end):
+            for t, fields in self.read_segment(segment, start, end):
+                yield BatteryReading(t, fields[1], fields[3], fields)
+
+    def read_columns(self, start=None, end=None):
+        """和 read() 相同的范围，按列（Columns，numpy 数组）返回，批量分析时使用；需要 numpy。"""
+        import mmap
+        import numpy
+        parts = []
+        for segment in self._segments_between(start, end):
+            with open(os.path.join(self.directory, segment), 'rb') as f:
+                if not os.fstat(f.fileno()).st_size:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    part = columns(data)
+            if part is not None:
+                parts.append(_trim(numpy, part, start, end) if start is not None or end is not None else part)
+        if not parts:
+            empty = numpy.zeros(0, dtype=numpy.int64)
+            return Columns(empty, empty, empty, numpy.zeros((0, FIELD_COUNT), dtype=numpy.int64))
+        return Columns(*[numpy.concatenate([getattr(part, name) for part in parts]) for name in Columns._fields])
@@ -0,0 +1,253 @@
+"""离线导入多台机器的串口记录和电量历史，按设备输出汇总。
+
+用法：python ingest.py [-j 进程数] [-o 输出文件] [--format json|csv|npz] 文件或目录 ...
+
+- 串口记录：文本文件，每行一条串口输出，用和 App 相同的 battery.parse_line 解析 +BATCG。
+  行首可以带 Unix 时间戳（例如 ``1700000000.5 +BATCG=0,85,3950,-120,25,0``）；没有时按 App 每秒读取一次的节奏，
+  以文件修改时间为最后一个读数的时间倒推。
+- 电量历史：App 写入的 .bhist 分段（history.py）。
+- 设备名取文件所在目录名（跳过名为 history 的目录），一台机器的文件放在一个目录下即可。
+
+文件由进程池并行解析，每个设备的读数合并后用 numpy 向量化计算放电速度分布、充电时长和异常标记，
+结果按列输出：每一列是一个指标，每一行是一个设备。
+"""
+
+import os
+import sys
+from array import array
+
+import battery
+import history
+
+# 相邻读数间隔超过这个秒数时视为中断（睡眠、断开），不计算速度也不连成一个充电过程
+GAP = 10 * 60
+# 放电速度按这么长的窗口计算，避免电量取整造成的尖峰
+RATE_WINDOW = 10 * 60
+# 充满时间只用电量至少增加这么多的充电过程估算
+MIN_CHARGE_SPAN = 20
+# 异常阈值：相邻读数（间隔不超过 JUMP_SECONDS 秒）的电量跳变、充电中电量不升的时长、放电速度（%/小时）
+JUMP = 5
+JUMP_SECONDS = 10
+STALLED_CHARGE = 30 * 60
+FAST_DRAIN = 50
+CAPTURE_INTERVAL = 1.0
+COLUMNS = [
+    'device', 'files', 'readings', 'unparsed', 'start', 'end', 'hours',
+    'drain_mean', 'drain_p10', 'drain_p50', 'drain_p90',
+    'charges', 'charge_seconds_median', 'charge_seconds_max', 'full_charge_hours',
+    'gaps', 'clock_backwards', 'jumps', 'out_of_range', 'stalled_charges', 'fast_drain',
+]
+FORMATS = ('json', 'csv', 'npz')
+
+
+def device_name(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    if os.path.basename(directory) == 'history':
+        directory = os.path.dirname(directory)
+    return os.path.basename(directory)
+
+
+def _capture_timestamp(line):
+    head = line.split('+BATCG', 1)[0].strip()
+    if not head:
+        return None
+    try:
+        return float(head.split()[-1])
+    except ValueError:
+        return None
+
+
+def _load_history(path):
+    # .bhist 用 history.columns 向量化解码，不逐个读数执行 Python 代码
+    import numpy
+    with open(path, 'rb') as f:
+        columns = history.columns(f.read())
+    if columns is None:
+        return array('d'), array('h'), array('i'), 0
+    t, fields = history.expand(columns)
+    backwards = int(numpy.count_nonzero(t[1:] < t[:-1]))
+    return t.astype(numpy.float64), fields[:, 1].astype(numpy.int16), fields[:, 3].astype(numpy.int32), backwards
+
+
+def load(path):
+    """在工作进程中运行：解析一个文件，返回可以 pickle 的按列数据。"""
+    unparsed = 0
+    if path.endswith(history.SUFFIX):
+        timestamps, percentages, charges, backwards = _load_history(path)
+    else:
+        timestamps, percentages, charges = array('d'), array('h'), array('i')
+        untimed = []
+        with open(path, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if '+BATCG' not in line:
+                    continue
+                t = _capture_timestamp(line)
+                reading = battery.parse_line(line, 0.0 if t is None else t)
+                if reading is None:
+                    unparsed += 1
+                    continue
+                if t is None:
+                    untimed.append(len(timestamps))
+                timestamps.append(reading.timestamp)
+                percentages.append(reading.percentage)
+                charges.append(reading.charge)
+        if untimed:
+            end = os.path.getmtime(path)
+            for n, i in enumerate(untimed):
+                timestamps[i] = end - (len(untimed) - 1 - n) * CAPTURE_INTERVAL
+        backwards = sum(1 for a, b in zip(timestamps, timestamps[1:]) if b < a)
+    return {
+        'device': device_name(path),
+        'path': path,
+        'timestamp': timestamps,
+        'percentage': percentages,
+        'charge': charges,
+        'unparsed': unparsed,
+        'clock_backwards': backwards,
+    }
+
+
+def expand(paths):
+    """展开目录，返回其中的 .bhist 文件和其他文本文件。"""
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            for name in sorted(names):
+                if not name.startswith('.') and not name.endswith(('.bin', '.json', '.png', '.tmp')):
+                    files.append(os.path.join(root, name))
+    return files
+
+
+def _segments(numpy, breaks, n):
+    # breaks 为新段开始的位置，返回每段的 (开始, 结束)（不含结束）
+    starts = numpy.concatenate(([0], breaks))
+    ends = numpy.concatenate((breaks, [n]))
+    return starts, ends
+
+
+def summarize(numpy, device, parts):
+    """合并一个设备的全部文件并计算一行汇总。"""
+    def column(name, dtype):
+        return numpy.concatenate([numpy.frombuffer(part[name], dtype=dtype) for part in parts])
+
+    t = column('timestamp', numpy.float64)
+    p = column('percentage', numpy.int16).astype(numpy.float64)
+    c = column('charge', numpy.int32)
+    order = numpy.argsort(t, kind='stable')
+    t, p, c = t[order], p[order], c[order]
+    # 同一设备的串口记录和 .bhist 可能重叠，同一时间的读数只保留排在前面的一个，否则会重复计数并产生 dt=0
+    t, first = numpy.unique(t, return_index=True)
+    p, charging = p[first], c[first] > 0
+    n = len(t)
+    row = dict((name, None) for name in COLUMNS)
+    row.update(device=device, files=len(parts), readings=n, unparsed=sum(part['unparsed'] for part in parts),
+               clock_backwards=sum(part['clock_backwards'] for part in parts))
+    if not n:
+        return row
+    dt = numpy.diff(t)
+    dp = numpy.diff(p)
+    row.update(start=float(t[0]), end=float(t[-1]), hours=float(t[-1] - t[0]) / 3600.0,
+               gaps=int(numpy.count_nonzero(dt > GAP)),
+               jumps=int(numpy.count_nonzero((numpy.abs(dp) > JUMP) & (dt <= JUMP_SECONDS))),
+               out_of_range=int(numpy.count_nonzero((p < 0) | (p > 100))))
+
+    # 放电速度：每个读数和 RATE_WINDOW 秒之后的读数比较，中间没有充电也没有中断时才有效
+    j = numpy.searchsorted(t, t + RATE_WINDOW)
+    valid = j < n
+    i = numpy.flatnonzero(valid)
+    j = j[valid]
+    charged = numpy.concatenate(([0], numpy.cumsum(charging)))
+    gaps = numpy.concatenate(([0], numpy.cumsum(dt > GAP)))
+    ok = (charged[j + 1] == charged[i]) & (gaps[j] == gaps[i]) & (t[j] > t[i])
+    i, j = i[ok], j[ok]
+    if len(i):
+        rate = (p[i] - p[j]) * 3600.0 / (t[j] - t[i])
+        p10, p50, p90 = numpy.percentile(rate, [10, 50, 90])
+        row.update(drain_mean=float(rate.mean()), drain_p10=float(p10), drain_p50=float(p50),
+                   drain_p90=float(p90), fast_drain=bool(p90 > FAST_DRAIN))
+
+    # 充电过程：充电状态变化或中断处切开，取充电的段
+    breaks = numpy.flatnonzero((charging[1:] != charging[:-1]) | (dt > GAP)) + 1
+    starts, ends = _segments(numpy, breaks, n)
+    keep = charging[starts] & (ends - starts > 1)
+    starts, ends = starts[keep], ends[keep] - 1
+    durations = t[ends] - t[starts]
+    rises = p[ends] - p[starts]
+    row.update(charges=int(len(starts)),
+               stalled_charges=int(numpy.count_nonzero((durations >= STALLED_CHARGE) & (rises <= 0))))
+    if len(starts):
+        row.update(charge_seconds_median=float(numpy.median(durations)), charge_seconds_max=float(durations.max()))
+        full = rises >= MIN_CHARGE_SPAN
+        if full.any():
+            row['full_charge_hours'] = float(numpy.median(durations[full] * 100.0 / rises[full])) / 3600.0
+    return row
+
+
+def ingest(paths, jobs=None):
+    """并行解析 paths 中的全部文件，返回按列的汇总 {列名: [每个设备的值]}。"""
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('ingest summaries need numpy: pip install numpy')
+    files = expand(paths)
+    devices = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for part in pool.map(load, files, chunksize=max(1, len(files) // (4 * (jobs or os.cpu_count() or 1)))):
+            devices.setdefault(part['device'], []).append(part)
+    rows = [summarize(numpy, device, devices[device]) for device in sorted(devices)]
+    return dict((name, [row[name] for row in rows]) for name in COLUMNS)
+
+
+def write(columns, out, fmt):
+    if fmt == 'json':
+        import json
+        json.dump(columns, out, indent=1)
+        out.write('\n')
+    elif fmt == 'csv':
+        import csv
+        writer = csv.writer(out)
+        writer.writerow(COLUMNS)
+        writer.writerows(zip(*[columns[name] for name in COLUMNS]))
+    elif fmt == 'npz':
+        import numpy
+        arrays = {}
+        for name in COLUMNS:
+            values = columns[name]
+            if name == 'device':
+                arrays[name] = numpy.array(values, dtype=str)
+            else:
+                arrays[name] = numpy.array([numpy.nan if v is None else v for v in values], dtype=numpy.float64)
+        numpy.savez(out, **arrays)
+    else:
+        raise ValueError('unknown output format {0!r}, expected one of {1}'.format(fmt, ', '.join(FORMATS)))
+
+
+def main(argv):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('paths', nargs='+', help='串口记录、.bhist 文件或包含它们的目录')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='进程数，默认为 CPU 核数')
+    parser.add_argument('-o', '--output', default='-', help='输出文件，默认为标准输出（npz 格式必须指定文件）')
+    parser.add_argument('--format', choices=FORMATS, default='json')
+    args = parser.parse_args(argv)
+    columns = ingest(args.paths, args.jobs)
+    if args.format == 'npz':
+        if args.output == '-':
+            parser.error('--format npz needs --output')
+        with open(args.output, 'wb') as out:
+            write(columns, out, args.format)
+    elif args.output == '-':
+        write(columns, sys.stdout, args.format)
+    else:
+        with open(args.output, 'w', newline='') as out:
+            write(columns, out, args.format)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
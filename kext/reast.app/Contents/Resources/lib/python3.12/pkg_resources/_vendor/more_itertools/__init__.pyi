@@ -1,2 +0,0 @@
-from .more import *
-from .recipes import *
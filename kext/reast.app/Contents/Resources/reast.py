@@ -1,8 +0,0 @@
-import subprocess
-
-
-print(subprocess.call('shell/reast', shell=True))
-
-
-
-
@@ -1,19 +0,0 @@
-"""
-This is a setup.py script generated by py2applet
-
-Usage:
-    python setup.py py2app
-"""
-
-from setuptools import setup
-
-APP = ['reast.py']
-DATA_FILES = ['shell']
-OPTIONS = {'includes':['subprocess']}
-
-setup(
-    app=APP,
-    data_files=DATA_FILES,
-    options={'py2app': OPTIONS},
-    setup_requires=['py2app'],
-)
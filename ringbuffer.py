@@ -0,0 +1,116 @@
+import bisect
+import threading
+from array import array
+from collections import namedtuple
+
+from battery import BatteryReading
+
+# 最近 N 个原始读数（默认 24 小时 * 每秒 1 个），按列存放在预先分配的 array / numpy 数组里，内存固定
+# 每个值写两份（i 和 i + capacity），任意长度不超过 capacity 的窗口都是一段连续内存，可以直接返回视图而不复制
+
+# 和 battery.BatteryReading 对应的按列版本：timestamp 为时间戳列，fields 为 +BATCG 的 6 个字段列
+Window = namedtuple('Window', ['timestamp', 'percentage', 'charge', 'fields'])
+
+CAPACITY = 24 * 60 * 60
+FIELD_COUNT = 6
+
+_numpy = None
+
+
+def load_numpy():
+    """返回 numpy 模块，没有安装时返回 False。
+    numpy 是可选的，而且导入较慢，只在第一次需要时导入（RingBuffer 分配存储、wear.py 批量计算）。"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy
+
+
+class RingBuffer(object):
+    def __init__(self, capacity=CAPACITY, use_numpy=None):
+        self.capacity = capacity
+        self.use_numpy = use_numpy
+        self._lock = threading.Lock()
+        self._timestamps = None
+        self._fields = None
+        self._head = 0  # 下一个写入位置
+        self._count = 0
+        self.version = 0  # 每写入一个读数加 1，用于缓存由窗口计算出来的结果
+
+    def _allocate(self):
+        numpy = load_numpy() if self.use_numpy is not False else False
+        if self.use_numpy and not numpy:
+            raise ImportError('numpy is not installed')
+        self.use_numpy = bool(numpy)
+        size = 2 * self.capacity
+        if numpy:
+            self._timestamps = numpy.zeros(size, dtype=numpy.float64)
+            self._fields = [numpy.zeros(size, dtype=numpy.int32) for _ in range(FIELD_COUNT)]
+        else:
+            self._timestamps = array('d', bytes(8 * size))
+            self._fields = [array('i', bytes(4 * size)) for _ in range(FIELD_COUNT)]
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def nbytes(self):
+        if self._timestamps is None:
+            return 0
+        if self.use_numpy:
+            return self._timestamps.nbytes + sum(column.nbytes for column in self._fields)
+        return (self._timestamps.itemsize + sum(column.itemsize for column in self._fields)) * 2 * self.capacity
+
+    def append(self, reading):
+        with self._lock:
+            if self._timestamps is None:
+                self._allocate()
+            i = self._head
+            j = i + self.capacity
+            self._timestamps[i] = self._timestamps[j] = reading.timestamp
+            for column, value in zip(self._fields, reading.fields):
+                column[i] = column[j] = value
+            self._head = (i + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self.version += 1
+
+    def _view(self, column, start, stop):
+        if self.use_numpy:
+            return column[start:stop]
+        return memoryview(column)[start:stop]
+
+    def last(self, n=None):
+        """最近 n 个读数（默认全部）的窗口，各列是零复制的视图，按时间从旧到新排列。
+        视图在对应的位置被新读数覆盖之前有效，需要长期保存时请复制。"""
+        with self._lock:
+            n = self._count if n is None else min(n, self._count)
+            if self._timestamps is None:
+                return Window((), (), (), ((),) * FIELD_COUNT)
+            start = (self._head - n) % self.capacity
+            stop = start + n
+            fields = tuple(self._view(column, start, stop) for column in self._fields)
+            return Window(self._view(self._timestamps, start, stop), fields[1], fields[3], fields)
+
+    def since(self, timestamp):
+        """时间戳不早于 timestamp 的读数窗口。"""
+        window = self.last()
+        if not len(window.timestamp):
+            return window
+        if self.use_numpy:
+            index = int(window.timestamp.searchsorted(timestamp))
+        else:
+            index = bisect.bisect_left(window.timestamp, timestamp)
+        fields = tuple(column[index:] for column in window.fields)
+        return Window(window.timestamp[index:], fields[1], fields[3], fields)
+
+    def latest(self):
+        with self._lock:
+            if not self._count:
+                return None
+            i = (self._head - 1) % self.capacity
+            fields = tuple(int(column[i]) for column in self._fields)
+            return BatteryReading(float(self._timestamps[i]), fields[1], fields[3], fields)
@@ -0,0 +1,359 @@
+import bisect
+import os
+import struct
+import sys
+import threading
+import time
+from collections import namedtuple
+
+# 电量历史的分钟 / 小时 / 天汇总：每个时间段保存电量的最小值、最大值、平均值、最后一个值和充电时长
+# 汇总在历史的写入线程中随每次提交增量计算，结束的时间段按固定长度的记录追加到 rollup-<名称>.bin，
+# 记录按时间排序，二分查找就是它们的时间索引。查询“最近 7 天”之类的范围时不需要扫描原始读数。
+# 时间段按 UTC 对齐。
+
+MINUTE = 60
+HOUR = 60 * 60
+DAY = 24 * 60 * 60
+RESOLUTIONS = (MINUTE, HOUR, DAY)
+NAMES = {MINUTE: 'minute', HOUR: 'hour', DAY: 'day'}
+RAW = 1
+# 相邻读数间隔超过这个秒数时（断开、睡眠）不计入充电时长
+MAX_GAP = 10
+POINTS = 500
+FORMATS = ('csv', 'jsonl')
+
+Bucket = namedtuple('Bucket', ['start', 'resolution', 'count', 'min', 'max', 'mean', 'last', 'charging'])
+
+# 开始时间、读数个数、最小值、最大值、电量之和、最后一个值、充电秒数
+_RECORD = struct.Struct('<qIhhdhI')
+
+
+def _bucket(record, resolution):
+    start, count, low, high, total, last, charging = record
+    return Bucket(start, resolution, count, low, high, total / count, last, charging)
+
+
+class Accumulator(object):
+    """一个分辨率上正在累加的时间段。"""
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+        self.record = None
+        self.last = None  # 处理过的最后一个读数 (时间, 是否充电)，不晚于它的读数会被忽略
+        self.resume = None  # 早于这个时间的读数只用来计算充电时长，它们所在的时间段已经写入文件
+
+    def add(self, t, percentage, charging):
+        """返回刚结束的时间段记录，没有结束时返回 None。"""
+        if self.last is not None and t <= self.last[0]:
+            return None
+        charged = 0
+        if self.last is not None and self.last[1] and t - self.last[0] <= MAX_GAP:
+            charged = t - self.last[0]
+        self.last = (t, charging)
+        if self.resume is not None and t < self.resume:
+            return None
+        start = t - t % self.resolution
+        closed = None
+        if self.record is not None and self.record[0] != start:
+            closed, self.record = tuple(self.record), None
+        if self.record is None:
+            self.record = [start, 1, percentage, percentage, percentage, percentage, charged]
+        else:
+            record = self.record
+            record[1] += 1
+            record[2] = min(record[2], percentage)
+            record[3] = max(record[3], percentage)
+            record[4] += percentage
+            record[5] = percentage
+            record[6] += charged
+        return closed
+
+
+def aggregate(readings, resolution):
+    """把读数按 resolution 秒汇总成 Bucket，流式产生。"""
+    accumulator = Accumulator(resolution)
+    for reading in readings:
+        closed = accumulator.add(int(reading.timestamp), reading.percentage, reading.charge > 0)
+        if closed is not None:
+            yield _bucket(closed, resolution)
+    if accumulator.record is not None:
+        yield _bucket(accumulator.record, resolution)
+
+
+def merge(buckets, k):
+    """把每 k 个相邻的 Bucket 合并成一个，点数超出预算时使用。"""
+    group = []
+    for bucket in buckets:
+        group.append(bucket)
+        if len(group) == k:
+            yield _merge(group)
+            group = []
+    if group:
+        yield _merge(group)
+
+
+def _merge(group):
+    count = sum(b.count for b in group)
+    return Bucket(group[0].start, group[0].resolution * len(group), count, min(b.min for b in group),
+                  max(b.max for b in group), sum(b.mean * b.count for b in group) / count, group[-1].last,
+                  sum(b.charging for b in group))
+
+
+class Level(object):
+    """一个分辨率的汇总文件和正在累加的时间段。
+    readonly 时不打开文件写入，结束的时间段只保存在内存中（closed）。"""
+
+    def __init__(self, path, resolution, readonly=False):
+        self.path = path
+        self.resolution = resolution
+        self.readonly = readonly
+        self.accumulator = Accumulator(resolution)
+        self.closed = []
+        self._file = None
+
+    def open(self):
+        if self._file is not None:
+            return
+        self._file, size = open_records(self.path, _RECORD.size, self.readonly)
+        if size:
+            # 已经写入的时间段之前的读数不再汇总
+            self.accumulator.resume = last_record(self.path, _RECORD, size)[0] + self.resolution
+
+    @property
+    def watermark(self):
+        return self.accumulator.resume
+
+    def add(self, t, percentage, charging):
+        closed = self.accumulator.add(t, percentage, charging)
+        if closed is not None:
+            if self.readonly:
+                self.closed.append(closed)
+            else:
+                self._file.write(_RECORD.pack(*closed))
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.readonly:
+            # 内存中的状态在下次打开时从文件和历史重新计算
+            self.accumulator = Accumulator(self.resolution)
+            self.closed = []
+
+    def records(self, start=None, end=None):
+        """用 mmap 读取和 [start, end) 重叠的已结束时间段，二分查找第一个时间段；readonly 时再加上内存中的时间段。"""
+        last = None
+        for record in self._mapped(start, end):
+            last = record[0]
+            yield _bucket(record, self.resolution)
+        for record in self.closed:
+            # 文件中已经有的时间段（例如运行中的 App 刚写入的）不重复
+            if (last is None or record[0] > last) and (start is None or record[0] + self.resolution > start) and \
+                    (end is None or record[0] < end):
+                yield _bucket(record, self.resolution)
+
+    def _mapped(self, start, end):
+        import mmap
+        try:
+            f = open(self.path, 'rb')
+        except IOError:
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            count = size // _RECORD.size
+            if not count:
+                return
+            data = mmap.mmap(f.fileno(), count * _RECORD.size, access=mmap.ACCESS_READ)
+        try:
+            index = 0
+            if start is not None:
+                starts = RecordKeys(data, count, _RECORD.size)
+                index = bisect.bisect_right(starts, start - self.resolution)
+            for i in range(index, count):
+                record = _RECORD.unpack_from(data, i * _RECORD.size)
+                if end is not None and record[0] >= end:
+                    break
+                yield record
+        finally:
+            data.close()
+
+
+def open_records(path, size, readonly=False):
+    """打开固定长度（size 字节）记录的文件用于追加，返回 (文件, 完整记录的总字节数)，截掉上次崩溃时写了一半的记录。
+    readonly 时返回的文件为 None，也不截断：写了一半的记录可能是运行中的 App 正在写的，留给 App 处理。
+    readonly 用于 App 运行时从命令行查询（rollup.py、wear.py），如果也追加记录，会和 App 重复写入同样的记录，
+    破坏按时间排序的二分查找。"""
+    if readonly:
+        try:
+            length = os.path.getsize(path)
+        except OSError:
+            length = 0
+        return None, length - length % size
+    f = open(path, 'ab')
+    length = f.tell()
+    if length % size:
+        length -= length % size
+        f.truncate(length)
+    return f, length
+
+
+def last_record(path, record, length):
+    """读取文件中 length 字节之前的最后一条记录，record 为 struct.Struct。"""
+    with open(path, 'rb') as f:
+        f.seek(length - record.size)
+        return record.unpack(f.read(record.size))
+
+
+class RecordKeys(object):
+    # 让 bisect 直接在 mmap 中的固定长度记录上二分查找，key 为记录中 offset 处的 int64（例如开始时间）
+    def __init__(self, data, count, size, offset=0):
+        self.data = data
+        self.count = count
+        self.size = size
+        self.offset = offset
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return struct.unpack_from('<q', self.data, i * self.size + self.offset)[0]
+
+
+class RollupStore(object):
+    def __init__(self, directory, history=None, readonly=False):
+        # readonly（见 open_records）时不写汇总文件，还没汇总的读数只在内存中累加
+        self.directory = directory
+        self.history = history
+        self.readonly = readonly
+        self.levels = [Level(os.path.join(directory, 'rollup-{0}.bin'.format(NAMES[r])), r, readonly)
+                       for r in RESOLUTIONS]
+        self._lock = threading.Lock()
+        self._opened = False
+        self.version = 0  # 每次加入读数加 1，用于缓存由汇总计算出来的结果
+
+    def _open(self):
+        if self._opened:
+            return
+        if not self.readonly:
+            os.makedirs(self.directory, exist_ok=True)
+        for level in self.levels:
+            level.open()
+        self._opened = True
+        if self.history is not None:
+            # 补上次退出时还没汇总的读数（例如最后一个没结束的小时），之后只处理新提交的读数
+            # 多读 MAX_GAP 秒，让第一个时间段的充电时长从前一个读数开始计算
+            marks = [level.watermark for level in self.levels]
+            start = None if None in marks else min(marks) - MAX_GAP
+            self._add((int(r.timestamp), r.fields) for r in self.history.read(start))
+
+    def add(self, samples):
+        """HistoryStore.on_commit 的回调：samples 为 [(秒, 字段), ...]。"""
+        with self._lock:
+            self._open()
+            self._add(samples)
+
+    def _add(self, samples):
+        for t, fields in samples:
+            percentage, charging = fields[1], fields[3] > 0
+            for level in self.levels:
+                level.add(t, percentage, charging)
+        for level in self.levels:
+            level.flush()
+        self.version += 1
+
+    def close(self):
+        with self._lock:
+            for level in self.levels:
+                level.close()
+            self._opened = False
+
+    def select(self, start, end, points=POINTS):
+        """在点数不超过 points 的分辨率中选最细的一个；范围足够短时直接使用原始读数（RAW）。"""
+        for resolution in (RAW,) + RESOLUTIONS:
+            if (end - start) / resolution <= points:
+                return resolution
+        return DAY
+
+    def buckets(self, start=None, end=None, resolution=RAW):
+        """按时间顺序流式产生 [start, end) 之间 resolution 秒的 Bucket，包括还没结束的时间段。"""
+        if resolution == RAW:
+            if self.history is None:
+                return
+            for bucket in aggregate(self.history.read(start, end), RAW):
+                yield bucket
+            return
+        with self._lock:
+            self._open()
+            level = self.levels[RESOLUTIONS.index(resolution)]
+            current = level.accumulator.record
+            current = None if current is None else _bucket(current, resolution)
+        last = None
+        for bucket in level.records(start, end):
+            last = bucket.start
+            yield bucket
+        if current is not None and (last is None or current.start > last) and \
+                (start is None or current.start + resolution > start) and (end is None or current.start < end):
+            yield current
+
+    def query(self, start, end=None, points=POINTS):
+        """返回 [start, end) 之间不超过 points 个 Bucket，自动选择分辨率。"""
+        if end is None:
+            end = time.time()
+        resolution = self.select(start, end, points)
+        buckets = self.buckets(start, end, resolution)
+        k = -(-(end - start) // (resolution * points))
+        if k > 1:
+            buckets = merge(buckets, int(k))
+        return list(buckets)
+
+    def export(self, out, start=None, end=None, resolution=RAW, fmt='csv'):
+        """把 Bucket 逐行写到 out，fmt 为 csv 或 jsonl，返回写出的行数。"""
+        rows = 0
+        if fmt == 'csv':
+            import csv
+            writer = csv.writer(out)
+            writer.writerow(Bucket._fields)
+            for bucket in self.buckets(start, end, resolution):
+                writer.writerow(bucket)
+                rows += 1
+        elif fmt == 'jsonl':
+            import json
+            for bucket in self.buckets(start, end, resolution):
+                out.write(json.dumps(bucket._asdict()) + '\n')
+                rows += 1
+        else:
+            raise ValueError('unknown export format {0!r}, expected {1}'.format(fmt, ' or '.join(FORMATS)))
+        return rows
+
+
+def main(argv):
+    """用法：python rollup.py 历史目录 [raw|minute|hour|day] [csv|jsonl] [天数]"""
+    import history
+    if not argv:
+        print(main.__doc__)
+        return 2
+    resolutions = dict((name, resolution) for resolution, name in NAMES.items())
+    resolutions['raw'] = RAW
+    fmt = argv[2] if len(argv) > 2 else 'csv'
+    try:
+        resolution = resolutions[argv[1]] if len(argv) > 1 else HOUR
+        days = float(argv[3]) if len(argv) > 3 else None
+        if fmt not in FORMATS:
+            raise ValueError(fmt)
+    except (KeyError, ValueError):
+        # 参数在打开文件之前检查，不要等到导出时才失败
+        print(main.__doc__)
+        return 2
+    start = time.time() - days * DAY if days is not None else None
+    store = RollupStore(argv[0], history.HistoryStore(argv[0]), readonly=True)
+    store.export(sys.stdout, start, None, resolution, fmt)
+    store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -23,8 +23,10 @@ __license__ = 'Modified BSD'
 __copyright__ = 'Copyright 2020 Jared Suttles'
 
 from . import notifications as _notifications
+from .dispatch import main_thread
+from .notifications import NotificationQueue, CompactSerializer
 from .rumps import (separator, debug_mode, alert, application_support, timers, quit_application, timer,
-                    clicked, MenuItem, SliderMenuItem, Timer, Window, App, slider)
+                    clicked, MenuItem, SliderMenuItem, Timer, Window, App, slider, image_cache_info, clear_image_cache)
 
 notifications = _notifications.on_notification
 notification = _notifications.notify
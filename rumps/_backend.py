@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""
+rumps._backend
+~~~~~~~~~~~~~~
+
+Selects the implementation of ``Foundation``, ``AppKit`` and ``PyObjCTools.AppHelper`` used by rumps. The default,
+``cocoa``, is PyObjC. Setting the environment variable ``RUMPS_BACKEND=headless`` before importing rumps swaps in the
+pure-Python fakes from :mod:`rumps._headless` so applications can run, be tested and be profiled without macOS.
+
+:copyright: (c) 2020 by Jared Suttles
+:license: BSD-3-Clause, see LICENSE for details.
+"""
+
+import os
+
+BACKEND = os.environ.get('RUMPS_BACKEND', 'cocoa')
+
+if BACKEND == 'cocoa':
+    # Plain imports for compatibility with pyinstaller
+    # See: http://stackoverflow.com/questions/21058889/pyinstaller-not-finding-pyobjc-library-macos-python
+    import Foundation
+    import AppKit
+    from PyObjCTools import AppHelper
+elif BACKEND == 'headless':
+    from . import _headless as Foundation
+    from . import _headless as AppKit
+    from ._headless import AppHelper
+else:
+    raise ImportError('unknown RUMPS_BACKEND {0!r}, expected cocoa or headless'.format(BACKEND))
@@ -0,0 +1,598 @@
+# -*- coding: utf-8 -*-
+
+"""
+rumps._headless
+~~~~~~~~~~~~~~~
+
+Pure-Python stand-ins for the parts of Foundation, AppKit and PyObjCTools.AppHelper that rumps uses, selected with
+``RUMPS_BACKEND=headless``. Nothing is drawn; menus, status items and timers are plain objects that tests can inspect
+and drive.
+
+Time is virtual by default: the run loop jumps straight to the next timer instead of sleeping, so hours of timer
+activity run in milliseconds and always in the same order. ``RUMPS_HEADLESS_CLOCK=real`` follows the wall clock
+instead, and ``RUMPS_HEADLESS_RUN_FOR`` bounds :meth:`AppHelper.runEventLoop` to that many (virtual) seconds.
+
+.. code-block:: python
+
+    os.environ['RUMPS_BACKEND'] = 'headless'
+    import rumps
+    from rumps import _headless
+
+    app = MyApp()
+    rumps.Timer(app.tick, 1).start()
+    _headless.advance(60)           # sixty ticks, instantly
+    _headless.spend(2.5)            # inside a callback: pretend it was slow
+    print(_headless.status_item().title(), _headless.counters)
+
+:copyright: (c) 2020 by Jared Suttles
+:license: BSD-3-Clause, see LICENSE for details.
+"""
+
+from __future__ import print_function
+
+import collections
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+
+#: Number of calls per ``Class.selector`` for every setter and menu operation, plus ``off_main_thread`` for user
+#: interface changes made from another thread.
+counters = collections.Counter()
+
+#: ``(title, message)`` of every alert shown.
+alerts = []
+
+_main_thread = threading.current_thread()
+_strict = os.environ.get('RUMPS_HEADLESS_STRICT') == '1'  # raise instead of counting off-main-thread changes
+
+NSDefaultRunLoopMode = 'kCFRunLoopDefaultMode'
+NSWorkspaceWillSleepNotification = 'NSWorkspaceWillSleepNotification'
+NSWorkspaceDidWakeNotification = 'NSWorkspaceDidWakeNotification'
+NSKeyDown = 10
+NSCommandKeyMask = 1 << 20
+
+
+class _RunLoop(object):
+    """Single run loop holding the timers and the calls queued from other threads."""
+
+    def __init__(self, real_time=False):
+        self.real_time = real_time
+        self._virtual = 0.0
+        self._started = time.monotonic()
+        self._timers = []  # heap of (fire time, order, function)
+        self._order = itertools.count()
+        self._calls = collections.deque()
+        self._wakeup = threading.Condition()
+        self._stopped = False
+
+    def now(self):
+        if self.real_time:
+            return time.monotonic() - self._started
+        return self._virtual
+
+    def schedule(self, when, func):
+        with self._wakeup:
+            heapq.heappush(self._timers, (when, next(self._order), func))
+            self._wakeup.notify()
+
+    def call_after(self, func):
+        with self._wakeup:
+            self._calls.append(func)
+            self._wakeup.notify()
+
+    def stop(self):
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify()
+
+    def run(self, deadline=float('inf'), wait=True):
+        """Run queued calls and due timers until `deadline` or :meth:`stop`. With a virtual clock and `wait` false the
+        clock jumps to `deadline` once nothing is due before it. Returns the number of callbacks run."""
+        self._stopped = False
+        count = 0
+        while True:
+            with self._wakeup:
+                if self._stopped:
+                    break
+                if self._calls:
+                    func = self._calls.popleft()
+                else:
+                    due = self._timers[0][0] if self._timers else None
+                    now = self.now()
+                    if due is not None and due <= deadline and (not self.real_time or due <= now):
+                        func = heapq.heappop(self._timers)[2]
+                        if not self.real_time:
+                            self._virtual = max(self._virtual, due)
+                    elif self.real_time:
+                        if now >= deadline:
+                            break
+                        timeout = min(deadline, due if due is not None else deadline) - now
+                        self._wakeup.wait(None if timeout == float('inf') else timeout)
+                        continue
+                    elif wait and deadline == float('inf'):
+                        self._wakeup.wait()  # nothing scheduled: only another thread can give us work
+                        continue
+                    else:
+                        self._virtual = max(self._virtual, deadline)
+                        break
+            try:
+                func()
+            except Exception:
+                traceback.print_exc()
+            count += 1
+        return count
+
+
+run_loop = _RunLoop(os.environ.get('RUMPS_HEADLESS_CLOCK', 'virtual') == 'real')
+
+
+def now():
+    """Seconds since the headless backend was loaded, on the virtual or the real clock."""
+    return run_loop.now()
+
+
+def advance(seconds):
+    """Run everything due within the next `seconds` and return the number of callbacks run."""
+    return run_loop.run(run_loop.now() + seconds, wait=False)
+
+
+def spend(seconds):
+    """Move the virtual clock forward without running anything, as if the current callback took `seconds`."""
+    with run_loop._wakeup:
+        run_loop._virtual += seconds
+
+
+class NSObject(object):
+    """Base class following the PyObjC conventions used by rumps: ``alloc().init()`` construction and
+    ``setFoo_(value)`` / ``foo()`` / ``isFoo()`` accessors backed by a dictionary. Other selectors do nothing."""
+
+    @classmethod
+    def alloc(cls):
+        self = cls.__new__(cls)
+        self._properties = {}
+        return self
+
+    def init(self):
+        return self
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name.startswith('set') and name.endswith('_') and name[3:4].isupper():
+            key = name[3].lower() + name[4:-1]
+            return lambda value: self._set(name, key, value)
+        if name.endswith('_'):
+            return lambda *args: None
+        if name.startswith('is') and name[2:3].isupper():
+            name = name[2].lower() + name[3:]
+        return lambda: self._properties.get(name)
+
+    def _set(self, selector, key, value):
+        if threading.current_thread() is not _main_thread:
+            if _strict:
+                raise RuntimeError('{0}.{1} called off the main thread'.format(type(self).__name__, selector))
+            counters['off_main_thread'] += 1
+        counters[type(self).__name__ + '.' + selector] += 1
+        self._properties[key] = value
+
+
+def _send(target, action, sender):
+    # perform an Objective-C style action such as 'callback:' on a target object or class
+    if target is not None and action is not None:
+        return getattr(target, action.replace(':', '_'))(sender)
+
+
+# Foundation
+#- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+class NSDate(NSObject):
+    @classmethod
+    def date(cls):
+        return cls.dateWithTimeIntervalSinceNow_(0)
+
+    @classmethod
+    def dateWithTimeIntervalSinceNow_(cls, seconds):
+        self = cls.alloc()
+        self._time = run_loop.now() + seconds
+        return self
+
+    @classmethod
+    def dateWithTimeInterval_sinceDate_(cls, seconds, date):
+        self = cls.alloc()
+        self._time = date._time + seconds
+        return self
+
+    def timeIntervalSinceNow(self):
+        return self._time - run_loop.now()
+
+    def timeIntervalSinceDate_(self, date):
+        return self._time - date._time
+
+
+class NSTimer(NSObject):
+    def initWithFireDate_interval_target_selector_userInfo_repeats_(self, date, interval, target, selector, user_info,
+                                                                     repeats):
+        self._fire_time = date._time
+        self._interval = max(interval, 0.0001) if repeats else interval
+        self._target = target
+        self._selector = selector
+        self._user_info = user_info
+        self._repeats = repeats
+        self._valid = True
+        self._tolerance = 0.0
+        return self
+
+    def setTolerance_(self, tolerance):
+        self._tolerance = tolerance
+
+    def tolerance(self):
+        return self._tolerance
+
+    def timeInterval(self):
+        return self._interval if self._repeats else 0.0
+
+    def fireDate(self):
+        return NSDate.dateWithTimeIntervalSinceNow_(self._fire_time - run_loop.now())
+
+    def userInfo(self):
+        return self._user_info
+
+    def isValid(self):
+        return self._valid
+
+    def invalidate(self):
+        self._valid = False
+
+    def fire(self):
+        if not self._valid:
+            return
+        if self._repeats:
+            # like Cocoa, ticks missed while the run loop was busy are skipped rather than fired in a burst
+            late = run_loop.now() - self._fire_time
+            self._fire_time += self._interval * (int(late // self._interval) + 1 if late >= 0 else 1)
+            run_loop.schedule(self._fire_time, self.fire)
+        else:
+            self._valid = False
+        counters['NSTimer.fire'] += 1
+        _send(self._target, self._selector, self)
+
+
+class NSRunLoop(NSObject):
+    @classmethod
+    def currentRunLoop(cls):
+        return cls.alloc()
+
+    def addTimer_forMode_(self, timer, mode):
+        run_loop.schedule(timer._fire_time, timer.fire)
+
+
+class _NSArray(list):
+    def objectAtIndex_(self, index):
+        return self[index]
+
+
+def NSSearchPathForDirectoriesInDomains(directory, domain_mask, expand_tilde):
+    # only NSApplicationSupportDirectory (14) is used by rumps
+    home = os.environ.get('RUMPS_HEADLESS_HOME') or os.path.join(tempfile.gettempdir(), 'rumps-headless')
+    path = os.path.join(home, 'Application Support')
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    return _NSArray([path])
+
+
+def NSMakeRect(x, y, width, height):
+    return (x, y), (width, height)
+
+
+def NSSize(width, height):
+    return width, height
+
+
+def NSLog(message):
+    print(message, file=sys.stderr)
+
+
+class NSString(NSObject):
+    def initWithString_(self, string):
+        return string
+
+
+class NSData(NSObject):
+    def initWithData_(self, data):
+        return bytes(data)
+
+
+class NSMutableDictionary(dict):
+    @classmethod
+    def alloc(cls):
+        return cls()
+
+    def init(self):
+        return self
+
+    def setDictionary_(self, other):
+        self.clear()
+        self.update(other)
+
+
+class NSUserDefaults(NSObject):
+    _standard = None
+
+    @classmethod
+    def standardUserDefaults(cls):
+        if cls._standard is None:
+            cls._standard = cls.alloc().init()
+        return cls._standard
+
+    def stringForKey_(self, key):
+        return self._properties.get(key)
+
+
+class NSUserNotification(NSObject):
+    pass
+
+
+class NSUserNotificationCenter(NSObject):
+    _default = None
+
+    @classmethod
+    def defaultUserNotificationCenter(cls):
+        if cls._default is None:
+            cls._default = cls.alloc().init()
+            cls._default._delivered = []
+        return cls._default
+
+    def scheduleNotification_(self, notification):
+        counters['NSUserNotificationCenter.scheduleNotification_'] += 1
+        self._delivered.append(notification)
+
+    def deliveredNotifications(self):
+        return list(self._delivered)
+
+    def removeDeliveredNotification_(self, notification):
+        if notification in self._delivered:
+            self._delivered.remove(notification)
+
+    def activate(self, notification):
+        """Simulate the user clicking on a delivered `notification`."""
+        self.delegate().userNotificationCenter_didActivateNotification_(self, notification)
+
+
+class NSNotificationCenter(NSObject):
+    def init(self):
+        self._observers = []
+        return self
+
+    def addObserver_selector_name_object_(self, observer, selector, name, obj):
+        self._observers.append((observer, selector, name))
+
+    def postNotificationName_object_(self, name, obj):
+        for observer, selector, observed in list(self._observers):
+            if observed == name:
+                if callable(selector):
+                    selector(None)
+                else:
+                    _send(observer, selector, None)
+
+
+# AppKit
+#- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+class NSApplication(NSObject):
+    _shared = None
+
+    @classmethod
+    def sharedApplication(cls):
+        if cls._shared is None:
+            cls._shared = cls.alloc().init()
+        return cls._shared
+
+    def terminate_(self, sender):
+        delegate = self.delegate()
+        if delegate is not None:
+            delegate.applicationWillTerminate_(None)
+        run_loop.stop()
+
+
+class NSWorkspace(NSObject):
+    _shared = None
+
+    @classmethod
+    def sharedWorkspace(cls):
+        if cls._shared is None:
+            cls._shared = cls.alloc().init()
+            cls._shared._notification_center = NSNotificationCenter.alloc().init()
+        return cls._shared
+
+    def notificationCenter(self):
+        return self._notification_center
+
+
+def sleep():
+    """Simulate the computer going to sleep."""
+    NSWorkspace.sharedWorkspace().notificationCenter().postNotificationName_object_(NSWorkspaceWillSleepNotification,
+                                                                                    None)
+
+
+def wake():
+    """Simulate the computer waking up."""
+    NSWorkspace.sharedWorkspace().notificationCenter().postNotificationName_object_(NSWorkspaceDidWakeNotification,
+                                                                                    None)
+
+
+class NSAppearance(NSObject):
+    @classmethod
+    def appearanceNamed_(cls, name):
+        return name
+
+
+class NSImage(NSObject):
+    def initByReferencingFile_(self, path):
+        self._properties['path'] = path
+        return self
+
+
+class NSMenuItem(NSObject):
+    def init(self):
+        return self.initWithTitle_action_keyEquivalent_('', None, '')
+
+    def initWithTitle_action_keyEquivalent_(self, title, action, key):
+        self._properties.update(title=title, action=action, keyEquivalent=key, state=0, hidden=False)
+        self._menu = None
+        self._separator = False
+        return self
+
+    @classmethod
+    def separatorItem(cls):
+        item = cls.alloc().init()
+        item._separator = True
+        return item
+
+    def isSeparatorItem(self):
+        return self._separator
+
+    def menu(self):
+        return self._menu
+
+
+class NSMenu(NSObject):
+    def init(self):
+        self._items = []
+        return self
+
+    def numberOfItems(self):
+        return len(self._items)
+
+    def itemArray(self):
+        return list(self._items)
+
+    def itemAtIndex_(self, index):
+        return self._items[index]
+
+    def indexOfItem_(self, item):
+        counters['NSMenu.indexOfItem_'] += 1
+        try:
+            return self._items.index(item)
+        except ValueError:
+            return -1
+
+    def addItem_(self, item):
+        self.insertItem_atIndex_(item, len(self._items))
+
+    def insertItem_atIndex_(self, item, index):
+        if item._menu is not None:  # NSInternalInconsistencyException in Cocoa
+            raise ValueError('item to be inserted into menu already is in another menu')
+        counters['NSMenu.insertItem_atIndex_'] += 1
+        item._menu = self
+        self._items.insert(index, item)
+
+    def removeItem_(self, item):
+        counters['NSMenu.removeItem_'] += 1
+        self._items.remove(item)
+        item._menu = None
+
+    def removeAllItems(self):
+        counters['NSMenu.removeAllItems'] += 1
+        for item in self._items:
+            item._menu = None
+        self._items = []
+
+    def update(self):
+        """Simulate the menu being opened: let the delegate populate it first."""
+        delegate = self.delegate()
+        if delegate is not None:
+            delegate.menuNeedsUpdate_(self)
+
+    def performActionForItemAtIndex_(self, index):
+        item = self._items[index]
+        return _send(item.target(), item.action(), item)
+
+
+class NSStatusItem(NSObject):
+    pass
+
+
+class NSStatusBar(NSObject):
+    _system = None
+
+    @classmethod
+    def systemStatusBar(cls):
+        if cls._system is None:
+            cls._system = cls.alloc().init()
+            cls._system._items = []
+        return cls._system
+
+    def statusItemWithLength_(self, length):
+        item = NSStatusItem.alloc().init()
+        self._items.append(item)
+        return item
+
+
+def status_item():
+    """The most recently created status item, normally the one of the running :class:`rumps.App`."""
+    items = NSStatusBar.systemStatusBar()._items
+    return items[-1] if items else None
+
+
+class NSAlert(NSObject):
+    #: Value returned by :meth:`runModal`, 1 being the default button.
+    response = 1
+
+    @classmethod
+    def alertWithMessageText_defaultButton_alternateButton_otherButton_informativeTextWithFormat_(
+            cls, title, ok, cancel, other, message):
+        self = cls.alloc().init()
+        self._properties.update(messageText=title, informativeText=message, buttons=[ok, cancel, other])
+        return self
+
+    def runModal(self):
+        alerts.append((self._properties.get('messageText'), self._properties.get('informativeText')))
+        return self.response
+
+
+class NSTextField(NSObject):
+    def initWithFrame_(self, frame):
+        self._properties['frame'] = frame
+        return self
+
+
+class NSSecureTextField(NSTextField):
+    pass
+
+
+class NSSlider(NSObject):
+    pass
+
+
+# PyObjCTools
+#- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+class AppHelper(object):
+    @staticmethod
+    def callAfter(func, *args, **kwargs):
+        run_loop.call_after(lambda: func(*args, **kwargs))
+
+    @staticmethod
+    def callLater(delay, func, *args, **kwargs):
+        run_loop.schedule(run_loop.now() + delay, lambda: func(*args, **kwargs))
+
+    @staticmethod
+    def installMachInterrupt():
+        pass
+
+    @staticmethod
+    def runEventLoop(*args, **kwargs):
+        delegate = NSApplication.sharedApplication().delegate()
+        if delegate is not None:
+            delegate.applicationDidFinishLaunching_(None)
+        run_for = os.environ.get('RUMPS_HEADLESS_RUN_FOR')
+        run_loop.run(float('inf') if run_for is None else run_loop.now() + float(run_for))
+
+    @staticmethod
+    def stopEventLoop():
+        run_loop.stop()
@@ -2,13 +2,12 @@
 
 from __future__ import print_function
 
-import inspect
 import traceback
-
-import Foundation
+import types
 
 from . import compat
 from . import exceptions
+from ._backend import Foundation
 
 
 def require_string(*objs):
@@ -27,25 +26,76 @@ def require_string_or_none(*objs):
             )
 
 
+# (app, {function: bound method}) for the running App instance, or None when it has to be rebuilt
+_method_cache = None
+
+
+def build_method_cache(app):
+    """Map every function reachable as a method of `app` to the corresponding bound method.
+
+    Names are resolved the same way attribute lookup does (instance dictionary first, then the class MRO) but without
+    evaluating properties or other descriptors, so building the cache never calls into PyObjC.
+    """
+    global _method_cache
+    methods = {}
+    seen = set()
+    for name, value in getattr(app, '__dict__', {}).items():
+        seen.add(name)
+        if isinstance(value, types.MethodType):
+            methods.setdefault(value.__func__, value)
+    for cls in type(app).__mro__:
+        for name, value in vars(cls).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(value, types.FunctionType):
+                methods.setdefault(value, types.MethodType(value, app))
+            elif isinstance(value, classmethod):
+                methods.setdefault(value.__func__, types.MethodType(value.__func__, type(app)))
+    _method_cache = app, methods
+    return methods
+
+
+def invalidate_method_cache():
+    """Force the method cache to be rebuilt on the next callback dispatch."""
+    global _method_cache
+    _method_cache = None
+
+
 def call_as_function_or_method(func, *args, **kwargs):
     # The idea here is that when using decorators in a class, the functions passed are not bound so we have to
     # determine later if the functions we have (those saved as callbacks) for particular events need to be passed
     # 'self'.
     #
     # This works for an App subclass method or a standalone decorated function. Will attempt to find function as
-    # a bound method of the App instance. If it is found, use it, otherwise simply call function.
+    # a bound method of the App instance. If it is found, use it, otherwise simply call function. The lookup goes
+    # through a cache built at App.run() instead of reflecting over the whole App instance on every call.
     from . import rumps
     try:
         app = getattr(rumps.App, '*app_instance')
     except AttributeError:
         pass
     else:
-        for name, method in inspect.getmembers(app, predicate=inspect.ismethod):
-            if method.__func__ is func:
-                return method(*args, **kwargs)
+        cache = _method_cache
+        methods = cache[1] if cache is not None and cache[0] is app else build_method_cache(app)
+        method = methods.get(func)
+        if method is not None:
+            return method(*args, **kwargs)
     return func(*args, **kwargs)
 
 
+_worker_pool = None
+
+
+def worker_pool():
+    """Return the thread pool shared by background timers, created on first use."""
+    global _worker_pool
+    if _worker_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _worker_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='rumps-worker')
+    return _worker_pool
+
+
 def guard_unexpected_errors(func):
     """Decorator to be used in PyObjC callbacks where an error bubbling up
     would cause a crash. Instead of crashing, print the error to stderr and
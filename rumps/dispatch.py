@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+rumps.dispatch
+~~~~~~~~~~~~~~
+
+Queue user interface updates from any thread and apply them on the main thread.
+
+:copyright: (c) 2020 by Jared Suttles
+:license: BSD-3-Clause, see LICENSE for details.
+"""
+
+import collections
+import threading
+import traceback
+
+from ._backend import AppHelper
+
+
+class UpdateQueue(object):
+    """Collects property assignments and calls made from any thread and applies them on the main thread.
+
+    Writes to the same property of the same object are collapsed into the last value, so a burst of updates between
+    two run loop iterations causes a single assignment (and a single redraw). All pending updates are applied in one
+    pass, in the order they were first queued.
+
+    .. code-block:: python
+
+        def reader_thread():
+            for reading in readings():
+                rumps.main_thread.set(app, 'title', '{0}%'.format(reading))
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = collections.OrderedDict()
+        self._scheduled = False
+        self.queued = 0
+        self.applied = 0
+
+    def set(self, target, name, value):
+        """Assign ``target.name = value`` on the main thread, replacing any pending value for the same property."""
+        self._put((id(target), name), (setattr, target, name, value))
+
+    def call(self, key, func, *args):
+        """Call ``func(*args)`` on the main thread, replacing any pending call queued with the same hashable `key`."""
+        self._put(key, (func,) + args)
+
+    def _put(self, key, action):
+        with self._lock:
+            self.queued += 1
+            self._pending[key] = action
+            if self._scheduled:
+                return
+            self._scheduled = True
+        AppHelper.callAfter(self.flush)
+
+    def flush(self):
+        """Apply every pending update now. Called automatically on the main thread."""
+        with self._lock:
+            pending, self._pending = self._pending, collections.OrderedDict()
+            self._scheduled = False
+        for action in pending.values():
+            try:
+                action[0](*action[1:])
+            except Exception:
+                traceback.print_exc()
+        self.applied += len(pending)
+        return len(pending)
+
+    @property
+    def coalesced(self):
+        """The number of queued updates that were replaced by a newer one before being applied."""
+        with self._lock:
+            return self.queued - self.applied - len(self._pending)
+
+
+main_thread = UpdateQueue()
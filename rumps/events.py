@@ -1,34 +1,152 @@
 # -*- coding: utf-8 -*-
 
+from __future__ import print_function
+
+import bisect
+import itertools
+import sys
+import threading
+import time
 import traceback
 
 from . import _internal
 
 
+class _Handler(object):
+    __slots__ = ('func', 'background', 'timeout', 'running')
+
+    def __init__(self, func, background, timeout):
+        self.func = func
+        self.background = background
+        self.timeout = timeout
+        self.running = False
+
+
 class EventEmitter(object):
+    """Calls registered callbacks when the event is emitted.
+
+    Callbacks run in order of decreasing `priority`, and in registration order for equal priorities. A callback
+    registered with ``background=True`` runs on the shared rumps worker pool instead of the emitting thread (usually
+    the main thread), so a slow handler never stalls the run loop; it is skipped while a previous call is still in
+    flight. If it has not finished after `timeout` seconds the call is cancelled when still queued, or reported and
+    counted as timed out when already running (Python threads cannot be interrupted).
+
+    .. code-block:: python
+
+        @rumps.events.on_wake.register(priority=10, background=True, timeout=5)
+        def reconnect():
+            serial_port.reopen()
+
+    """
+
     def __init__(self, name):
         self.name = name
-        self.callbacks = set()
+        self._keys = []
+        self._handlers = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
         self._executor = _internal.call_as_function_or_method
+        self._stats = dict(emits=0, calls=0, errors=0, skipped=0, timeouts=0,
+                           latency_total=0.0, latency_max=0.0, duration_total=0.0, duration_max=0.0)
+
+    @property
+    def callbacks(self):
+        """The registered callbacks, in the order they are called."""
+        return [handler.func for handler in self._handlers]
 
-    def register(self, func):
-        self.callbacks.add(func)
+    def register(self, func=None, priority=0, background=False, timeout=None):
+        if func is None:
+            return lambda f: self.register(f, priority, background, timeout)
+        _internal.invalidate_method_cache()
+        with self._lock:
+            # lists are replaced rather than mutated so emit() can iterate without holding the lock
+            keys, handlers = self._without(func)
+            key = (-priority, next(self._order))
+            index = bisect.bisect(keys, key)
+            keys.insert(index, key)
+            handlers.insert(index, _Handler(func, background, timeout))
+            self._keys, self._handlers = keys, handlers
         return func
 
     def unregister(self, func):
-        try:
-            self.callbacks.remove(func)
+        with self._lock:
+            keys, handlers = self._without(func)
+            if len(handlers) == len(self._handlers):
+                return False
+            self._keys, self._handlers = keys, handlers
             return True
-        except KeyError:
-            return False
+
+    def _without(self, func):
+        pairs = [(key, handler) for key, handler in zip(self._keys, self._handlers) if handler.func != func]
+        return [key for key, _ in pairs], [handler for _, handler in pairs]
 
     def emit(self, *args, **kwargs):
-        #print('EventEmitter("%s").emit called' % self.name)
-        for callback in self.callbacks:
-            try:
-                self._executor(callback, *args, **kwargs)
-            except Exception:
-                traceback.print_exc()
+        emitted = time.perf_counter()
+        with self._lock:
+            self._stats['emits'] += 1
+        for handler in self._handlers:
+            if handler.background:
+                self._submit(handler, emitted, args, kwargs)
+            else:
+                self._call(handler, emitted, args, kwargs)
+
+    def _call(self, handler, emitted, args, kwargs):
+        started = time.perf_counter()
+        failed = False
+        try:
+            self._executor(handler.func, *args, **kwargs)
+        except Exception:
+            traceback.print_exc()
+            failed = True
+        finished = time.perf_counter()
+        with self._lock:
+            stats = self._stats
+            stats['calls'] += 1
+            stats['errors'] += failed
+            stats['latency_total'] += started - emitted
+            stats['latency_max'] = max(stats['latency_max'], started - emitted)
+            stats['duration_total'] += finished - started
+            stats['duration_max'] = max(stats['duration_max'], finished - started)
+
+    def _submit(self, handler, emitted, args, kwargs):
+        with self._lock:
+            if handler.running:
+                self._stats['skipped'] += 1
+                return
+            handler.running = True
+        future = _internal.worker_pool().submit(self._run_in_background, handler, emitted, args, kwargs)
+        if handler.timeout is not None:
+            watchdog = threading.Timer(handler.timeout, self._check_timeout, (handler, future))
+            watchdog.daemon = True
+            watchdog.start()
+            future.add_done_callback(lambda _: watchdog.cancel())
+
+    def _run_in_background(self, handler, emitted, args, kwargs):
+        try:
+            self._call(handler, emitted, args, kwargs)
+        finally:
+            handler.running = False
+
+    def _check_timeout(self, handler, future):
+        if future.done():
+            return
+        if future.cancel():
+            handler.running = False
+        with self._lock:
+            self._stats['timeouts'] += 1
+        print('rumps: {0} handler {1!r} did not finish within {2}s'.format(self.name, handler.func, handler.timeout),
+              file=sys.stderr)
+
+    def metrics(self):
+        """Return dispatch counters and timings for this event. `latency` is the delay between :meth:`emit` and a
+        callback starting (time spent queued for background callbacks), `duration` how long callbacks ran.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        calls = stats['calls']
+        stats['latency_mean'] = stats['latency_total'] / calls if calls else 0.0
+        stats['duration_mean'] = stats['duration_total'] / calls if calls else 0.0
+        return stats
 
     __call__ = register
 
@@ -1,21 +1,22 @@
 # -*- coding: utf-8 -*-
 
-_ENABLED = True
-try:
-    from Foundation import NSUserNotification, NSUserNotificationCenter
-except ImportError:
-    _ENABLED = False
-
-import datetime
+import collections
 import os
 import sys
+import threading
+import time
 import traceback
 
-import Foundation
-
 from . import _internal
 from . import compat
 from . import events
+from ._backend import AppHelper, Foundation
+
+_ENABLED = True
+try:
+    NSUserNotification, NSUserNotificationCenter = Foundation.NSUserNotification, Foundation.NSUserNotificationCenter
+except AttributeError:
+    _ENABLED = False
 
 
 def on_notification(f):
@@ -231,6 +232,7 @@ class Notification(compat.collections_abc.Mapping):
     def delivered_at(self):
         ns_date = self._ns.actualDeliveryDate()
         seconds = ns_date.timeIntervalSince1970()
+        import datetime
         dt = datetime.datetime.fromtimestamp(seconds)
         return dt
 
@@ -264,3 +266,134 @@ class Notification(compat.collections_abc.Mapping):
     def __len__(self):
         self._check_if_mapping()
         return len(self._data)
+
+
+#: Apple's guidance for the serialized size of a notification's userInfo.
+USER_INFO_LIMIT = 1024
+
+
+class CompactSerializer(object):
+    """Serializer for notification data producing compact JSON, compressed with zlib when that is smaller. Raises
+    ``ValueError`` when the result exceeds `max_size` bytes instead of letting Notification Center reject it. Use it
+    by setting :attr:`rumps.App.serializer`. Only JSON types are supported.
+
+    .. versionadded:: 0.4.0
+    """
+
+    def __init__(self, max_size=USER_INFO_LIMIT):
+        self.max_size = max_size
+
+    def dumps(self, obj):
+        import json
+        import zlib
+        plain = json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        packed = zlib.compress(plain, 9)
+        dumped = b'z' + packed if len(packed) < len(plain) else b'j' + plain
+        if self.max_size is not None and len(dumped) > self.max_size:
+            raise ValueError('notification data is {0} bytes once serialized, the limit is {1}'.format(
+                len(dumped), self.max_size))
+        return dumped
+
+    def loads(self, data):
+        import json
+        data = bytes(data)
+        if data[:1] == b'z':
+            import zlib
+            return json.loads(zlib.decompress(data[1:]).decode('utf-8'))
+        return json.loads(data[1:].decode('utf-8'))
+
+
+class NotificationQueue(object):
+    """Delivers notifications through :func:`rumps.notification` with coalescing, a rate limit and quiet hours.
+
+    A notification pushed with the `key` of one still waiting replaces it, so a fast stream of updates only shows the
+    latest. At most `limit` notifications are delivered per `period` seconds, and none while the local time is within
+    `quiet_hours`, a ``(start, end)`` pair of hours such as ``(22, 7)`` or ``(22.5, 7)`` for 22:30. Held
+    notifications are delivered in the order they were first pushed once allowed. May be used from any thread;
+    delivery happens on the main thread.
+
+    .. versionadded:: 0.4.0
+
+    :param limit: the number of notifications that may be delivered within `period` seconds.
+    :param period: the length of the rate limiting window in seconds.
+    :param quiet_hours: a ``(start, end)`` pair of local hours, or ``None``.
+    :param clock: function returning the current time in seconds since the epoch.
+    :param deliver: function called with the arguments of :func:`rumps.notification`.
+    """
+
+    def __init__(self, limit=5, period=60.0, quiet_hours=None, clock=None, deliver=None):
+        self.limit = limit
+        self.period = period
+        self.quiet_hours = quiet_hours
+        self._clock = clock or time.time
+        self._deliver = deliver or notify
+        self._lock = threading.Lock()
+        self._pending = collections.OrderedDict()
+        self._sent = collections.deque()  # delivery times within the last period
+        self._anonymous = 0
+        self._scheduled = False
+        self.delivered = 0
+        self.coalesced = 0
+
+    def push(self, title, subtitle, message, key=None, **kwargs):
+        """Queue a notification taking the same arguments as :func:`rumps.notification`. Without a `key` it is never
+        replaced by another one."""
+        with self._lock:
+            if key is None:
+                self._anonymous += 1
+                key = (NotificationQueue, self._anonymous)
+            elif key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = (title, subtitle, message), kwargs
+        self._schedule(0)
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def quiet_remaining(self, now=None):
+        """Return the number of seconds until the quiet hours end, or ``0`` outside of them."""
+        if self.quiet_hours is None:
+            return 0
+        local = time.localtime(self._clock() if now is None else now)
+        hour = local.tm_hour + local.tm_min / 60.0 + local.tm_sec / 3600.0
+        start, end = self.quiet_hours
+        if not (start <= hour < end if start <= end else hour >= start or hour < end):
+            return 0
+        return ((end - hour) % 24) * 3600
+
+    def flush(self):
+        """Deliver as many pending notifications as currently allowed. Called automatically on the main thread;
+        returns the number delivered."""
+        now = self._clock()
+        with self._lock:
+            self._scheduled = False
+            while self._sent and self._sent[0] <= now - self.period:
+                self._sent.popleft()
+            wait = self.quiet_remaining(now)
+            batch = []
+            if not wait:
+                while self._pending and len(self._sent) < self.limit:
+                    batch.append(self._pending.popitem(last=False)[1])
+                    self._sent.append(now)
+                if self._pending:
+                    wait = self._sent[0] + self.period - now
+            self.delivered += len(batch)
+        for args, kwargs in batch:
+            try:
+                self._deliver(*args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+        if wait:
+            self._schedule(wait)
+        return len(batch)
+
+    def _schedule(self, delay):
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        if delay:
+            AppHelper.callLater(delay, self.flush)
+        else:
+            AppHelper.callAfter(self.flush)
@@ -5,18 +5,21 @@
 # License: BSD, see LICENSE for details.
 
 
-# For compatibility with pyinstaller
-# See: http://stackoverflow.com/questions/21058889/pyinstaller-not-finding-pyobjc-library-macos-python
-import Foundation
-import AppKit
-
-from Foundation import (NSDate, NSTimer, NSRunLoop, NSDefaultRunLoopMode, NSSearchPathForDirectoriesInDomains,
-                        NSMakeRect, NSLog, NSObject, NSMutableDictionary, NSString, NSUserDefaults)
-from AppKit import NSApplication, NSStatusBar, NSMenu, NSMenuItem, NSAlert, NSTextField, NSSecureTextField, NSImage, NSSlider, NSSize, NSWorkspace, NSWorkspaceWillSleepNotification, NSWorkspaceDidWakeNotification
-from PyObjCTools import AppHelper
-
+from ._backend import Foundation, AppKit, AppHelper
+
+NSDate, NSTimer, NSRunLoop = Foundation.NSDate, Foundation.NSTimer, Foundation.NSRunLoop
+NSDefaultRunLoopMode = Foundation.NSDefaultRunLoopMode
+NSSearchPathForDirectoriesInDomains = Foundation.NSSearchPathForDirectoriesInDomains
+NSMakeRect, NSLog, NSObject = Foundation.NSMakeRect, Foundation.NSLog, Foundation.NSObject
+NSMutableDictionary, NSString, NSUserDefaults = Foundation.NSMutableDictionary, Foundation.NSString, Foundation.NSUserDefaults
+NSApplication, NSStatusBar, NSMenu, NSMenuItem = AppKit.NSApplication, AppKit.NSStatusBar, AppKit.NSMenu, AppKit.NSMenuItem
+NSAlert, NSTextField, NSSecureTextField = AppKit.NSAlert, AppKit.NSTextField, AppKit.NSSecureTextField
+NSImage, NSSlider, NSSize, NSWorkspace = AppKit.NSImage, AppKit.NSSlider, AppKit.NSSize, AppKit.NSWorkspace
+NSWorkspaceWillSleepNotification = AppKit.NSWorkspaceWillSleepNotification
+NSWorkspaceDidWakeNotification = AppKit.NSWorkspaceDidWakeNotification
+
+import collections
 import os
-import pickle
 import traceback
 import weakref
 
@@ -31,6 +34,23 @@ from . import notifications
 _TIMERS = weakref.WeakKeyDictionary()
 separator = object()
 
+_IMAGE_CACHE_SIZE = 32
+_image_cache = collections.OrderedDict()  # (path, mtime, size, dimensions, template) -> NSImage, least recent first
+_image_cache_stats = {'hits': 0, 'misses': 0}
+_resolved_image_paths = {}  # filename as given -> path that was found to exist
+
+
+class _LazyPickle(object):
+    """Stand-in for the :mod:`pickle` module that defers importing it until notification data is first serialized."""
+
+    def dumps(self, obj):
+        import pickle
+        return pickle.dumps(obj)
+
+    def loads(self, data):
+        import pickle
+        return pickle.loads(data)
+
 
 def debug_mode(choice):
     """Enable/disable printing helpful information for debugging the program. Default is off."""
@@ -107,8 +127,31 @@ def quit_application(sender=None):
     nsapplication.terminate_(sender)
 
 
-def _nsimage_from_file(filename, dimensions=None, template=None):
-    """Take a path to an image file and return an NSImage object."""
+def image_cache_info():
+    """Return a dictionary with the number of `hits` and `misses` of the cache used when loading icons, its current
+    `size` and its `maxsize`.
+
+    .. versionadded:: 0.4.0
+    """
+    return dict(_image_cache_stats, size=len(_image_cache), maxsize=_IMAGE_CACHE_SIZE)
+
+
+def clear_image_cache(filename=None):
+    """Forget cached icon images, either all of them or only those loaded from `filename`. Images are already reloaded
+    automatically when the file's modification time or size changes.
+
+    .. versionadded:: 0.4.0
+    """
+    if filename is None:
+        _image_cache.clear()
+        _resolved_image_paths.clear()
+        return
+    path = _resolved_image_paths.pop(filename, filename)
+    for key in [key for key in _image_cache if key[0] == path]:
+        del _image_cache[key]
+
+
+def _resolve_image_path(filename):
     try:
         _log('attempting to open image at {0}'.format(filename))
         with open(filename):
@@ -123,17 +166,41 @@ def _nsimage_from_file(filename, dimensions=None, template=None):
         _log('attempting (again) to open image at {0}'.format(filename))
         with open(filename):  # file doesn't exist
             pass              # otherwise silently errors in NSImage which isn't helpful for debugging
-    image = NSImage.alloc().initByReferencingFile_(filename)
+    return os.path.abspath(filename)
+
+
+def _nsimage_from_file(filename, dimensions=None, template=None):
+    """Take a path to an image file and return an NSImage object. Images are cached, keyed by the file's resolved
+    path, modification time and size together with `dimensions` and `template`."""
+    path = _resolved_image_paths.get(filename)
+    try:
+        if path is None:
+            raise OSError
+        st = os.stat(path)
+    except OSError:  # not resolved yet or the file went away -- resolve again, raising IOError if missing
+        path = _resolved_image_paths[filename] = _resolve_image_path(filename)
+        st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size, None if dimensions is None else tuple(dimensions), template)
+    image = _image_cache.get(key)
+    if image is not None:
+        _image_cache_stats['hits'] += 1
+        _image_cache.move_to_end(key)
+        return image
+    _image_cache_stats['misses'] += 1
+    image = NSImage.alloc().initByReferencingFile_(path)
     image.setScalesWhenResized_(True)
     image.setSize_((32, 18) if dimensions is None else dimensions)
     if not template is None:
         image.setTemplate_(template)
+    _image_cache[key] = image
+    while len(_image_cache) > _IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
     return image
 
 
 # Decorators and helper function serving to register functions for dealing with interaction and events
 #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-def timer(interval):
+def timer(interval, **options):
     """Decorator for registering a function as a callback in a new thread. The function will be repeatedly called every
     `interval` seconds. This decorator accomplishes the same thing as creating a :class:`rumps.Timer` object by using
     the decorated function and `interval` as parameters and starting it on application launch.
@@ -144,11 +211,14 @@ def timer(interval):
         def repeating_function(sender):
             print 'hi'
 
+    .. versionchanged:: 0.4.0
+        Accepts the same keyword arguments as :class:`rumps.Timer`.
+
     :param interval: a number representing the time in seconds before the decorated function should be called.
     """
     def decorator(f):
         timers = timer.__dict__.setdefault('*timers', [])
-        timers.append(Timer(f, interval))
+        timers.append(Timer(f, interval, **options))
         return f
     return decorator
 
@@ -249,9 +319,12 @@ class Menu(ListDict):
     # Only ever used as the main menu since every other menu would exist as a submenu of a MenuItem
 
     _choose_key = object()
+    _not_populated = object()
 
     def __init__(self):
         self._counts = {}
+        self._provider = self._provider_version = None
+        self._populated_version = self._not_populated
         if not hasattr(self, '_menu'):
             self._menu = NSMenu.alloc().init()
         super(Menu, self).__init__()
@@ -333,6 +406,150 @@ class Menu(ListDict):
         parse_menu(iterable, self, 0)
         parse_menu(kwargs, self, 0)
 
+    def reconcile(self, iterable):
+        """Make this menu match the desired tree described by `iterable` using as few NSMenu operations as possible.
+
+        `iterable` is parsed like :meth:`rumps.MenuItem.update`, but it describes the complete contents of the menu
+        rather than items to add. Existing :class:`rumps.MenuItem` objects (and their callbacks, icons and states) are
+        reused by key, items missing from `iterable` are removed, new ones are created and the rest are reordered.
+        Separators are matched by position. Submenus are reconciled recursively; an item given without a submenu ends
+        up without one. Items kept in place cost no NSMenu call at all, and insertion indices are tracked here rather
+        than looked up with the linear ``indexOfItem_``.
+
+        .. note::
+           The quit button of the main menu is an ordinary item here; include it in `iterable` to keep it.
+
+        :return: the number of NSMenu insert and remove operations performed, including submenus.
+        """
+        desired = []
+
+        def parse_menu(iterable, depth):
+            if isinstance(iterable, MenuItem):
+                desired.append((iterable, None))
+                return
+            for n, ele in enumerate(iteritems(iterable) if isinstance(iterable, collections_abc.Mapping) else iterable):
+                if not isinstance(ele, MenuItem) and isinstance(ele, collections_abc.Mapping):
+                    parse_menu(ele, depth)
+                elif not isinstance(ele, (string_types, MenuItem)) and isinstance(ele, collections_abc.Iterable):
+                    try:
+                        menuitem, submenu = ele
+                    except TypeError:
+                        raise ValueError('menu iterable element #{0} at depth {1} has length {2}; must be a single '
+                                         'menu item or a pair consisting of a menu item and its '
+                                         'submenu'.format(n, depth, len(tuple(ele))))
+                    desired.append((menuitem, submenu))
+                else:
+                    desired.append((ele, None))
+        parse_menu(iterable, 0)
+
+        # resolve keys, reusing existing values wherever the key (or, for separators, the position) matches
+        separators = [key for key, value in iteritems(self) if isinstance(value, SeparatorMenuItem)]
+        separators.reverse()
+        wanted = []
+        for ele, submenu in desired:
+            if ele is None or ele is separator or isinstance(ele, SeparatorMenuItem):
+                key = separators.pop() if separators else None
+                value = self[key] if key is not None else SeparatorMenuItem()
+            elif hasattr(ele, '_menuitem') and not hasattr(ele, 'title'):
+                key = next((k for k, v in iteritems(self) if v is ele), None)
+                value = ele
+            else:
+                key = ele.title if isinstance(ele, MenuItem) else text_type(ele)
+                existing = self.get(key)
+                if isinstance(ele, MenuItem) or existing is None:
+                    value = MenuItem(ele)
+                else:
+                    value = existing
+            if key is None:
+                key, value = self._process_new_menuitem(self._choose_key, value)
+            wanted.append((key, value, submenu))
+        keys = [key for key, _, _ in wanted]
+        if len(set(keys)) != len(keys):
+            raise ValueError('duplicate keys in desired menu: {0}'.format(
+                sorted(set(k for k in keys if keys.count(k) > 1))))
+
+        operations = 0
+        wanted_values = dict((key, value) for key, value, _ in wanted)
+        for key in [key for key, value in iteritems(self) if wanted_values.get(key) is not value]:
+            self._menu.removeItem_(self[key]._menuitem)
+            super(Menu, self).__delitem__(key)
+            operations += 1
+
+        # keep the longest run of remaining items that is already in the desired order; move everything else
+        position = dict((key, i) for i, key in enumerate(self))
+        sequence = [position[key] for key in keys if key in position]
+        stable = set(_longest_increasing(sequence))
+        for key in [key for key in self if position[key] not in stable]:
+            self._menu.removeItem_(self[key]._menuitem)
+            super(Menu, self).__delitem__(key)
+            operations += 1
+
+        prev_key = None
+        for index, (key, value, submenu) in enumerate(wanted):
+            if key not in self:
+                if self._menu is None:  # MenuItem without a submenu yet
+                    self._menu = NSMenu.alloc().init()
+                    self._menuitem.setSubmenu_(self._menu)
+                self._menu.insertItem_atIndex_(value._menuitem, index)
+                self._place(prev_key, key, value)
+                operations += 1
+            prev_key = key
+            if isinstance(value, MenuItem):
+                if submenu is not None:
+                    operations += value.reconcile(submenu)
+                elif value._menu is not None and value._provider is None:
+                    operations += value.reconcile(())
+                    value._menuitem.setSubmenu_(None)
+                    value._menu = None
+        return operations
+
+    # Lazily populated menus
+    #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+
+    def set_provider(self, provider, version=None):
+        """Populate this menu only when it is about to be displayed. Right before the menu (or the submenu of this
+        :class:`rumps.MenuItem`) opens, `provider` is called with this object as its only parameter and must return
+        the desired contents, which are applied with :meth:`rumps.MenuItem.reconcile`.
+
+        `version` is an optional callable returning any value that changes whenever the data behind the menu does.
+        The provider is only called again when that value differs from the one seen at the previous population, so
+        keeping an elaborate menu up to date costs nothing while it stays closed. Without `version` the provider runs
+        every time the menu opens.
+
+        .. code-block:: python
+
+            details = rumps.MenuItem('Details')
+            details.set_provider(lambda sender: ['Voltage: 3.9 V', 'Cycles: 12'], version=lambda: store.version)
+            app.menu = [details]
+
+        :param provider: a function returning an iterable accepted by :meth:`rumps.MenuItem.reconcile`, or ``None``
+                         to stop populating the menu lazily.
+        :param version: a function returning the current data version, or ``None``.
+        """
+        self._provider = provider
+        self._provider_version = version
+        self._populated_version = self._not_populated
+        if provider is None:
+            _providers.unregister(self)
+            return
+        if self._menu is None:  # MenuItem without a submenu yet
+            self._menu = NSMenu.alloc().init()
+            self._menuitem.setSubmenu_(self._menu)
+        _providers.register(self)
+
+    def invalidate(self):
+        """Call the provider again the next time the menu opens even if the data version did not change."""
+        self._populated_version = self._not_populated
+
+    def _populate(self):
+        if self._provider is None:
+            return
+        version = self._provider_version() if self._provider_version is not None else self._not_populated
+        if version is not self._not_populated and version == self._populated_version:
+            return
+        self.reconcile(_internal.call_as_function_or_method(self._provider, self))
+        self._populated_version = version
+
     # ListDict insertion methods
     #- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -359,6 +576,8 @@ class Menu(ListDict):
     def _insert_helper(self, existing_key, key, menuitem, pos):
         if existing_key == key:  # this would mess stuff up...
             raise ValueError('same key provided for location and insertion')
+        if key in self:  # moving an existing item -- NSMenu refuses to insert an item it already contains
+            del self[key]
         existing_menuitem = self[existing_key]
         index = self._menu.indexOfItem_(existing_menuitem._menuitem)
         self._menu.insertItem_atIndex_(menuitem._menuitem, index + pos)
@@ -389,6 +608,29 @@ class Menu(ListDict):
         return key, value
 
 
+def _longest_increasing(sequence):
+    """Return the values of a longest strictly increasing subsequence of `sequence` in O(n log n)."""
+    import bisect
+    tails, tail_index, previous = [], [], [None] * len(sequence)
+    for i, value in enumerate(sequence):
+        j = bisect.bisect_left(tails, value)
+        if j:
+            previous[i] = tail_index[j - 1]
+        if j == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[j] = value
+            tail_index[j] = i
+    result = []
+    i = tail_index[-1] if tail_index else None
+    while i is not None:
+        result.append(sequence[i])
+        i = previous[i]
+    result.reverse()
+    return result
+
+
 class MenuItem(Menu):
     """Represents an item within the application's menu.
 
@@ -576,6 +818,7 @@ class MenuItem(Menu):
         _internal.require_string_or_none(key)
         if key is not None:
             self._menuitem.setKeyEquivalent_(key)
+        _internal.invalidate_method_cache()
         NSApp._ns_to_py_and_callback[self._menuitem] = self, callback
         self._menuitem.setAction_('callback:' if callback is not None else None)
 
@@ -598,6 +841,39 @@ class MenuItem(Menu):
         return self._menuitem.keyEquivalent()
 
 
+class MenuDelegate(NSObject):
+    """Objective-C delegate for menus populated by a provider. Don't instantiate - use
+    :meth:`rumps.MenuItem.set_provider` instead."""
+
+    def menuNeedsUpdate_(self, nsmenu):
+        menu = _providers.menus.get(nsmenu)
+        if menu is not None:
+            _internal.guard_unexpected_errors(menu._populate)()
+
+
+class _ProviderRegistry(object):
+    """Maps the NSMenus of lazily populated menus back to their :class:`rumps.MenuItem`. Kept in plain Python rather
+    than as classmethods of :class:`MenuDelegate`, which PyObjC would expose as Objective-C class selectors."""
+
+    def __init__(self):
+        # NSMenu keeps only a weak reference to its delegate, so the single shared instance is held here
+        self.delegate = None
+        self.menus = {}
+
+    def register(self, menu):
+        if self.delegate is None:
+            self.delegate = MenuDelegate.alloc().init()
+        self.menus[menu._menu] = menu
+        menu._menu.setDelegate_(self.delegate)
+
+    def unregister(self, menu):
+        if menu._menu is not None and self.menus.pop(menu._menu, None) is not None:
+            menu._menu.setDelegate_(None)
+
+
+_providers = _ProviderRegistry()
+
+
 class SliderMenuItem(object):
     """Represents a slider menu item within the application's menu.
 
@@ -634,6 +910,7 @@ class SliderMenuItem(object):
 
         :param callback: the function to be called when the user drags the marker on the slider.
         """
+        _internal.invalidate_method_cache()
         NSApp._ns_to_py_and_callback[self._slider] = self, callback
         self._slider.setAction_('callback:' if callback is not None else None)
 
@@ -665,14 +942,39 @@ class Timer(object):
     .. versionchanged:: 0.2.0
        Method `__call__` removed.
 
+    .. versionchanged:: 0.4.0
+       Accepts `tolerance`, `drift`, `background` and `on_result` keyword arguments.
+
     :param callback: Function that should be called every `interval` seconds. It will be passed this
                      :class:`rumps.Timer` object as its only parameter.
     :param interval: The time in seconds to wait before calling the `callback` function.
+    :param tolerance: How many seconds late the system may fire the timer so that it can coalesce wake-ups with other
+                      timers and save power. Apple suggests at least 10% of `interval`. ``None`` keeps the exact
+                      schedule.
+    :param drift: ``'fixed_rate'`` (default) fires on a fixed grid from the start time, skipping ticks missed while a
+                  callback was running. ``'fixed_delay'`` waits `interval` seconds after each callback (and, in
+                  background mode, its result) before the next one, so slow callbacks never pile up.
+    :param background: if ``True``, `callback` runs on a worker thread instead of the main thread. A tick that comes
+                       while the previous callback is still running is skipped.
+    :param on_result: Function called on the main thread with the value returned by `callback` after each
+                      successful call. Use it to apply the result of a `background` callback to the user interface.
     """
-    def __init__(self, callback, interval):
+
+    _drifts = ('fixed_rate', 'fixed_delay')
+
+    def __init__(self, callback, interval, tolerance=None, drift='fixed_rate', background=False, on_result=None):
+        if drift not in self._drifts:
+            raise ValueError('drift must be one of {0} but given {1!r}'.format(', '.join(self._drifts), drift))
         self.set_callback(callback)
         self._interval = interval
+        self._tolerance = tolerance
+        self._drift = drift
+        self._background = background
+        self._on_result = on_result
         self._status = False
+        self._busy = False
+        self._generation = 0
+        self.skipped = 0  # ticks skipped because a background callback was still running
 
     def __repr__(self):
         return ('<{0}: [callback: {1}; interval: {2}; '
@@ -694,6 +996,17 @@ class Timer(object):
         else:
             self._interval = new_interval
 
+    @property
+    def tolerance(self):
+        """The number of seconds the system may delay firing the timer to coalesce it with others, or ``None``."""
+        return self._tolerance
+
+    @tolerance.setter
+    def tolerance(self, new_tolerance):
+        self._tolerance = new_tolerance
+        if self._status:
+            self._nstimer.setTolerance_(new_tolerance or 0)
+
     @property
     def callback(self):
         """The current function specified as the callback."""
@@ -707,9 +1020,8 @@ class Timer(object):
         """Start the timer thread loop."""
         if not self._status:
             self._nsdate = NSDate.date()
-            self._nstimer = NSTimer.alloc().initWithFireDate_interval_target_selector_userInfo_repeats_(
-                self._nsdate, self._interval, self, 'callback:', None, True)
-            NSRunLoop.currentRunLoop().addTimer_forMode_(self._nstimer, NSDefaultRunLoopMode)
+            self._generation += 1
+            self._schedule(self._nsdate, repeats=self._drift == 'fixed_rate')
             _TIMERS[self] = None
             self._status = True
 
@@ -721,18 +1033,57 @@ class Timer(object):
             del self._nsdate
             self._status = False
 
+    def _schedule(self, fire_date, repeats):
+        self._nstimer = NSTimer.alloc().initWithFireDate_interval_target_selector_userInfo_repeats_(
+            fire_date, self._interval, self, 'callback:', None, repeats)
+        if self._tolerance:
+            self._nstimer.setTolerance_(self._tolerance)
+        NSRunLoop.currentRunLoop().addTimer_forMode_(self._nstimer, NSDefaultRunLoopMode)
+
     def set_callback(self, callback):
         """Set the function that should be called every :attr:`interval` seconds. It will be passed this
         :class:`rumps.Timer` object as its only parameter.
         """
+        _internal.invalidate_method_cache()
         setattr(self, '*callback', callback)
 
     def callback_(self, _):
         _log(self)
+        if self._background:
+            if self._busy:
+                self.skipped += 1
+                return
+            self._busy = True
+            _internal.worker_pool().submit(self._run_in_background, self._generation)
+            return
         try:
-            return _internal.call_as_function_or_method(getattr(self, '*callback'), self)
+            result = _internal.call_as_function_or_method(getattr(self, '*callback'), self)
         except Exception:
             traceback.print_exc()
+            self._finished(self._generation, False, None)
+        else:
+            self._finished(self._generation, True, result)
+            return result
+
+    def _run_in_background(self, generation):
+        try:
+            result = _internal.call_as_function_or_method(getattr(self, '*callback'), self)
+        except Exception:
+            traceback.print_exc()
+            AppHelper.callAfter(self._finished, generation, False, None)
+        else:
+            AppHelper.callAfter(self._finished, generation, True, result)
+
+    def _finished(self, generation, succeeded, result):
+        # always runs on the main thread
+        self._busy = False
+        if succeeded and self._on_result is not None:
+            try:
+                _internal.call_as_function_or_method(self._on_result, result)
+            except Exception:
+                traceback.print_exc()
+        if self._drift == 'fixed_delay' and self._status and generation == self._generation:
+            self._schedule(NSDate.dateWithTimeIntervalSinceNow_(self._interval), repeats=False)
 
 
 class Window(object):
@@ -1026,8 +1377,8 @@ class App(object):
     # Serves as a setup class for NSApp since Objective-C classes shouldn't be instantiated normally.
     # This is the most user-friendly way.
 
-    #: A serializer for notification data.  The default is pickle.
-    serializer = pickle
+    #: A serializer for notification data.  The default is pickle, imported on first use.
+    serializer = _LazyPickle()
 
     def __init__(self, name, title=None, icon=None, template=None, menu=None, quit_button='Quit'):
         _internal.require_string(name)
@@ -1191,6 +1542,7 @@ class App(object):
         notifications._init_nsapp(self._nsapp)
 
         setattr(App, '*app_instance', self)  # class level ref to running instance (for passing self to App subclasses)
+        _internal.build_method_cache(self)
         t = b = None
         for t in getattr(timer, '*timers', []):
             t.start()
@@ -1,4 +1,7 @@
-from AppKit import NSApplication, NSTextField, NSSecureTextField, NSKeyDown, NSCommandKeyMask
+from ._backend import AppKit
+
+NSApplication, NSTextField, NSSecureTextField = AppKit.NSApplication, AppKit.NSTextField, AppKit.NSSecureTextField
+NSKeyDown, NSCommandKeyMask = AppKit.NSKeyDown, AppKit.NSCommandKeyMask
 
 
 class Editing(NSTextField):
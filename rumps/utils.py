@@ -10,23 +10,151 @@ Generic container classes and utility functions.
 :license: BSD-3-Clause, see LICENSE for details.
 """
 
-from .packages.ordereddict import OrderedDict as _OrderedDict
+from .compat import collections_abc
 
+_root = object()  # sentinel key marking both ends of the circular order
 
-# ListDict: OrderedDict subclass with insertion methods for modifying the order of the linked list in O(1) time
+
+# ListDict: dict subclass remembering an order that can be modified in O(1) time by inserting before or after an
+# existing key. Values live in the native dict; the order is kept as two dicts mapping each key to its neighbours.
 # https://gist.github.com/jaredks/6276032
-class ListDict(_OrderedDict):
-    def __insertion(self, link_prev, key_value):
+class ListDict(dict):
+    def __init__(self, *args, **kwargs):
+        if len(args) > 1:
+            raise TypeError('expected at most 1 arguments, got %d' % len(args))
+        if not hasattr(self, '_next'):
+            self._prev = {_root: _root}
+            self._next = {_root: _root}
+        if args or kwargs:
+            ListDict.update(self, *args, **kwargs)  # subclasses may redefine update with another signature
+
+    def _link(self, prev_key, key):
+        next_key = self._next[prev_key]
+        self._prev[key] = prev_key
+        self._next[key] = next_key
+        self._next[prev_key] = self._prev[next_key] = key
+
+    def _unlink(self, key):
+        prev_key = self._prev.pop(key)
+        next_key = self._next.pop(key)
+        self._next[prev_key] = next_key
+        self._prev[next_key] = prev_key
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._link(self._prev[_root], key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._unlink(key)
+
+    def __iter__(self):
+        next_map = self._next
+        key = next_map[_root]
+        while key is not _root:
+            yield key
+            key = next_map[key]
+
+    def __reversed__(self):
+        prev_map = self._prev
+        key = prev_map[_root]
+        while key is not _root:
+            yield key
+            key = prev_map[key]
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, list(self.items()))
+
+    def __reduce__(self):
+        return type(self), (list(self.items()),)
+
+    def __eq__(self, other):
+        if isinstance(other, ListDict):
+            return dict.__eq__(self, other) and all(a == b for a, b in zip(self, other))
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def keys(self):
+        return collections_abc.KeysView(self)
+
+    def values(self):
+        return collections_abc.ValuesView(self)
+
+    def items(self):
+        return collections_abc.ItemsView(self)
+
+    def clear(self):
+        dict.clear(self)
+        self._prev = {_root: _root}
+        self._next = {_root: _root}
+
+    _marker = object()
+
+    def pop(self, key, default=_marker):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        if default is self._marker:
+            raise KeyError(key)
+        return default
+
+    def popitem(self, last=True):
+        if not self:
+            raise KeyError('dictionary is empty')
+        key = self._prev[_root] if last else self._next[_root]
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for other in args:
+            if isinstance(other, collections_abc.Mapping) or hasattr(other, 'keys'):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                for key, value in other:
+                    self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def copy(self):
+        return type(self)(self.items())
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None):
+        new = cls()
+        for key in iterable:
+            new[key] = value
+        return new
+
+    def _place(self, prev_key, key, value):
+        # link a key that is not yet present right after prev_key, or first when prev_key is None
+        self._link(_root if prev_key is None else prev_key, key)
+        dict.__setitem__(self, key, value)
+
+    def __insertion(self, prev_key, key_value):
         key, value = key_value
-        if link_prev[2] != key:
+        if prev_key != key:
             if key in self:
                 del self[key]
-            link_next = link_prev[1]
-            self._OrderedDict__map[key] = link_prev[1] = link_next[0] = [link_prev, link_next, key]
+            self._link(prev_key, key)
         dict.__setitem__(self, key, value)
 
     def insert_after(self, existing_key, key_value):
-        self.__insertion(self._OrderedDict__map[existing_key], key_value)
+        if existing_key not in self:
+            raise KeyError(existing_key)
+        self.__insertion(existing_key, key_value)
 
     def insert_before(self, existing_key, key_value):
-        self.__insertion(self._OrderedDict__map[existing_key][0], key_value)
+        if existing_key not in self:
+            raise KeyError(existing_key)
+        self.__insertion(self._prev[existing_key], key_value)
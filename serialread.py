@@ -1,21 +1,60 @@
-import serial
-import re
-import time
-from PIL import Image, ImageDraw, ImageFont
-from datetime import datetime
+import alerts
+import battery
+import estimate
+import ringbuffer
+import smoothing
+import threading
 from threading import Timer
 
 all_percentage = None
 all_battery = None
-  # 读取串口数据
-ser = serial.Serial('/dev/cu.usbmodem207236A254527', 115200, timeout=0.1)
-  # 向屏幕发送指令
-ser.write(b'at+adb\r\n')
-# 打开串口
-
-
-
-def create_battery_icon(percentage, width=150, height=70, corner_radius=12,battery_level_rect_radius=8,head_corner_radius=5):
+latest = None
+# 平滑后用于显示的读数；latest 始终是原始读数
+display = None
+PORT = '/dev/cu.usbmodem207236A254527'
+ser = None
+_timer = None
+_running = False
+# 每次 start() 加 1；重启前已经触发、正在等锁的旧定时器发现代数不同就退出，不会多出一条读取循环
+_generation = 0
+_lock = threading.RLock()
+# 电量提醒引擎，每个读数都经过它；提醒的发送方式由 App 设置 ALERTS.on_alert
+ALERTS = alerts.AlertEngine()
+# 读数先经过平滑，显示值真正变化时才重绘图标；SMOOTHER.metrics() 记录省下的重绘次数
+SMOOTHER = smoothing.Smoother()
+_rendered_key = None
+# 最近 24 小时的原始读数，供估算、图表和菜单使用，不需要读磁盘
+RECENT = ringbuffer.RingBuffer()
+# 写入磁盘的全部历史（history.HistoryStore），由 App 设置；为 None 时不保存
+HISTORY = None
+# 剩余时间估算，ESTIMATE 为最近一次的 estimate.Estimate，还估算不出时为 None
+ESTIMATOR = estimate.Estimator()
+ESTIMATE = None
+
+
+def open_port():
+    global ser
+    with _lock:
+        if ser is not None:
+            return
+        import serial
+        # 打开串口
+        ser = serial.Serial(PORT, 115200, timeout=0.1)
+        # 向屏幕发送指令
+        ser.write(b'at+adb\r\n')
+
+
+
+def icon_color(percentage, low=None):
+    # low 是提醒引擎带回差的低电量状态；没有时按 20% 判断
+    if low is None:
+        low = percentage <= 20
+    return "red" if low else "black"
+
+
+def create_battery_icon(percentage, width=150, height=70, corner_radius=12,battery_level_rect_radius=8,head_corner_radius=5,low=None):
+    # PIL 在第一次绘制时才导入，不阻塞串口打开
+    from PIL import Image, ImageDraw
     # 创建一个透明背景的图像
     image = Image.new("RGBA", (width, height), (255, 255, 255, 0))
     draw = ImageDraw.Draw(image)
@@ -35,10 +74,10 @@ def create_battery_icon(percentage, width=150, height=70, corner_radius=12,batte
     # 绘制电池电量
     fill_width = int((93) * (percentage / 100))
     battery_level_rect = [(9 + battery_level_rect_radius, 11 + battery_level_rect_radius), (battery_level_rect_radius + 7 + fill_width, height - 11 - battery_level_rect_radius)]
-    color = "black" if percentage > 20 else "red"
+    color = icon_color(percentage, low)
     draw.rounded_rectangle(battery_level_rect, fill=color, radius=battery_level_rect_radius)
 
-    if all_battery > '0':
+    if all_battery is not None and all_battery > '0':
       lightning_color = (70,175,168)
       lightning_points = [
           (width // 2 - 5, height // 2 - 23),
@@ -57,43 +96,94 @@ def save_battery_icon(image, path):
     image.save(path)
 
 
+def icon_key(reading, low=None):
+    # 图标只由电量条宽度、颜色和充电标志决定，key 相同时图标相同
+    fill_width = int((93) * (reading.percentage / 100))
+    color = icon_color(reading.percentage, low)
+    return f"{fill_width}-{color}-{int(battery.is_charging(reading))}"
+
+
 def task():
 
 
   data = ser.readline()
   if data:
   # 将byte数据转换为字符串
-    data_str = data.decode('utf-8')
+    data_str = data.decode('utf-8', 'replace')
     # 使用正则表达式匹配电量信息
-    match = re.search(r'\+BATCG=\d+,(?P<percentage>\d+),', data_str)
-    power = re.search(r'\+BATCG=\d+,\d+,\d+,(?P<charge>.\d+),\d+,\d+', data_str)
+    reading = battery.parse_line(data_str)
 
-    if match:
+    if reading:
       # 获取电量百分比
-      percentage = match.group('percentage')
-      battery = power.group('charge')
-      # print(f"当前电量：{percentage}%")
+      # print(f"当前电量：{reading.percentage}%")
       global all_percentage
       global all_battery
-      all_percentage = f"{percentage}%"
-      all_battery = battery
-    # 修改此处的电量参数来生成不同的电池图标
-      battery_percentage = int(percentage)
-      image = create_battery_icon(battery_percentage)
-      save_path = "battery_icon.png"
-      save_battery_icon(image, save_path)
-      #print(f"Battery icon saved to {save_path}")
-
-
-
-
-def func():
-    task()
-    # 定义一个定时器
-    # 注意timer的语法
-    # Timer(interval, function, args=None, kwargs=None)
-    t = Timer(1, func)
-    t.start()
-
-
-func()
+      global latest
+      global display
+      global _rendered_key
+      global ESTIMATE
+      latest = reading
+      RECENT.append(reading)
+      if HISTORY is not None:
+        HISTORY.append(reading)
+      ESTIMATE = ESTIMATOR.update(reading)
+      display, _ = SMOOTHER.update(reading)
+      ALERTS.update(display)
+      all_percentage = f"{display.percentage}%"
+      all_battery = str(display.charge)
+      key = icon_key(display, ALERTS.low)
+      if key != _rendered_key:
+        # 修改此处的电量参数来生成不同的电池图标
+        image = create_battery_icon(display.percentage, low=ALERTS.low)
+        save_path = "battery_icon.png"
+        save_battery_icon(image, save_path)
+        _rendered_key = key
+        #print(f"Battery icon saved to {save_path}")
+
+
+
+
+def func(generation):
+    global _timer
+    with _lock:
+        if not _running or generation != _generation:
+            return
+        task()
+        # 定义一个定时器
+        # 注意timer的语法
+        # Timer(interval, function, args=None, kwargs=None)
+        _timer = Timer(1, func, args=(generation,))
+        _timer.start()
+
+
+def start():
+    global _running, _generation
+    with _lock:
+        if _running:
+            return
+        open_port()
+        _running = True
+        _generation += 1
+        generation = _generation
+    func(generation)
+
+
+def stop():
+    # 停止读取并关闭串口，之后可以重新 start()
+    global ser, _timer, _running, all_percentage, all_battery, latest, display, _rendered_key, ESTIMATE
+    with _lock:
+        _running = False
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+        if ser is not None:
+            ser.close()
+            ser = None
+        all_percentage = None
+        all_battery = None
+        latest = None
+        display = None
+        _rendered_key = None
+        SMOOTHER.reset()
+        ESTIMATOR.reset()
+        ESTIMATE = None
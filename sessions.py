@@ -0,0 +1,189 @@
+import bisect
+import os
+import struct
+import threading
+from collections import deque, namedtuple
+
+import alerts
+import rollup
+
+# 充电 / 放电过程：随读数流式切分，每个过程记录开始和结束的时间与电量、平均速度和峰值速度
+# 结束的过程按固定长度的记录追加到 sessions.bin（和历史放在同一个目录），按结束时间二分查找，查询时不扫描原始读数
+# 充电状态和提醒引擎一样按 +BATCG 第 4 个字段判断并去抖；读数中断超过 GAP 秒（睡眠、断开）时结束当前过程
+
+CHARGE = 'charge'
+DISCHARGE = 'discharge'
+KINDS = (DISCHARGE, CHARGE)
+DEBOUNCE = 3.0
+GAP = 10 * 60
+# 峰值速度按这么长的窗口计算，避免电量取整造成的尖峰
+RATE_WINDOW = 5 * 60
+
+# rate 和 peak_rate 为 %/小时，放电为负
+Session = namedtuple('Session', ['kind', 'start', 'end', 'start_percentage', 'end_percentage', 'rate', 'peak_rate',
+                                 'count'])
+
+# 开始时间、结束时间、类型、开始电量、结束电量、平均速度、峰值速度、读数个数
+_RECORD = struct.Struct('<qqBhhffI')
+_END = 8
+
+
+def _session(record):
+    start, end, kind, start_percentage, end_percentage, rate, peak_rate, count = record
+    return Session(KINDS[kind], start, end, start_percentage, end_percentage, rate, peak_rate, count)
+
+
+def _record(session):
+    return _RECORD.pack(session.start, session.end, KINDS.index(session.kind), session.start_percentage,
+                        session.end_percentage, session.rate, session.peak_rate, session.count)
+
+
+class SessionTracker(object):
+    def __init__(self, debounce=DEBOUNCE, gap=GAP, rate_window=RATE_WINDOW):
+        self.gap = gap
+        self.rate_window = rate_window
+        self.charger = alerts.Band(1, 0, debounce)
+        self._current = None  # [类型, 开始时间, 结束时间, 开始电量, 结束电量, 峰值速度, 读数个数]
+        self._window = deque()  # 最近 rate_window 秒的 (时间, 电量)
+        self.last = None  # 处理过的最后一个读数时间，不晚于它的读数会被忽略
+
+    def update(self, t, percentage, charging):
+        """返回这个读数结束的过程（Session），没有结束时返回 None。"""
+        if self.last is not None and t <= self.last:
+            return None
+        self.last = t
+        closed = None
+        if self._current is None:
+            self.charger.prime(1 if charging else 0)
+        elif t - self._current[2] > self.gap:
+            closed = self.close()
+            self.charger.prime(1 if charging else 0)
+        elif self.charger.update(1 if charging else 0, t) is not None:
+            closed = self.close()
+        if self._current is None:
+            kind = CHARGE if self.charger.active else DISCHARGE
+            self._current = [kind, t, t, percentage, percentage, 0.0, 0]
+        current = self._current
+        current[2] = t
+        current[4] = percentage
+        current[6] += 1
+        window = self._window
+        window.append((t, percentage))
+        while t - window[0][0] > self.rate_window:
+            window.popleft()
+        if t - window[0][0] >= self.rate_window / 2:
+            rate = (percentage - window[0][1]) * 3600.0 / (t - window[0][0])
+            if abs(rate) > abs(current[5]):
+                current[5] = rate
+        return closed
+
+    def current(self):
+        """还没有结束的过程，没有时返回 None。"""
+        if self._current is None:
+            return None
+        kind, start, end, start_percentage, end_percentage, peak_rate, count = self._current
+        rate = (end_percentage - start_percentage) * 3600.0 / (end - start) if end > start else 0.0
+        return Session(kind, start, end, start_percentage, end_percentage, rate, peak_rate, count)
+
+    def close(self):
+        session = self.current()
+        self._current = None
+        self._window.clear()
+        return session
+
+
+def summary(sessions):
+    """按类型统计：过程个数、总时长、平均时长、平均速度（%/小时，按时长加权）、充满或放完 100% 需要的小时数。"""
+    result = {}
+    for kind in KINDS:
+        selected = [s for s in sessions if s.kind == kind and s.end > s.start]
+        seconds = sum(s.end - s.start for s in selected)
+        change = sum(s.end_percentage - s.start_percentage for s in selected)
+        rate = change * 3600.0 / seconds if seconds else None
+        result[kind] = {
+            'count': len(selected),
+            'seconds': seconds,
+            'mean_seconds': seconds / len(selected) if selected else None,
+            'rate': rate,
+            'hours_per_100': 100.0 / abs(rate) if rate else None,
+        }
+    return result
+
+
+class SessionStore(object):
+    def __init__(self, directory, history=None, readonly=False, **options):
+        # readonly（见 rollup.open_records）时只查询 sessions.bin 中已经结束的过程，不追加也不从历史重新计算
+        self.path = os.path.join(directory, 'sessions.bin')
+        self.history = history
+        self.readonly = readonly
+        self.tracker = SessionTracker(**options)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _open(self):
+        if self._file is not None or self.readonly:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file, size = rollup.open_records(self.path, _RECORD.size)
+        if size and self.tracker.last is None:
+            self.tracker.last = rollup.last_record(self.path, _RECORD, size)[1]
+        if self.history is not None:
+            # 上次退出时没有结束的过程从历史中重新计算
+            self._add((int(r.timestamp), r.fields) for r in self.history.read(self.tracker.last))
+
+    def add(self, samples):
+        """HistoryStore.on_commit 的回调：samples 为 [(秒, 字段), ...]。"""
+        if self.readonly:
+            raise ValueError('session store {0} is read-only'.format(self.path))
+        with self._lock:
+            self._open()
+            self._add(samples)
+
+    def _add(self, samples):
+        for t, fields in samples:
+            session = self.tracker.update(t, fields[1], fields[3] > 0)
+            if session is not None and session.count > 1:
+                self._file.write(_record(session))
+        self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def query(self, start=None, end=None, kind=None):
+        """返回和 [start, end) 重叠的过程，包括还没有结束的过程（readonly 时没有）。"""
+        import mmap
+        with self._lock:
+            self._open()
+            current = self.tracker.current()
+        result = []
+        data = None
+        try:
+            f = open(self.path, 'rb')
+        except IOError:
+            # 只读时 App 可能还没有写过任何过程
+            f = None
+        if f is not None:
+            with f:
+                count = os.fstat(f.fileno()).st_size // _RECORD.size
+                data = mmap.mmap(f.fileno(), count * _RECORD.size, access=mmap.ACCESS_READ) if count else None
+        if data is not None:
+            try:
+                index = 0
+                if start is not None:
+                    index = bisect.bisect_right(rollup.RecordKeys(data, count, _RECORD.size, _END), start)
+                for i in range(index, count):
+                    session = _session(_RECORD.unpack_from(data, i * _RECORD.size))
+                    if end is not None and session.start >= end:
+                        break
+                    result.append(session)
+            finally:
+                data.close()
+        if current is not None and current.count > 1 and (start is None or current.end > start) and \
+                (end is None or current.start < end):
+            result.append(current)
+        if kind is not None:
+            result = [s for s in result if s.kind == kind]
+        return result
@@ -8,8 +8,8 @@ Usage:
 from setuptools import setup
 
 APP = ['TNTgo Boom.py']
-DATA_FILES = ['serialread.py','battery_icon.png','rumps','kext']
-OPTIONS = {'includes':['serial','re','time','PIL','datetime','threading','subprocess','AppKit','Foundation','os','PyObjCTools','pickle','traceback']}
+DATA_FILES = ['serialread.py','driver.py','startup.py','battery.py','snapshot.py','alerts.py','smoothing.py','ringbuffer.py','estimate.py','history.py','rollup.py','sessions.py','wear.py','chart.py','battery_icon.png','rumps','kext']
+OPTIONS = {'includes':['serial','re','time','PIL','datetime','threading','subprocess','AppKit','Foundation','os','PyObjCTools','pickle','traceback','json','plistlib']}
 
 setup(
     app=APP,
@@ -0,0 +1,135 @@
+import bisect
+from collections import deque
+
+from battery import BatteryReading
+
+# 平滑 +BATCG 读数：电量和充电电流在阈值附近会 ±1 跳动，每次跳动都会重绘图标、写 PNG、刷新状态栏
+# 这里先滤波，再加一个死区，只有显示值真正变化时才通知界面；原始读数仍然单独保存
+
+
+class EMA(object):
+    """指数滑动平均，alpha 越小越平滑、越滞后。"""
+
+    def __init__(self, alpha=0.3):
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = float(value)
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+
+
+class Median(object):
+    """最近 size 个值的中位数，能去掉偶尔的异常值。"""
+
+    def __init__(self, size=5):
+        self.size = size
+        self._window = deque()
+        self._sorted = []
+
+    def update(self, value):
+        self._window.append(value)
+        bisect.insort(self._sorted, value)
+        if len(self._window) > self.size:
+            del self._sorted[bisect.bisect_left(self._sorted, self._window.popleft())]
+        n = len(self._sorted)
+        return (self._sorted[(n - 1) // 2] + self._sorted[n // 2]) / 2.0
+
+    def reset(self):
+        self._window.clear()
+        self._sorted = []
+
+
+class Kalman(object):
+    """一维卡尔曼滤波（值缓慢变化的模型），q 为过程噪声，r 为测量噪声。"""
+
+    def __init__(self, q=0.01, r=1.0):
+        self.q = q
+        self.r = r
+        self.value = None
+        self._p = 1.0
+
+    def update(self, value):
+        if self.value is None:
+            self.value = float(value)
+            return self.value
+        self._p += self.q
+        gain = self._p / (self._p + self.r)
+        self.value += gain * (value - self.value)
+        self._p *= 1 - gain
+        return self.value
+
+    def reset(self):
+        self.value = None
+        self._p = 1.0
+
+
+FILTERS = {'ema': EMA, 'median': Median, 'kalman': Kalman}
+
+
+def make_filter(kind, **options):
+    if kind not in FILTERS:
+        raise ValueError('unknown filter {0!r}, expected one of {1}'.format(kind, ', '.join(sorted(FILTERS))))
+    return FILTERS[kind](**options)
+
+
+class Smoother(object):
+    def __init__(self, kind='kalman', deadband=0.75, charge_deadband=2.0, **options):
+        self.kind = kind
+        self.deadband = deadband
+        self.charge_deadband = charge_deadband
+        self._percentage = make_filter(kind, **options)
+        self._charge = make_filter(kind, **options)
+        self.reset()
+
+    def reset(self):
+        self._percentage.reset()
+        self._charge.reset()
+        self._shown = None  # (电量, 充电电流, 是否充电)
+        self._raw_key = None
+        self.readings = 0
+        self.raw_changes = 0
+        self.updates = 0
+
+    def update(self, reading):
+        """返回 (显示用读数, 是否变化)。显示用读数的时间戳和 fields 来自原始读数。"""
+        self.readings += 1
+        raw_key = (reading.percentage, reading.charge > 0)
+        if raw_key != self._raw_key:
+            # 不平滑时每次变化都要重绘
+            self._raw_key = raw_key
+            self.raw_changes += 1
+        percentage = self._percentage.update(reading.percentage)
+        charge = self._charge.update(reading.charge)
+        changed = self._shown is None
+        if changed:
+            shown_percentage, charging = int(round(percentage)), charge > 0
+        else:
+            shown_percentage, _, charging = self._shown
+            if abs(percentage - shown_percentage) >= self.deadband:
+                shown_percentage, changed = int(round(percentage)), True
+            # 充电状态也有死区：平滑后的电流越过 ±charge_deadband 才切换
+            if charging != (charge > 0) and abs(charge) >= self.charge_deadband:
+                charging, changed = not charging, True
+        if changed:
+            self.updates += 1
+            # 显示的电流和显示的充电状态保持一致（is_charging 按电流正负判断）
+            shown_charge = int(round(charge))
+            if charging != (shown_charge > 0):
+                shown_charge = 1 if charging else 0
+            self._shown = (shown_percentage, shown_charge, charging)
+        return BatteryReading(reading.timestamp, self._shown[0], self._shown[1], reading.fields), changed
+
+    def metrics(self):
+        return {
+            'readings': self.readings,
+            'raw_changes': self.raw_changes,
+            'updates': self.updates,
+            'saved': self.raw_changes - self.updates,
+        }
@@ -0,0 +1,51 @@
+import json
+import os
+
+from battery import BatteryReading, is_charging
+
+# 最近一次电量读数的快照，程序启动或唤醒时先显示它，直到读到新的数据
+
+
+class Snapshot(object):
+    def __init__(self, path):
+        self.path = path
+        self._saved = None
+
+    @staticmethod
+    def _key(reading, icon_key):
+        return reading.percentage, is_charging(reading), icon_key
+
+    def load(self):
+        """返回 (reading, icon_key)，没有快照或快照损坏时返回 (None, None)。"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            reading = BatteryReading(data['timestamp'], data['percentage'], data['charge'], tuple(data['fields']))
+            icon_key = data['icon_key']
+        except (IOError, ValueError, KeyError, TypeError):
+            return None, None
+        self._saved = self._key(reading, icon_key)
+        return reading, icon_key
+
+    def save(self, reading, icon_key):
+        """只在电量、充电状态或图标变化时写入，先写临时文件再替换，写到一半崩溃也不会损坏快照。"""
+        key = self._key(reading, icon_key)
+        if key == self._saved:
+            return False
+        data = dict(reading._asdict(), fields=list(reading.fields), icon_key=icon_key)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # 磁盘满之类的写入失败：原来的快照不变，下一个读数再写
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        self._saved = key
+        return True
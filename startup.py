@@ -0,0 +1,107 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# 启动编排：按依赖关系并行执行启动步骤，并记录每一步的耗时
+
+
+class Startup(object):
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._t0 = clock()
+        self._steps = {}
+        self._done = {}
+        self._lock = threading.Lock()
+        self.timings = {}
+        self.errors = {}
+        self.marks = {}
+
+    def add(self, name, func, deps=()):
+        if name in self._steps:
+            raise ValueError('step {0!r} already added'.format(name))
+        self._steps[name] = (func, tuple(deps))
+        self._done[name] = threading.Event()
+
+    def step(self, name, deps=()):
+        def decorator(func):
+            self.add(name, func, deps)
+            return func
+        return decorator
+
+    def _check(self):
+        visiting, visited = set(), set()
+
+        def visit(name, path):
+            if name not in self._steps:
+                raise ValueError('step {0!r} depends on unknown step {1!r}'.format(path[-1], name))
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError('dependency cycle: {0}'.format(' -> '.join(path + [name])))
+            visiting.add(name)
+            for dep in self._steps[name][1]:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._steps:
+            visit(name, [])
+
+    def _run_step(self, name):
+        func, deps = self._steps[name]
+        for dep in deps:
+            self._done[dep].wait()
+        failed = [dep for dep in deps if dep in self.errors]
+        start = self._clock() - self._t0
+        try:
+            if failed:
+                raise RuntimeError('skipped because {0} failed'.format(', '.join(failed)))
+            func()
+        except Exception as e:
+            if not failed:
+                import traceback
+                traceback.print_exc()
+            self.errors[name] = e
+        finally:
+            with self._lock:
+                self.timings[name] = (start, self._clock() - self._t0)
+            self._done[name].set()
+
+    def start(self):
+        """每个步骤一个后台线程，依赖完成后才开始执行。"""
+        self._check()
+        for name in self._steps:
+            threading.Thread(target=self._run_step, args=(name,), name='startup-' + name, daemon=True).start()
+        return self
+
+    def wait(self, name=None, timeout=None):
+        names = self._steps if name is None else [name]
+        return all(self._done[n].wait(timeout) for n in names)
+
+    @contextmanager
+    def timed(self, name):
+        # 记录主线程中执行的步骤（例如创建 rumps.App）
+        start = self._clock() - self._t0
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.timings[name] = (start, self._clock() - self._t0)
+
+    def mark(self, name):
+        """记录某个时刻（只记录第一次），例如第一次显示正确电量的时间。"""
+        with self._lock:
+            if name in self.marks:
+                return False
+            self.marks[name] = self._clock() - self._t0
+            return True
+
+    def report(self):
+        lines = []
+        for name, (start, end) in sorted(self.timings.items(), key=lambda item: item[1]):
+            status = ' (failed)' if name in self.errors else ''
+            lines.append('{0:<16}{1:8.3f}s -> {2:8.3f}s  {3:8.3f}s{4}'.format(
+                name, start, end, end - start, status))
+        for name, at in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append('{0:<16}{1:8.3f}s'.format(name, at))
+        return '\n'.join(lines)
@@ -0,0 +1,4 @@
+import os
+
+# 测试不需要 macOS：rumps 使用 headless 后端（虚拟时钟）
+os.environ.setdefault('RUMPS_BACKEND', 'headless')
@@ -0,0 +1,82 @@
+import unittest
+
+import alerts
+import battery
+
+
+def reading(t, percentage, charge=-120):
+    return battery.BatteryReading(float(t), percentage, charge, (0, percentage, 3950, charge, 25, 0))
+
+
+def kinds(result):
+    return [(alert.kind, alert.timestamp) for alert in result]
+
+
+class AlertEngineTest(unittest.TestCase):
+    def test_flicker_near_low_threshold_alerts_once(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 25) for t in range(10)]
+        # 电量在 19% 和 20% 之间来回跳 10 分钟
+        trace += [reading(t, 19 + t % 2) for t in range(10, 610)]
+        result = engine.replay(trace)
+        self.assertEqual(kinds(result), [(alerts.LOW, 10 + engine.levels[1][1].debounce)])
+        self.assertTrue(engine.low)
+
+    def test_short_dip_is_debounced(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 25) for t in range(10)]
+        trace += [reading(t, 20) for t in range(10, 30)]
+        trace += [reading(t, 23) for t in range(30, 100)]
+        self.assertEqual(engine.replay(trace), [])
+        self.assertFalse(engine.low)
+
+    def test_charger_bounce_does_not_rearm_low(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 25) for t in range(10)]
+        trace += [reading(t, 19) for t in range(10, 100)]
+        # 充电字段每 20 秒跳成正数一次，每次 1 秒，短于充电器的去抖时间
+        trace += [reading(t, 19, 5 if t % 20 == 0 else -120) for t in range(100, 700)]
+        result = engine.replay(trace)
+        self.assertEqual([alert.kind for alert in result], [alerts.LOW])
+        self.assertFalse(engine.charger.active)
+
+    def test_charger_connected_while_low_does_not_realert(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 25) for t in range(10)]
+        trace += [reading(t, 19) for t in range(10, 100)]
+        # 插上充电器一会儿又拔掉，电量还没回到 23%，低电量状态保持
+        trace += [reading(t, 19, 500) for t in range(100, 200)]
+        trace += [reading(t, 19) for t in range(200, 400)]
+        result = engine.replay(trace)
+        self.assertEqual([alert.kind for alert in result],
+                         [alerts.LOW, alerts.CHARGER_CONNECTED, alerts.CHARGER_DISCONNECTED])
+        self.assertTrue(engine.low)
+
+    def test_critical_then_low_does_not_downgrade(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 30) for t in range(10)]
+        # 直接掉到严重低电量，只提醒一次
+        trace += [reading(t, 9) for t in range(10, 100)]
+        # 回升到严重低电量的回差之外，但仍然低于低电量的解除阈值
+        trace += [reading(t, 14) for t in range(100, 300)]
+        trace += [reading(t, 19 + t % 2) for t in range(300, 600)]
+        result = engine.replay(trace)
+        self.assertEqual([alert.kind for alert in result], [alerts.CRITICAL])
+        self.assertTrue(engine.low)
+        self.assertFalse(engine.levels[0][1].active)
+
+    def test_starting_critical_alerts_once(self):
+        engine = alerts.AlertEngine()
+        result = engine.replay([reading(t, 8) for t in range(100)])
+        self.assertEqual(kinds(result), [(alerts.CRITICAL, 0)])
+        self.assertTrue(engine.low)
+
+    def test_low_then_critical(self):
+        engine = alerts.AlertEngine()
+        trace = [reading(t, 30 - t // 20) for t in range(500)]
+        result = engine.replay(trace)
+        self.assertEqual([alert.kind for alert in result], [alerts.LOW, alerts.CRITICAL])
+
+
+if __name__ == '__main__':
+    unittest.main()
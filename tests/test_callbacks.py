@@ -0,0 +1,110 @@
+import types
+import unittest
+
+import rumps
+from rumps import _headless, _internal
+from rumps.events import EventEmitter
+from rumps.rumps import NSApp
+
+
+class Battery(rumps.App):
+    def refresh(self, sender):
+        return 'refresh', self, sender
+
+
+class MethodCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.app = Battery('battery')
+        self.use(self.app)
+        self.addCleanup(delattr, rumps.App, '*app_instance')
+        self.addCleanup(_internal.invalidate_method_cache)
+
+    def use(self, app):
+        # 和 App.run() 一样登记正在运行的实例并建立缓存，但不进入事件循环
+        setattr(rumps.App, '*app_instance', app)
+        _internal.build_method_cache(app)
+
+    def click(self, item):
+        return NSApp.callback_(item._menuitem)
+
+    def test_methods_receive_the_app(self):
+        item = rumps.MenuItem('refresh', callback=Battery.refresh)
+        self.assertEqual(self.click(item), ('refresh', self.app, item))
+
+    def test_plain_functions_are_called_directly(self):
+        item = rumps.MenuItem('plain', callback=lambda sender: ('plain', sender))
+        self.assertEqual(self.click(item), ('plain', item))
+
+    def test_set_callback_after_adding_a_method(self):
+        item = rumps.MenuItem('later', callback=Battery.refresh)
+        self.click(item)
+
+        def later(self, sender):
+            return 'later', self, sender
+        Battery.later = later
+        self.addCleanup(delattr, Battery, 'later')
+        item.set_callback(Battery.later)
+        self.assertIsNone(_internal._method_cache)
+        self.assertEqual(self.click(item), ('later', self.app, item))
+
+    def test_set_callback_after_rebinding_on_the_instance(self):
+        def replacement(self, sender):
+            return 'replacement', self, sender
+        item = rumps.MenuItem('refresh', callback=Battery.refresh)
+        self.click(item)
+        self.app.refresh = types.MethodType(replacement, self.app)
+        item.set_callback(replacement)
+        self.assertEqual(self.click(item), ('replacement', self.app, item))
+        # 去掉实例上的绑定之后，类中同名的方法重新可用
+        del self.app.refresh
+        item.set_callback(Battery.refresh)
+        self.assertEqual(self.click(item), ('refresh', self.app, item))
+
+    def test_timer_set_callback(self):
+        results = []
+
+        def tick(self, sender):
+            results.append((self, sender))
+        timer = rumps.Timer(lambda sender: results.append(sender), 1)
+        self.addCleanup(timer.stop)
+        timer.start()
+        _headless.advance(0)
+        Battery.tick = tick
+        self.addCleanup(delattr, Battery, 'tick')
+        timer.set_callback(Battery.tick)
+        _headless.advance(1)
+        self.assertEqual(results, [timer, (self.app, timer)])
+
+    def test_event_register_invalidates(self):
+        event = EventEmitter('test')
+        results = []
+
+        def on_event(self):
+            results.append(self)
+        _internal.build_method_cache(self.app)
+        Battery.on_event = on_event
+        self.addCleanup(delattr, Battery, 'on_event')
+        event.register(Battery.on_event)
+        event.emit()
+        self.assertEqual(results, [self.app])
+
+    def test_new_app_instance(self):
+        item = rumps.MenuItem('refresh', callback=Battery.refresh)
+        other = Battery('other')
+        setattr(rumps.App, '*app_instance', other)
+        # 缓存属于上一个实例，不需要显式失效
+        self.assertEqual(self.click(item), ('refresh', other, item))
+
+    def test_properties_are_not_evaluated(self):
+        class Guarded(Battery):
+            @property
+            def expensive(self):
+                raise AssertionError('property evaluated while building the cache')
+        app = Guarded('guarded')
+        self.use(app)
+        item = rumps.MenuItem('refresh', callback=Battery.refresh)
+        self.assertEqual(self.click(item), ('refresh', app, item))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+import unittest
+
+import battery
+import chart
+import ringbuffer
+import rollup
+
+try:
+    import PIL
+except ImportError:
+    PIL = None
+
+START = 1700006400
+
+
+class LttbTest(unittest.TestCase):
+    def test_keeps_endpoints(self):
+        xs = list(range(1000))
+        ys = [(x * 37) % 101 for x in xs]
+        points = chart.lttb(xs, ys, 50)
+        self.assertEqual(points[0], (0, ys[0]))
+        self.assertEqual(points[-1], (999, ys[-1]))
+
+    def test_at_most_threshold_points_in_order(self):
+        xs = list(range(5000))
+        ys = [x % 17 for x in xs]
+        for threshold in (3, 10, 480, 4999):
+            points = chart.lttb(xs, ys, threshold)
+            self.assertLessEqual(len(points), threshold)
+            self.assertEqual([x for x, _ in points], sorted(set(x for x, _ in points)))
+
+    def test_short_input_is_unchanged(self):
+        xs, ys = [1, 2, 3], [10, 20, 15]
+        self.assertEqual(chart.lttb(xs, ys, 480), [(1, 10), (2, 20), (3, 15)])
+        self.assertEqual(chart.lttb(xs, ys, 3), [(1, 10), (2, 20), (3, 15)])
+        self.assertEqual(chart.lttb([], [], 480), [])
+
+    def test_keeps_spikes(self):
+        xs = list(range(1000))
+        ys = [50] * 1000
+        ys[500] = 90
+        self.assertIn((500, 90), chart.lttb(xs, ys, 20))
+
+
+@unittest.skipIf(PIL is None, 'charts need PIL')
+class CacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.recent = ringbuffer.RingBuffer(2 * chart.HOUR)
+        self.rollups = rollup.RollupStore(self.directory)
+        self.addCleanup(self.rollups.close)
+        self.chart = chart.HistoryChart(self.directory, self.recent, self.rollups)
+        for t in range(START, START + chart.HOUR):
+            self.append(t, 80 - (t - START) // 600)
+
+    def append(self, t, percentage):
+        self.recent.append(battery.BatteryReading(float(t), percentage, -120, (0, percentage, 3950, -120, 25, 0)))
+
+    def test_same_state_hits(self):
+        now = START + chart.HOUR
+        path = self.chart.path(chart.HOUR, now)
+        self.assertEqual(self.chart.path(chart.HOUR, now), path)
+        self.assertEqual(self.chart.renders, 1)
+
+    def test_new_readings_rerender_once_per_pixel_column(self):
+        self.chart.path(chart.HOUR, START + chart.HOUR)
+        version = self.chart.version(chart.HOUR, START + chart.HOUR)
+        for t in range(START + chart.HOUR, START + chart.HOUR + 60):
+            self.append(t, 74)
+            self.chart.path(chart.HOUR, t + 0.5)
+        # 1 小时的图每个像素列 7.5 秒，1 分钟内只重新绘制 8 次左右，而不是每个读数一次
+        step = chart.HOUR / (chart.SIZE[0] * chart.SCALE - 1.0)
+        self.assertLessEqual(self.chart.renders, 1 + int(60 / step) + 1)
+        self.assertNotEqual(self.chart.version(chart.HOUR, START + chart.HOUR + 60), version)
+
+    def test_reading_in_the_current_column_keeps_the_version(self):
+        step = chart.HOUR / (chart.SIZE[0] * chart.SCALE - 1.0)
+        now = (START + chart.HOUR) // step * step + step / 2
+        self.chart.path(chart.HOUR, now)
+        version = self.chart.version(chart.HOUR, now)
+        self.append(START + chart.HOUR, 10)
+        self.assertEqual(self.chart.version(chart.HOUR, now), version)
+        self.chart.path(chart.HOUR, now)
+        self.assertEqual(self.chart.renders, 1)
+
+    def test_changed_pixels_miss(self):
+        self.chart.path(chart.HOUR, START + chart.HOUR)
+        # 跨过一个像素列后电量大幅下降，曲线改变
+        for t in range(START + chart.HOUR, START + chart.HOUR + 20):
+            self.append(t, 10)
+        self.chart.path(chart.HOUR, START + chart.HOUR + 20)
+        self.assertEqual(self.chart.renders, 2)
+
+    def test_spans_are_cached_separately(self):
+        now = START + chart.HOUR
+        self.rollups.add([(t, (0, 80, 3950, -120, 25, 0)) for t in range(START, START + chart.HOUR)])
+        paths = [self.chart.path(span, now) for _, span in chart.SPANS]
+        self.assertEqual(len(set(paths)), len(chart.SPANS))
+        self.assertEqual([self.chart.path(span, now) for _, span in chart.SPANS], paths)
+        self.assertEqual(self.chart.renders, len(chart.SPANS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import contextlib
+import io
+import threading
+import unittest
+
+import rumps
+from rumps import _headless
+from rumps.dispatch import UpdateQueue
+
+
+class Target(object):
+    title = None
+
+
+class UpdateQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = UpdateQueue()
+        self.calls = []
+
+    def test_calls_with_the_same_key_coalesce(self):
+        for i in range(5):
+            self.queue.call('refresh', lambda i=i: self.calls.append(('first', i)))
+        self.queue.call('refresh', self.calls.append, 'last')
+        # 在主线程处理队列之前不调用
+        self.assertEqual(self.calls, [])
+        _headless.advance(0)
+        self.assertEqual(self.calls, ['last'])
+        self.assertEqual(self.queue.applied, 1)
+        self.assertEqual(self.queue.coalesced, 5)
+        _headless.advance(1)
+        self.assertEqual(self.calls, ['last'])
+
+    def test_calls_from_other_threads(self):
+        threads = [threading.Thread(target=self.queue.call, args=('refresh', self.calls.append, n)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        _headless.advance(0)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.queue.queued, 8)
+
+    def test_different_keys_keep_first_queued_order(self):
+        target = Target()
+        self.queue.call('b', self.calls.append, 'b1')
+        self.queue.set(target, 'title', '50%')
+        self.queue.call('a', self.calls.append, 'a')
+        self.queue.call('b', self.calls.append, 'b2')
+        self.queue.set(target, 'title', '49%')
+        _headless.advance(0)
+        self.assertEqual(self.calls, ['b2', 'a'])
+        self.assertEqual(target.title, '49%')
+        self.assertEqual(self.queue.applied, 3)
+
+    def test_queue_again_after_flush(self):
+        self.queue.call('refresh', self.calls.append, 1)
+        _headless.advance(0)
+        self.queue.call('refresh', self.calls.append, 2)
+        _headless.advance(0)
+        self.assertEqual(self.calls, [1, 2])
+        self.assertEqual(self.queue.coalesced, 0)
+
+    def test_errors_do_not_stop_the_flush(self):
+        def broken():
+            raise RuntimeError('update failed')
+        self.queue.call('broken', broken)
+        self.queue.call('refresh', self.calls.append, 'ok')
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            _headless.advance(0)
+        self.assertEqual(self.calls, ['ok'])
+        self.assertIn('update failed', err.getvalue())
+
+    def test_shared_main_thread_queue(self):
+        self.assertIsInstance(rumps.main_thread, UpdateQueue)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import plistlib
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import driver
+
+
+class StubRunner(object):
+    """代替 subprocess：记录执行的命令，按命令名返回预设的 (退出码, 输出)。"""
+
+    def __init__(self, loaded=(), kextstat_code=0, load_code=0):
+        self.loaded = loaded
+        self.kextstat_code = kextstat_code
+        self.load_code = load_code
+        self.calls = []
+
+    def __call__(self, argv):
+        self.calls.append(argv)
+        if argv[0] == 'kextstat':
+            if self.kextstat_code:
+                return self.kextstat_code, 'kextstat: not found'
+            lines = ['Index Refs Address Size Wired Name (Version) UUID <Linked Against>']
+            for i, bundle in enumerate(self.loaded):
+                lines.append('{0} 0 0xffffff7f8 0x1000 0x1000 {1} (2.8) UUID <1 2 3>'.format(100 + i, bundle))
+            return 0, '\n'.join(lines)
+        return self.load_code, 'kext-load output'
+
+    def loads(self):
+        return [argv for argv in self.calls if argv[0] != 'kextstat']
+
+
+class DriverTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.ids = {}
+        for kext in driver.KEXTS:
+            contents = os.path.join(self.directory, kext, 'Contents')
+            os.makedirs(contents)
+            self.ids[kext] = 'com.alexandred.' + kext[:-len('.kext')]
+            with open(os.path.join(contents, 'Info.plist'), 'wb') as f:
+                plistlib.dump({'CFBundleIdentifier': self.ids[kext]}, f)
+        self.cache_path = os.path.join(self.directory, 'driver.json')
+        # 测试不一定以 root 运行，权限检查默认视为通过，需要时单独修改
+        patcher = mock.patch('driver.permissions_ok', return_value=True)
+        self.permissions_ok = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def probe(self, runner):
+        return driver.probe(self.directory, runner=runner, cache_path=self.cache_path)
+
+    def ensure_loaded(self, runner, **options):
+        return driver.ensure_loaded(self.directory, runner=runner, cache_path=self.cache_path, **options)
+
+    def test_all_loaded(self):
+        runner = StubRunner(loaded=self.ids.values())
+        self.assertEqual(self.probe(runner), ([], []))
+        self.assertEqual(self.ensure_loaded(runner), (0, None))
+        self.assertEqual(runner.loads(), [])
+
+    def test_needs_fix(self):
+        self.permissions_ok.side_effect = lambda path: not path.endswith('VoodooI2CHID.kext')
+        runner = StubRunner(loaded=self.ids.values())
+        self.assertEqual(self.probe(runner), (['VoodooI2CHID.kext'], []))
+        self.assertEqual(self.ensure_loaded(runner), (0, 'kext-load output'))
+        self.assertEqual(runner.loads(), [[os.path.join(self.directory, driver.LOAD_SCRIPT), 'fix', 'VoodooI2CHID.kext']])
+
+    def test_needs_load(self):
+        runner = StubRunner(loaded=[self.ids['VoodooI2C.kext']])
+        self.assertEqual(self.probe(runner), ([], ['VoodooI2CHID.kext']))
+        self.ensure_loaded(runner)
+        self.assertEqual(runner.loads(), [[os.path.join(self.directory, driver.LOAD_SCRIPT), 'load', 'VoodooI2CHID.kext']])
+
+    def test_kextstat_failure_loads_everything(self):
+        runner = StubRunner(loaded=self.ids.values(), kextstat_code=1)
+        self.assertEqual(self.probe(runner), ([], list(driver.KEXTS)))
+
+    def test_missing_kextstat_is_a_failed_probe(self):
+        with mock.patch('subprocess.run', side_effect=FileNotFoundError(2, 'No such file', 'kextstat')):
+            self.assertEqual(driver.loaded_bundle_ids(), set())
+            code, output = driver.ensure_loaded(self.directory, cache_path=self.cache_path)
+        self.assertNotEqual(code, 0)
+        self.assertIn('No such file', output)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_failed_load_is_not_cached(self):
+        runner = StubRunner(load_code=1)
+        self.assertEqual(self.ensure_loaded(runner), (1, 'kext-load output'))
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_cache_hit_skips_permission_walk(self):
+        runner = StubRunner(loaded=self.ids.values())
+        self.ensure_loaded(runner)
+        self.permissions_ok.reset_mock()
+        self.assertEqual(self.probe(runner), ([], []))
+        self.permissions_ok.assert_not_called()
+
+    def test_cache_miss_after_bundle_change(self):
+        runner = StubRunner(loaded=self.ids.values())
+        self.ensure_loaded(runner)
+        self.permissions_ok.reset_mock()
+        path = os.path.join(self.directory, 'VoodooI2C.kext')
+        stamp = driver.bundle_stamp(path)
+        os.utime(path, (stamp[0] + 10, stamp[0] + 10))
+        self.probe(runner)
+        self.assertEqual([c[0][0] for c in self.permissions_ok.call_args_list], [path])
+
+    def test_cache_miss_after_chmod(self):
+        runner = StubRunner(loaded=self.ids.values())
+        self.ensure_loaded(runner)
+        path = os.path.join(self.directory, 'VoodooI2CHID.kext')
+        mtime = os.stat(path).st_mtime
+        os.chmod(path, 0o700)
+        self.assertEqual(os.stat(path).st_mtime, mtime)
+        # 只有权限被改过的驱动重新检查
+        self.permissions_ok.return_value = False
+        self.assertEqual(self.probe(runner), (['VoodooI2CHID.kext'], []))
+
+    def test_force_runs_every_step(self):
+        runner = StubRunner(loaded=self.ids.values())
+        self.ensure_loaded(runner, force=True)
+        kexts = list(driver.KEXTS)
+        self.assertEqual(runner.loads(), [[os.path.join(self.directory, driver.LOAD_SCRIPT), 'fix'] + kexts +
+                                          ['load'] + kexts])
+
+
+class PermissionsTest(unittest.TestCase):
+    def test_wrong_mode(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        os.chmod(directory, 0o700)
+        self.assertFalse(driver.permissions_ok(directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
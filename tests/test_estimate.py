@@ -0,0 +1,49 @@
+import unittest
+
+import battery
+import estimate
+
+
+def reading(t, percentage, charge):
+    return battery.BatteryReading(float(t), percentage, charge, (0, percentage, 3950, charge, 25, 0))
+
+
+class EstimatorTest(unittest.TestCase):
+    def test_bouncing_charge_field_keeps_the_window(self):
+        estimator = estimate.Estimator()
+        result = None
+        for t in range(3600):
+            # 每 30 秒有一个读数的充电字段跳成正数
+            charge = 5 if t % 30 == 29 else -120
+            result = estimator.update(reading(t, 100 - t // 360, charge))
+        self.assertEqual(estimator.resets, 0)
+        self.assertIsNotNone(result)
+        self.assertFalse(result.charging)
+        # 每 6 分钟 1%，90% 还能用 9 小时左右
+        self.assertAlmostEqual(result.seconds / 3600.0, 9, delta=0.5)
+
+    def test_charger_connected_resets_after_debounce(self):
+        estimator = estimate.Estimator()
+        for t in range(600):
+            estimator.update(reading(t, 100 - t // 60, -120))
+        self.assertFalse(estimator.charging)
+        for t in range(600, 600 + int(estimate.DEBOUNCE)):
+            estimator.update(reading(t, 90, 500))
+            self.assertFalse(estimator.charging)
+        estimator.update(reading(600 + estimate.DEBOUNCE, 90, 500))
+        self.assertTrue(estimator.charging)
+        self.assertEqual(estimator.resets, 1)
+        # 窗口重新开始，跨度不足时没有估算
+        self.assertIsNone(estimator.estimate(600 + estimate.DEBOUNCE))
+
+    def test_reset_primes_from_the_next_reading(self):
+        estimator = estimate.Estimator()
+        estimator.update(reading(0, 50, -120))
+        estimator.reset()
+        estimator.update(reading(1, 50, 500))
+        self.assertTrue(estimator.charging)
+        self.assertEqual(estimator.resets, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+from rumps import _internal
+from rumps.events import EventEmitter
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('timed out waiting for background callbacks')
+        time.sleep(0.001)
+
+
+class OrderTest(unittest.TestCase):
+    def setUp(self):
+        self.event = EventEmitter('test')
+        self.calls = []
+
+    def handler(self, name):
+        def callback(*args):
+            self.calls.append((name,) + args)
+        callback.__name__ = name
+        return callback
+
+    def test_priority_then_registration_order(self):
+        low, first, second, high = (self.handler(name) for name in ('low', 'first', 'second', 'high'))
+        self.event.register(low, priority=-5)
+        self.event.register(first)
+        self.event.register(second)
+        self.event.register(high, priority=10)
+        self.assertEqual(self.event.callbacks, [high, first, second, low])
+        self.event.emit(1)
+        self.assertEqual(self.calls, [('high', 1), ('first', 1), ('second', 1), ('low', 1)])
+
+    def test_register_again_moves_the_callback(self):
+        a, b = self.handler('a'), self.handler('b')
+        self.event.register(a)
+        self.event.register(b)
+        self.event.register(a, priority=-1)
+        self.assertEqual(self.event.callbacks, [b, a])
+
+    def test_decorator_and_unregister(self):
+        @self.event.register(priority=3)
+        def decorated():
+            self.calls.append('decorated')
+
+        plain = self.event(self.handler('plain'))
+        self.assertEqual(self.event.callbacks, [decorated, plain])
+        self.assertTrue(self.event.unregister(decorated))
+        self.assertFalse(self.event.unregister(decorated))
+        self.event.emit()
+        self.assertEqual(self.calls, [('plain',)])
+
+    def test_errors_are_isolated(self):
+        def broken():
+            raise RuntimeError('handler failed')
+        self.event.register(self.handler('before'), priority=1)
+        self.event.register(broken)
+        self.event.register(self.handler('after'), priority=-1)
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.event.emit()
+        self.assertEqual(self.calls, [('before',), ('after',)])
+        self.assertIn('handler failed', err.getvalue())
+        metrics = self.event.metrics()
+        self.assertEqual((metrics['emits'], metrics['calls'], metrics['errors']), (1, 3, 1))
+
+    def test_registering_while_emitting(self):
+        def add():
+            self.event.register(self.handler('added'))
+        self.event.register(add)
+        self.event.emit()
+        # 正在分发的列表不变，新回调下次才调用
+        self.assertEqual(self.calls, [])
+        self.event.emit()
+        self.assertEqual(self.calls, [('added',)])
+
+
+class BackgroundTest(unittest.TestCase):
+    def setUp(self):
+        self.event = EventEmitter('test')
+        self.releases = []
+
+    def tearDown(self):
+        for release in self.releases:
+            release.set()
+
+    def blocking(self, calls, started=None):
+        release = threading.Event()
+        self.releases.append(release)
+
+        def callback():
+            calls.append(threading.current_thread())
+            if started is not None:
+                started.set()
+            release.wait(5)
+        return callback, release
+
+    def test_runs_on_the_worker_pool(self):
+        calls = []
+        self.event.register(lambda: calls.append(threading.current_thread()), background=True)
+        self.event.emit()
+        wait_for(lambda: calls)
+        self.assertIsNot(calls[0], threading.main_thread())
+        self.assertTrue(calls[0].name.startswith('rumps-worker'))
+
+    def test_skipped_while_running(self):
+        calls = []
+        started = threading.Event()
+        callback, release = self.blocking(calls, started)
+        self.event.register(callback, background=True)
+        self.event.emit()
+        started.wait(5)
+        self.event.emit()
+        self.event.emit()
+        self.assertEqual(self.event.metrics()['skipped'], 2)
+        release.set()
+        wait_for(lambda: self.event.metrics()['calls'] == 1)
+        self.event.emit()
+        wait_for(lambda: len(calls) == 2)
+
+    def test_foreground_handlers_do_not_wait(self):
+        calls, order = [], []
+        callback, release = self.blocking(calls)
+        self.event.register(callback, priority=10, background=True)
+        self.event.register(lambda: order.append('foreground'))
+        self.event.emit()
+        self.assertEqual(order, ['foreground'])
+        release.set()
+
+    def test_timeout_while_running_is_reported(self):
+        calls = []
+        started = threading.Event()
+        callback, release = self.blocking(calls, started)
+        self.event.register(callback, background=True, timeout=0.05)
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.event.emit()
+            started.wait(5)
+            wait_for(lambda: self.event.metrics()['timeouts'] == 1)
+        self.assertIn('did not finish within 0.05s', err.getvalue())
+        # 线程不能中断：回调继续运行，结束之后才可以再次调用
+        self.event.emit()
+        self.assertEqual(self.event.metrics()['skipped'], 1)
+        release.set()
+        wait_for(lambda: self.event.metrics()['calls'] == 1)
+
+    def test_timeout_cancels_a_queued_call(self):
+        # 占满共享的工作线程，后台回调只能排队
+        busy = []
+        workers = _internal.worker_pool()._max_workers
+        for _ in range(workers):
+            started = threading.Event()
+            callback, _ = self.blocking(busy, started)
+            _internal.worker_pool().submit(callback)
+            started.wait(5)
+        calls = []
+        self.event.register(lambda: calls.append(1), background=True, timeout=0.05)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.event.emit()
+            wait_for(lambda: self.event.metrics()['timeouts'] == 1)
+        for release in self.releases:
+            release.set()
+        wait_for(lambda: len(busy) == workers)
+        # 取消之后不再运行，下一次 emit 正常调用
+        self.event.emit()
+        wait_for(lambda: calls)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.event.metrics()['skipped'], 0)
+
+    def test_background_errors_are_counted(self):
+        def broken():
+            raise RuntimeError('background failed')
+        self.event.register(broken, background=True)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.event.emit()
+            wait_for(lambda: self.event.metrics()['calls'] == 1)
+        self.assertEqual(self.event.metrics()['errors'], 1)
+        wait_for(lambda: not self.event._handlers[0].running)
+
+
+if __name__ == '__main__':
+    unittest.main()
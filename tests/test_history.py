@@ -0,0 +1,80 @@
+import importlib.util
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import history
+
+
+def trace(rng, n, t=1700000000):
+    # 大部分时间字段不变（游程），偶尔时间间隔或字段变化，包括时钟回拨
+    fields = [0, 50, 3950, -120, 25, 0]
+    samples = []
+    for _ in range(n):
+        t += rng.choice([1, 1, 2, 0, -3, 7]) if rng.random() < 0.1 else 1
+        for i in range(len(fields)):
+            if rng.random() < 0.03:
+                fields[i] += rng.randint(-300, 300)
+        samples.append((t, tuple(fields)))
+    return samples
+
+
+@unittest.skipUnless(importlib.util.find_spec('numpy'), 'needs numpy')
+class ColumnsTest(unittest.TestCase):
+    def assertSame(self, data):
+        expected = history.decode(data)[0]
+        columns = history.columns(data)
+        if not expected:
+            self.assertIsNone(columns)
+            return
+        t, fields = history.expand(columns)
+        self.assertEqual(t.tolist(), [s[0] for s in expected])
+        self.assertEqual([tuple(f) for f in fields.tolist()], [s[1] for s in expected])
+
+    def test_matches_decode(self):
+        rng = random.Random(5)
+        for _ in range(100):
+            samples = trace(rng, rng.randint(1, 2000))
+            self.assertSame(history.encode_segment(samples))
+            # 每次提交一个 DELTA 块，中间偶尔重新开始 KEYFRAME，结尾可能写了一半
+            data = bytearray()
+            state = None
+            i = 0
+            while i < len(samples):
+                count = rng.randint(1, 100)
+                if rng.random() < 0.1:
+                    state = None
+                block, state = history.encode_block(samples[i:i + count], state)
+                data += block
+                i += count
+            if rng.random() < 0.5:
+                data = data[:rng.randint(0, len(data))]
+            self.assertSame(bytes(data))
+
+    def test_read_columns_range(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        rng = random.Random(6)
+        # read() 在第一个不早于 end 的读数处停止，这里的时间只向前走
+        samples = sorted(trace(rng, 2 * 86400), key=lambda s: s[0])
+        segments = {}
+        for sample in samples:
+            segments.setdefault(history.segment_name(sample[0]), []).append(sample)
+        for name, part in segments.items():
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(history.encode_segment(part))
+        store = history.HistoryStore(directory)
+        middle = samples[len(samples) // 2][0]
+        for start, end in ((None, None), (middle, None), (None, middle), (middle - 3600.5, middle + 7200)):
+            expected = [(r.timestamp, r.fields) for r in store.read(start, end)]
+            t, fields = history.expand(store.read_columns(start, end))
+            self.assertEqual(list(zip(t.tolist(), [tuple(f) for f in fields.tolist()])), expected)
+            columns = store.read_columns()
+            t, _ = history.expand(history.select(columns, start, end, ordered=True))
+            self.assertEqual(t.tolist(), [s[0] for s in expected])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import rumps
+from rumps import rumps as _rumps
+
+
+class ImageCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        rumps.clear_image_cache()
+        self.addCleanup(rumps.clear_image_cache)
+        self.start = rumps.image_cache_info()
+
+    def icon(self, name, data=b'png'):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def counts(self):
+        info = rumps.image_cache_info()
+        return info['hits'] - self.start['hits'], info['misses'] - self.start['misses']
+
+    def test_hit_and_miss(self):
+        path = self.icon('a.png')
+        image = _rumps._nsimage_from_file(path)
+        self.assertIs(_rumps._nsimage_from_file(path), image)
+        self.assertEqual(self.counts(), (1, 1))
+        self.assertEqual(rumps.image_cache_info()['size'], 1)
+        self.assertEqual(image.size(), (32, 18))
+
+    def test_template_and_dimensions_are_part_of_the_key(self):
+        path = self.icon('a.png')
+        plain = _rumps._nsimage_from_file(path)
+        template = _rumps._nsimage_from_file(path, template=True)
+        large = _rumps._nsimage_from_file(path, dimensions=(64, 36))
+        self.assertEqual(len(set(map(id, (plain, template, large)))), 3)
+        self.assertTrue(template.isTemplate())
+        self.assertEqual(large.size(), (64, 36))
+        # 列表和元组形式的尺寸是同一个键
+        self.assertIs(_rumps._nsimage_from_file(path, dimensions=[64, 36]), large)
+        self.assertEqual(self.counts(), (1, 3))
+
+    def test_changed_file_is_reloaded(self):
+        path = self.icon('a.png')
+        image = _rumps._nsimage_from_file(path)
+        self.icon('a.png', b'a larger png')
+        self.assertIsNot(_rumps._nsimage_from_file(path), image)
+        st = os.stat(path)
+        reloaded = _rumps._nsimage_from_file(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(_rumps._nsimage_from_file(path), reloaded)
+        self.assertEqual(self.counts(), (1, 3))
+
+    def test_lru_eviction_order(self):
+        size = rumps.image_cache_info()['maxsize']
+        paths = [self.icon('{0}.png'.format(i)) for i in range(size + 1)]
+        images = [_rumps._nsimage_from_file(path) for path in paths[:size]]
+        # 访问第一个之后，最久没有用过的是第二个
+        self.assertIs(_rumps._nsimage_from_file(paths[0]), images[0])
+        _rumps._nsimage_from_file(paths[size])
+        self.assertEqual(rumps.image_cache_info()['size'], size)
+        self.assertIs(_rumps._nsimage_from_file(paths[0]), images[0])
+        self.assertIs(_rumps._nsimage_from_file(paths[2]), images[2])
+        self.assertIsNot(_rumps._nsimage_from_file(paths[1]), images[1])
+        self.assertEqual(self.counts(), (3, size + 2))
+
+    def test_clear_one_file(self):
+        a, b = self.icon('a.png'), self.icon('b.png')
+        image_a = _rumps._nsimage_from_file(a)
+        image_a_template = _rumps._nsimage_from_file(a, template=True)
+        image_b = _rumps._nsimage_from_file(b)
+        rumps.clear_image_cache(a)
+        self.assertEqual(rumps.image_cache_info()['size'], 1)
+        self.assertIs(_rumps._nsimage_from_file(b), image_b)
+        self.assertIsNot(_rumps._nsimage_from_file(a), image_a)
+        self.assertIsNot(_rumps._nsimage_from_file(a, template=True), image_a_template)
+
+    def test_missing_file(self):
+        with self.assertRaises(IOError):
+            _rumps._nsimage_from_file(os.path.join(self.directory, 'missing.png'))
+        self.assertEqual(rumps.image_cache_info()['size'], 0)
+
+    def test_menu_item_icons_share_images(self):
+        path = self.icon('a.png')
+        first, second = rumps.MenuItem('a', icon=path), rumps.MenuItem('b', icon=path)
+        self.assertIs(first._menuitem.image(), second._menuitem.image())
+        first.set_icon(path, template=True)
+        self.assertIsNot(first._menuitem.image(), second._menuitem.image())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import history
+import ingest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+START = 1700006400
+
+
+def trace(start, seconds):
+    # 每秒一个读数，电量每 10 分钟下降 1%
+    return [(start + i, (0, 100 - i // 600, 3950, -120, 25, 0)) for i in range(seconds)]
+
+
+@unittest.skipIf(numpy is None, 'ingest summaries need numpy')
+class IngestTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.device = os.path.join(self.directory, 'mac-01')
+        os.makedirs(os.path.join(self.device, 'history'))
+
+    def write_history(self, samples):
+        path = os.path.join(self.device, 'history', history.segment_name(samples[0][0]))
+        with open(path, 'wb') as f:
+            f.write(history.encode_segment(samples))
+        return path
+
+    def write_capture(self, name, lines, mtime=None):
+        path = os.path.join(self.device, name)
+        with open(path, 'w') as f:
+            f.write(''.join(line + '\n' for line in lines))
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def summarize(self, paths):
+        return ingest.summarize(numpy, 'mac-01', [ingest.load(path) for path in paths])
+
+    def test_history_matches_decode(self):
+        samples = trace(START, 3 * 3600)
+        path = self.write_history(samples)
+        part = ingest.load(path)
+        self.assertEqual(list(part['timestamp']), [float(t) for t, _ in samples])
+        self.assertEqual(list(part['percentage']), [fields[1] for _, fields in samples])
+        self.assertEqual(list(part['charge']), [fields[3] for _, fields in samples])
+        self.assertEqual(part['clock_backwards'], 0)
+
+    def test_overlapping_capture_is_not_counted_twice(self):
+        samples = trace(START, 2 * 3600)
+        only_history = self.summarize([self.write_history(samples)])
+        # 串口记录覆盖历史的后半段，再多出 10 分钟
+        extra = trace(START + 3600, 3600 + 600)
+        lines = ['{0} +BATCG={1}'.format(t, ','.join(str(v) for v in fields)) for t, fields in extra]
+        capture = self.write_capture('capture.log', lines)
+        row = self.summarize([self.write_history(samples), capture])
+        self.assertEqual(row['readings'], 2 * 3600 + 600)
+        self.assertEqual(row['start'], START)
+        self.assertEqual(row['end'], START + 2 * 3600 + 599)
+        self.assertEqual(row['gaps'], 0)
+        self.assertEqual(row['jumps'], 0)
+        self.assertAlmostEqual(row['drain_p50'], only_history['drain_p50'])
+
+    def test_untimed_lines_end_at_mtime(self):
+        mtime = START + 5000
+        lines = ['+BATCG=0,{0},3950,-120,25,0'.format(90 - i // 600) for i in range(1200)]
+        lines.insert(10, 'OK')
+        lines.insert(20, '+BATCG=0,broken')
+        part = ingest.load(self.write_capture('untimed.log', lines, mtime))
+        self.assertEqual(len(part['timestamp']), 1200)
+        self.assertEqual(part['timestamp'][-1], mtime)
+        self.assertEqual(part['timestamp'][0], mtime - 1199 * ingest.CAPTURE_INTERVAL)
+        self.assertEqual(part['unparsed'], 1)
+        row = ingest.summarize(numpy, 'mac-01', [part])
+        self.assertEqual(row['readings'], 1200)
+        self.assertEqual(row['unparsed'], 1)
+        self.assertAlmostEqual(row['drain_p50'], 6.0)
+
+    def test_clock_backwards(self):
+        times = [START + i for i in range(100)] + [START + 50 + i for i in range(100)] + [START + 10]
+        lines = ['{0} +BATCG=0,80,3950,-120,25,0'.format(t) for t in times]
+        part = ingest.load(self.write_capture('capture.log', lines))
+        self.assertEqual(part['clock_backwards'], 2)
+        row = ingest.summarize(numpy, 'mac-01', [part])
+        self.assertEqual(row['clock_backwards'], 2)
+        # 回拨后重复的时间只算一次
+        self.assertEqual(row['readings'], 150)
+
+    def test_ingest_groups_by_device(self):
+        self.write_history(trace(START, 3600))
+        other = os.path.join(self.directory, 'mac-02')
+        os.makedirs(other)
+        with open(os.path.join(other, 'capture.log'), 'w') as f:
+            f.write('{0} +BATCG=0,50,3950,500,25,0\n'.format(START))
+        columns = ingest.ingest([self.directory], 1)
+        self.assertEqual(columns['device'], ['mac-01', 'mac-02'])
+        self.assertEqual(columns['readings'], [3600, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import contextlib
+import io
+import unittest
+
+import rumps
+from rumps import _headless
+from rumps.rumps import Menu, SeparatorMenuItem
+
+OPERATIONS = ('NSMenu.insertItem_atIndex_', 'NSMenu.removeItem_', 'NSMenu.indexOfItem_', 'NSMenu.removeAllItems')
+
+
+def native(menu):
+    """NSMenu 中实际的顺序，分隔线记为 None。"""
+    return [None if item.isSeparatorItem() else item.title() for item in menu._menu.itemArray()]
+
+
+def operations():
+    return dict((name, _headless.counters[name]) for name in OPERATIONS)
+
+
+class ReconcileTest(unittest.TestCase):
+    def setUp(self):
+        self.menu = Menu()
+
+    def reconcile(self, desired):
+        before = operations()
+        count = self.menu.reconcile(desired)
+        after = operations()
+        return count, dict((name, after[name] - before[name]) for name in OPERATIONS)
+
+    def test_build_from_empty(self):
+        count, calls = self.reconcile(['a', 'b', None, 'c'])
+        self.assertEqual(count, 4)
+        self.assertEqual(calls['NSMenu.insertItem_atIndex_'], 4)
+        self.assertEqual(native(self.menu), ['a', 'b', None, 'c'])
+        self.assertEqual([k for k, v in self.menu.items() if not isinstance(v, SeparatorMenuItem)], ['a', 'b', 'c'])
+
+    def test_second_pass_is_a_no_op(self):
+        desired = ['a', ('b', ['b1', 'b2']), None, 'c']
+        self.menu.reconcile(desired)
+        count, calls = self.reconcile(desired)
+        self.assertEqual(count, 0)
+        self.assertEqual(calls, dict.fromkeys(OPERATIONS, 0))
+
+    def test_reorder_moves_only_what_changed(self):
+        self.menu.reconcile(['a', 'b', 'c', 'd', 'e'])
+        items = dict(self.menu)
+        count, calls = self.reconcile(['a', 'c', 'd', 'b', 'e'])
+        self.assertEqual(count, 2)
+        self.assertEqual(calls['NSMenu.removeItem_'], 1)
+        self.assertEqual(calls['NSMenu.insertItem_atIndex_'], 1)
+        self.assertEqual(calls['NSMenu.indexOfItem_'], 0)
+        self.assertEqual(native(self.menu), ['a', 'c', 'd', 'b', 'e'])
+        self.assertEqual(list(self.menu), ['a', 'c', 'd', 'b', 'e'])
+        for key, value in self.menu.items():
+            self.assertIs(value, items[key])
+
+    def test_insert_and_remove(self):
+        self.menu.reconcile(['a', 'b', 'c'])
+        count, calls = self.reconcile(['x', 'a', 'c', 'y'])
+        self.assertEqual(count, 3)
+        self.assertEqual(calls['NSMenu.removeItem_'], 1)
+        self.assertEqual(native(self.menu), ['x', 'a', 'c', 'y'])
+        self.assertEqual(list(self.menu), ['x', 'a', 'c', 'y'])
+
+    def test_existing_items_keep_callbacks(self):
+        clicked = []
+        item = rumps.MenuItem('a', callback=clicked.append)
+        self.menu.reconcile([item, 'b'])
+        self.menu.reconcile(['b', 'a'])
+        self.assertIs(self.menu['a'], item)
+        self.assertIsNotNone(self.menu['a'].callback)
+
+    def test_separators_are_matched_by_position(self):
+        self.menu.reconcile(['a', None, 'b', None, 'c'])
+        separators = [v for v in self.menu.values() if isinstance(v, SeparatorMenuItem)]
+        # 两个分隔线都保留，只移动 b 和 c
+        count, calls = self.reconcile(['a', None, 'c', None, 'b'])
+        self.assertEqual(count, 4)
+        self.assertEqual(calls['NSMenu.removeItem_'], 2)
+        self.assertEqual(native(self.menu), ['a', None, 'c', None, 'b'])
+        self.assertEqual([v for v in self.menu.values() if isinstance(v, SeparatorMenuItem)], separators)
+        # 多出来的是后面的分隔线
+        count, _ = self.reconcile(['a', 'c', None, 'b'])
+        self.assertEqual(count, 3)
+        self.assertEqual(native(self.menu), ['a', 'c', None, 'b'])
+        self.assertEqual([v for v in self.menu.values() if isinstance(v, SeparatorMenuItem)], separators[:1])
+
+    def test_submenus(self):
+        self.menu.reconcile(['a', ('b', ['b1', 'b2', 'b3'])])
+        submenu = self.menu['b']
+        self.assertEqual(native(submenu), ['b1', 'b2', 'b3'])
+        # 删除 b2，再移动 b1 和 b3 中的一个
+        count, _ = self.reconcile(['a', ('b', ['b3', 'b1'])])
+        self.assertEqual(count, 3)
+        self.assertIs(self.menu['b'], submenu)
+        self.assertEqual(native(submenu), ['b3', 'b1'])
+        self.assertEqual(list(submenu), ['b3', 'b1'])
+        # 没有给出子菜单时去掉子菜单
+        self.menu.reconcile(['a', 'b'])
+        self.assertIsNone(self.menu['b']._menuitem.submenu())
+        self.assertEqual(len(self.menu['b']), 0)
+
+    def test_duplicate_keys(self):
+        with self.assertRaises(ValueError):
+            self.menu.reconcile(['a', 'b', 'a'])
+
+    def test_matches_imperative_menu(self):
+        # 和逐个调用 add / insert_after 得到的菜单一致
+        expected = Menu()
+        for title in ['a', 'b', 'c']:
+            expected.add(title)
+        expected.insert_after('a', 'x')
+        del expected['c']
+        self.menu.reconcile(['a', 'b', 'c'])
+        self.menu.reconcile(['a', 'x', 'b'])
+        self.assertEqual(native(self.menu), native(expected))
+        self.assertEqual(list(self.menu), list(expected))
+
+
+class ProviderTest(unittest.TestCase):
+    def setUp(self):
+        self.item = rumps.MenuItem('details')
+        self.calls = []
+        self.version = 1
+
+    def provider(self, sender):
+        self.calls.append(sender)
+        return ['v{0}'.format(self.version), None, 'cycles']
+
+    def open(self):
+        # headless 的 NSMenu.update() 模拟菜单打开：先让 delegate 填充
+        self.item._menu.update()
+
+    def test_called_once_per_version(self):
+        self.item.set_provider(self.provider, version=lambda: self.version)
+        self.assertEqual(self.calls, [])
+        self.open()
+        self.open()
+        self.assertEqual(self.calls, [self.item])
+        self.assertEqual(native(self.item), ['v1', None, 'cycles'])
+        self.version = 2
+        self.open()
+        self.open()
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(native(self.item), ['v2', None, 'cycles'])
+
+    def test_without_version_runs_every_time(self):
+        self.item.set_provider(self.provider)
+        self.open()
+        self.open()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_invalidate(self):
+        self.item.set_provider(self.provider, version=lambda: self.version)
+        self.open()
+        self.item.invalidate()
+        self.open()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_unchanged_version_does_not_touch_the_menu(self):
+        self.item.set_provider(self.provider, version=lambda: self.version)
+        self.open()
+        before = operations()
+        self.open()
+        self.assertEqual(operations(), before)
+
+    def test_remove_provider(self):
+        self.item.set_provider(self.provider, version=lambda: self.version)
+        self.open()
+        self.item.set_provider(None)
+        self.assertIsNone(self.item._menu.delegate())
+        self.version = 2
+        self.open()
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(native(self.item), ['v1', None, 'cycles'])
+
+    def test_errors_do_not_escape(self):
+        def broken(sender):
+            raise RuntimeError('provider failed')
+        self.item.set_provider(broken)
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.open()
+        self.assertEqual(len(self.item), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import contextlib
+import io
+import time
+import unittest
+
+from rumps import _headless
+from rumps.notifications import NotificationQueue
+
+# 本地时间 2026-10-19 21:59:00，虚拟时钟的 0 秒
+BASE = time.mktime((2026, 10, 19, 21, 59, 0, 0, 0, -1))
+
+
+class NotificationQueueTest(unittest.TestCase):
+    def queue(self, **options):
+        self.delivered = []
+        start = _headless.now()
+        self.clock = lambda: BASE + _headless.now() - start
+        return NotificationQueue(clock=self.clock, deliver=self.deliver, **options)
+
+    def deliver(self, title, subtitle, message, **kwargs):
+        self.delivered.append((title, message))
+
+    def messages(self):
+        return [message for _, message in self.delivered]
+
+    def test_rate_limit_window(self):
+        queue = self.queue(limit=2, period=60)
+        for i in range(5):
+            queue.push('battery', '', str(i))
+        _headless.advance(0)
+        self.assertEqual(self.messages(), ['0', '1'])
+        self.assertEqual(queue.pending(), 3)
+        _headless.advance(59)
+        self.assertEqual(len(self.delivered), 2)
+        _headless.advance(1)
+        self.assertEqual(self.messages(), ['0', '1', '2', '3'])
+        _headless.advance(60)
+        self.assertEqual(self.messages(), ['0', '1', '2', '3', '4'])
+        self.assertEqual(queue.delivered, 5)
+        self.assertEqual(queue.pending(), 0)
+
+    def test_window_slides(self):
+        queue = self.queue(limit=2, period=60)
+        queue.push('battery', '', 'a')
+        _headless.advance(30)
+        queue.push('battery', '', 'b')
+        queue.push('battery', '', 'c')
+        _headless.advance(0)
+        self.assertEqual(self.messages(), ['a', 'b'])
+        # 第一个发送的时间滑出窗口之后就可以再发一个
+        _headless.advance(29)
+        self.assertEqual(len(self.delivered), 2)
+        _headless.advance(1)
+        self.assertEqual(self.messages(), ['a', 'b', 'c'])
+
+    def test_same_key_coalesces(self):
+        queue = self.queue(limit=1, period=60)
+        queue.push('battery', '', 'first', key='low')
+        _headless.advance(0)
+        for percentage in (19, 18, 17):
+            queue.push('battery', '', '{0}%'.format(percentage), key='low')
+        queue.push('charger', '', 'connected', key='charger')
+        _headless.advance(60)
+        self.assertEqual(self.messages(), ['first', '17%'])
+        self.assertEqual(queue.coalesced, 2)
+        _headless.advance(60)
+        self.assertEqual(self.messages(), ['first', '17%', 'connected'])
+
+    def test_quiet_hours_hold_until_they_end(self):
+        queue = self.queue(quiet_hours=(22, 7))
+        queue.push('battery', '', 'before')
+        _headless.advance(0)
+        self.assertEqual(self.messages(), ['before'])
+        _headless.advance(60)
+        self.assertEqual(queue.quiet_remaining(), 9 * 3600)
+        queue.push('battery', '', 'a', key='low')
+        queue.push('battery', '', 'b')
+        queue.push('battery', '', 'c', key='low')
+        _headless.advance(9 * 3600 - 1)
+        self.assertEqual(self.messages(), ['before'])
+        self.assertEqual(queue.pending(), 2)
+        # 7:00 结束，按第一次放入的顺序发送
+        _headless.advance(1)
+        self.assertEqual(self.messages(), ['before', 'c', 'b'])
+        self.assertEqual(queue.quiet_remaining(), 0)
+
+    def test_quiet_hours_and_rate_limit(self):
+        queue = self.queue(limit=1, period=600, quiet_hours=(22, 7))
+        _headless.advance(60)
+        for i in range(3):
+            queue.push('battery', '', str(i))
+        _headless.advance(9 * 3600)
+        self.assertEqual(self.messages(), ['0'])
+        _headless.advance(600)
+        self.assertEqual(self.messages(), ['0', '1'])
+
+    def test_quiet_hours_within_a_day(self):
+        queue = self.queue(quiet_hours=(12.5, 14))
+        at = time.mktime((2026, 10, 19, 13, 0, 0, 0, 0, -1))
+        self.assertEqual(queue.quiet_remaining(at), 3600)
+        self.assertEqual(queue.quiet_remaining(at - 1800), 5400)
+        self.assertEqual(queue.quiet_remaining(at + 3600), 0)
+        self.assertEqual(queue.quiet_remaining(at - 3600), 0)
+
+    def test_delivery_errors_do_not_block_the_queue(self):
+        queue = self.queue()
+
+        def deliver(title, subtitle, message, **kwargs):
+            if message == 'broken':
+                raise RuntimeError('notification center unavailable')
+            self.delivered.append((title, message))
+        queue._deliver = deliver
+        queue.push('battery', '', 'broken')
+        queue.push('battery', '', 'ok')
+        with contextlib.redirect_stderr(io.StringIO()):
+            _headless.advance(0)
+        self.assertEqual(self.messages(), ['ok'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import importlib.util
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import serialread
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeTimer(object):
+    # 不启动线程，由测试手动触发
+    created = []
+
+    def __init__(self, interval, function, args=None, kwargs=None):
+        self.function = function
+        self.args = args or ()
+        self.started = False
+        self.cancelled = False
+        FakeTimer.created.append(self)
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+    def fire(self):
+        self.started = False
+        self.function(*self.args)
+
+
+class FakePort(object):
+    opened = []
+
+    def __init__(self, port, baudrate, timeout=None):
+        self.reads = 0
+        self.closed = False
+        FakePort.opened.append(self)
+
+    def write(self, data):
+        pass
+
+    def readline(self):
+        self.reads += 1
+        return b''
+
+    def close(self):
+        self.closed = True
+
+
+def pending():
+    return [t for t in FakeTimer.created if t.started and not t.cancelled]
+
+
+class SoftRestartTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.home = tempfile.mkdtemp()
+        path = os.path.join(ROOT, 'TNTgo Boom.py')
+        spec = importlib.util.spec_from_file_location('tntgo_boom', path)
+        cls.boom = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(os.environ, {'RUMPS_HEADLESS_HOME': cls.home}):
+            spec.loader.exec_module(cls.boom)
+
+    @classmethod
+    def tearDownClass(cls):
+        for store in (cls.boom.HISTORY, cls.boom.ROLLUPS, cls.boom.SESSIONS, cls.boom.WEAR):
+            store.close()
+        shutil.rmtree(cls.home)
+
+    def setUp(self):
+        FakeTimer.created = []
+        FakePort.opened = []
+        serial = types.ModuleType('serial')
+        serial.Serial = FakePort
+        patches = [mock.patch.dict(sys.modules, {'serial': serial}),
+                   mock.patch.object(serialread, 'Timer', FakeTimer)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.addCleanup(serialread.stop)
+        serialread.stop()
+        self.app = self.boom.AwesomeStatusBarApp()
+
+    def test_restart_closes_the_old_port_and_keeps_one_timer(self):
+        serialread.start()
+        old_port, = FakePort.opened
+        old_timer, = pending()
+        self.app.soft_restart()
+        self.assertTrue(old_port.closed)
+        self.assertTrue(old_timer.cancelled)
+        self.assertEqual(len(FakePort.opened), 2)
+        new_port = FakePort.opened[1]
+        self.assertFalse(new_port.closed)
+        self.assertIs(serialread.ser, new_port)
+        timer, = pending()
+        timer.fire()
+        self.assertEqual(len(pending()), 1)
+        self.assertEqual(old_port.reads, 1)
+        self.assertEqual(new_port.reads, 2)
+
+    def test_tick_waiting_during_restart_does_not_start_a_second_reader(self):
+        serialread.start()
+        old_timer, = pending()
+        # 旧定时器已经触发、正在等锁时发生了重启
+        self.app.soft_restart()
+        count = len(FakeTimer.created)
+        old_timer.fire()
+        self.assertEqual(len(FakeTimer.created), count)
+        self.assertEqual(len(pending()), 1)
+        self.assertEqual(FakePort.opened[1].reads, 1)
+
+    def test_start_after_restart_is_a_no_op(self):
+        self.app.soft_restart()
+        serialread.start()
+        self.assertEqual(len(FakePort.opened), 1)
+        self.assertEqual(len(pending()), 1)
+
+    def test_menu_is_rebuilt_without_duplicates(self):
+        self.app.soft_restart()
+        keys = list(self.app.menu.keys())
+        self.app.soft_restart()
+        self.assertEqual(list(self.app.menu.keys()), keys)
+        self.assertEqual(len(set(keys)), len(keys))
+        for title in ("电量历史", "加载驱动", "重启TNTgo Boom"):
+            self.assertIn(title, keys)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+import battery
+import ringbuffer
+
+START = 1700006400
+
+
+def reading(t):
+    fields = (0, t % 100, 3950 + t % 7, -120 - t % 5, 25, t % 3)
+    return battery.BatteryReading(float(START + t), fields[1], fields[3], fields)
+
+
+class RingBufferTest(object):
+    use_numpy = None
+
+    def buffer(self, count, capacity=10):
+        buffer = ringbuffer.RingBuffer(capacity, use_numpy=self.use_numpy)
+        for t in range(count):
+            buffer.append(reading(t))
+        return buffer
+
+    def assertWindow(self, window, ts):
+        expected = [reading(t) for t in ts]
+        self.assertEqual(list(window.timestamp), [r.timestamp for r in expected])
+        self.assertEqual(list(window.percentage), [r.percentage for r in expected])
+        self.assertEqual(list(window.charge), [r.charge for r in expected])
+        for i, column in enumerate(window.fields):
+            self.assertEqual(list(column), [r.fields[i] for r in expected])
+
+    def test_empty(self):
+        buffer = ringbuffer.RingBuffer(10, use_numpy=self.use_numpy)
+        self.assertEqual(len(buffer), 0)
+        self.assertIsNone(buffer.latest())
+        self.assertWindow(buffer.last(), [])
+        self.assertWindow(buffer.since(START), [])
+
+    def test_before_wraparound(self):
+        buffer = self.buffer(7)
+        self.assertEqual(len(buffer), 7)
+        self.assertWindow(buffer.last(), range(7))
+        self.assertWindow(buffer.last(3), range(4, 7))
+        self.assertWindow(buffer.since(START + 5), range(5, 7))
+        self.assertEqual(buffer.latest(), reading(6))
+
+    def test_fill_past_capacity(self):
+        for count in (10, 11, 19, 20, 23, 57):
+            buffer = self.buffer(count)
+            self.assertEqual(len(buffer), 10)
+            self.assertEqual(buffer.version, count)
+            # 只保留最近 10 个读数，窗口跨过数组末尾时仍然按时间排列
+            self.assertWindow(buffer.last(), range(count - 10, count))
+            self.assertWindow(buffer.last(4), range(count - 4, count))
+            self.assertWindow(buffer.last(100), range(count - 10, count))
+            self.assertWindow(buffer.since(START + count - 3), range(count - 3, count))
+            self.assertWindow(buffer.since(START), range(count - 10, count))
+            self.assertWindow(buffer.since(START + count), [])
+            self.assertEqual(buffer.latest(), reading(count - 1))
+
+    def test_every_head_position(self):
+        buffer = self.buffer(0)
+        for t in range(35):
+            buffer.append(reading(t))
+            start = max(0, t - 9)
+            self.assertWindow(buffer.last(), range(start, t + 1))
+            self.assertWindow(buffer.since(START + t - 5), range(max(start, t - 5), t + 1))
+
+    def test_latest_types(self):
+        latest = self.buffer(13).latest()
+        self.assertIsInstance(latest.timestamp, float)
+        self.assertTrue(all(type(value) is int for value in latest.fields))
+
+
+class PythonTest(RingBufferTest, unittest.TestCase):
+    use_numpy = False
+
+    def test_storage(self):
+        buffer = self.buffer(3)
+        self.assertFalse(buffer.use_numpy)
+        self.assertEqual(buffer.nbytes, (8 + 6 * 4) * 2 * 10)
+
+
+@unittest.skipIf(not ringbuffer.load_numpy(), 'needs numpy')
+class NumpyTest(RingBufferTest, unittest.TestCase):
+    use_numpy = True
+
+    def test_storage(self):
+        buffer = self.buffer(3)
+        self.assertTrue(buffer.use_numpy)
+        self.assertEqual(buffer.nbytes, (8 + 6 * 4) * 2 * 10)
+
+    def test_windows_are_views(self):
+        buffer = self.buffer(15)
+        window = buffer.last()
+        self.assertIs(window.timestamp.base, buffer._timestamps)
+
+
+if __name__ == '__main__':
+    unittest.main()
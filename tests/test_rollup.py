@@ -0,0 +1,88 @@
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import battery
+import history
+import rollup
+
+
+def trace(seconds, start=1700006400):
+    # 每秒一个读数，电量每 10 分钟下降 1%
+    return [(start + i, (0, 100 - i // 600, 3950, -120, 25, 0)) for i in range(seconds)]
+
+
+class ReadonlyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.history = history.HistoryStore(self.directory, commit_interval=3600)
+        self.rollups = rollup.RollupStore(self.directory, self.history)
+        self.history.on_commit = self.rollups.add
+        self.addCleanup(self.rollups.close)
+        self.addCleanup(self.history.close)
+
+    def write(self, samples):
+        for i, (t, fields) in enumerate(samples):
+            self.history.append(battery.BatteryReading(t, fields[1], fields[3], fields))
+            if i % 5 == 4:
+                self.history.commit()
+        self.history.commit()
+
+    def files(self):
+        result = {}
+        for name in os.listdir(self.directory):
+            if name.startswith('rollup-'):
+                with open(os.path.join(self.directory, name), 'rb') as f:
+                    result[name] = f.read()
+        return result
+
+    def export(self, store, resolution):
+        out = io.StringIO()
+        store.export(out, None, None, resolution, 'csv')
+        return out.getvalue()
+
+    def test_cli_does_not_write_while_the_app_runs(self):
+        samples = trace(5 * 3600 + 1234)
+        self.write(samples[:4 * 3600 + 321])
+        before = self.files()
+        for name, resolution in (('minute', rollup.MINUTE), ('hour', rollup.HOUR), ('day', rollup.DAY)):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertEqual(rollup.main([self.directory, name, 'csv']), 0)
+            # 没结束的时间段从历史中补上，结果和 App 中的一致
+            self.assertEqual(out.getvalue(), self.export(self.rollups, resolution))
+        self.assertEqual(self.files(), before)
+        # App 之后继续写入，记录仍然按时间排序且不重复
+        self.write(samples[4 * 3600 + 321:])
+        for level in self.rollups.levels:
+            starts = [bucket.start for bucket in level.records()]
+            self.assertEqual(starts, sorted(set(starts)))
+
+    def test_readonly_skips_records_the_app_wrote_meanwhile(self):
+        samples = trace(3 * 3600)
+        self.write(samples[:3600 + 100])
+        store = rollup.RollupStore(self.directory, self.history, readonly=True)
+        store.add([])
+        self.write(samples[3600 + 100:])
+        hour = store.levels[rollup.RESOLUTIONS.index(rollup.HOUR)]
+        starts = [bucket.start for bucket in hour.records()]
+        self.assertEqual(starts, sorted(set(starts)))
+
+
+    def test_cli_rejects_bad_arguments(self):
+        self.write(trace(600))
+        before = sorted(os.listdir(self.directory))
+        for argv in ([self.directory, 'week'], [self.directory, 'hour', 'xml'], [self.directory, 'hour', 'csv', 'x']):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertEqual(rollup.main(argv), 2)
+            self.assertEqual(out.getvalue().strip(), rollup.main.__doc__)
+        self.assertEqual(sorted(os.listdir(self.directory)), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
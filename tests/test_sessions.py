@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import sessions
+
+START = 1700006400
+
+
+def discharge(start, seconds, percentage=100):
+    # 每秒一个读数，电量每 6 分钟下降 1%
+    return [(start + i, (0, percentage - i // 360, 3950, -120, 25, 0)) for i in range(seconds)]
+
+
+def charge(start, seconds, percentage=50):
+    # 每 3 分钟上升 1%
+    return [(start + i, (0, percentage + i // 180, 3950, 500, 25, 0)) for i in range(seconds)]
+
+
+def feed(tracker, samples):
+    closed = []
+    for t, fields in samples:
+        session = tracker.update(t, fields[1], fields[3] > 0)
+        if session is not None:
+            closed.append(session)
+    return closed
+
+
+class TrackerTest(unittest.TestCase):
+    def test_switch_closes_after_debounce(self):
+        tracker = sessions.SessionTracker()
+        closed = feed(tracker, discharge(START, 3600))
+        self.assertEqual(closed, [])
+        closed = feed(tracker, charge(START + 3600, 1800, 90))
+        self.assertEqual(len(closed), 1)
+        session = closed[0]
+        self.assertEqual(session.kind, sessions.DISCHARGE)
+        self.assertEqual((session.start, session.start_percentage), (START, 100))
+        # 去抖期间的读数仍然算在放电过程中
+        self.assertEqual(session.end, START + 3600 + sessions.DEBOUNCE - 1)
+        self.assertAlmostEqual(session.rate, -10, delta=0.5)
+        current = tracker.current()
+        self.assertEqual(current.kind, sessions.CHARGE)
+        self.assertEqual(current.start, START + 3600 + sessions.DEBOUNCE)
+        self.assertAlmostEqual(current.rate, 20, delta=2.5)
+
+    def test_gap_closes_the_session(self):
+        tracker = sessions.SessionTracker()
+        feed(tracker, discharge(START, 1800))
+        # 睡眠 20 分钟之后还在放电，也要开始一个新过程
+        closed = feed(tracker, discharge(START + 1800 + 1200, 600, 90))
+        self.assertEqual(len(closed), 1)
+        self.assertEqual(closed[0].kind, sessions.DISCHARGE)
+        self.assertEqual(closed[0].end, START + 1799)
+        self.assertEqual(tracker.current().start, START + 1800 + 1200)
+        self.assertEqual(tracker.current().count, 600)
+
+    def test_short_gap_does_not_split(self):
+        tracker = sessions.SessionTracker()
+        closed = feed(tracker, discharge(START, 1800) + discharge(START + 1800 + 300, 600, 95))
+        self.assertEqual(closed, [])
+        self.assertEqual(tracker.current().count, 2400)
+
+    def test_bouncing_charge_flag_is_debounced(self):
+        tracker = sessions.SessionTracker()
+        samples = discharge(START, 3600)
+        # 充电字段每 30 秒跳成正数一次，每次 2 秒
+        samples = [(t, fields[:3] + ((500 if (t - START) % 30 >= 28 else -120),) + fields[4:]) for t, fields in samples]
+        self.assertEqual(feed(tracker, samples), [])
+        self.assertEqual(tracker.current().kind, sessions.DISCHARGE)
+        self.assertEqual(tracker.current().count, 3600)
+
+    def test_out_of_order_readings_are_ignored(self):
+        tracker = sessions.SessionTracker()
+        feed(tracker, discharge(START, 100))
+        self.assertIsNone(tracker.update(START + 50, 10, True))
+        self.assertEqual(tracker.current().count, 100)
+
+
+class StoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'sessions.bin')
+
+    def store(self, **options):
+        store = sessions.SessionStore(self.directory, **options)
+        self.addCleanup(store.close)
+        return store
+
+    def write(self):
+        store = self.store()
+        store.add(discharge(START, 3600) + charge(START + 3600, 1800, 90) + discharge(START + 5400, 1800, 100))
+        store.close()
+        return store
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_reopen_after_partial_record(self):
+        self.write()
+        data = self.read()
+        self.assertEqual(len(data), 2 * sessions._RECORD.size)
+        with open(self.path, 'ab') as f:
+            f.write(b'\x01' * (sessions._RECORD.size // 2))
+        store = self.store()
+        # 截掉写了一半的记录，已经写入的时间之前的读数不再重复计算
+        store.add(discharge(START + 5400 + 1800, 10, 90))
+        self.assertEqual(self.read(), data)
+        self.assertEqual(store.tracker.last, START + 5400 + 1800 + 9)
+        kinds = [s.kind for s in store.query()]
+        self.assertEqual(kinds, [sessions.DISCHARGE, sessions.CHARGE, sessions.DISCHARGE])
+
+    def test_query_by_time(self):
+        self.write()
+        store = self.store(readonly=True)
+        self.assertEqual([s.kind for s in store.query(START + 3700)], [sessions.CHARGE])
+        self.assertEqual([s.kind for s in store.query(end=START + 3600)], [sessions.DISCHARGE])
+        self.assertEqual(len(store.query(kind=sessions.DISCHARGE)), 1)
+
+    def test_readonly_leaves_the_file_untouched(self):
+        self.write()
+        with open(self.path, 'ab') as f:
+            f.write(b'\x01' * 5)
+        data = self.read()
+        mtime = os.stat(self.path).st_mtime_ns
+        store = self.store(readonly=True)
+        self.assertEqual(len(store.query()), 2)
+        with self.assertRaises(ValueError):
+            store.add(discharge(START + 7200, 10))
+        store.close()
+        self.assertEqual(self.read(), data)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+
+    def test_readonly_without_file(self):
+        store = self.store(readonly=True)
+        self.assertEqual(store.query(), [])
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
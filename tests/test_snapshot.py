@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import battery
+import snapshot
+
+
+def reading(percentage, charge=-120, t=1700006400.0):
+    return battery.BatteryReading(t, percentage, charge, (0, percentage, 3950, charge, 25, 0))
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'snapshot.json')
+
+    def stat(self):
+        st = os.stat(self.path)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def test_round_trip(self):
+        snapshot.Snapshot(self.path).save(reading(85), 'icon-85')
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(85), 'icon-85'))
+
+    def test_unchanged_snapshot_is_not_rewritten(self):
+        store = snapshot.Snapshot(self.path)
+        self.assertTrue(store.save(reading(85), 'icon-85'))
+        before = self.stat()
+        with mock.patch('os.fsync') as fsync:
+            # 只有时间和其他字段变化，电量、充电状态和图标不变
+            self.assertFalse(store.save(reading(85, -130, 1700006460.0), 'icon-85'))
+            fsync.assert_not_called()
+        self.assertEqual(self.stat(), before)
+        self.assertTrue(store.save(reading(84), 'icon-85'))
+        self.assertTrue(store.save(reading(84, 500), 'icon-85'))
+        self.assertTrue(store.save(reading(84, 500), 'icon-low'))
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(84, 500), 'icon-low'))
+
+    def test_loaded_snapshot_is_not_rewritten(self):
+        snapshot.Snapshot(self.path).save(reading(85), 'icon-85')
+        before = self.stat()
+        store = snapshot.Snapshot(self.path)
+        store.load()
+        self.assertFalse(store.save(reading(85), 'icon-85'))
+        self.assertEqual(self.stat(), before)
+
+    def test_failed_write_keeps_the_previous_snapshot(self):
+        store = snapshot.Snapshot(self.path)
+        store.save(reading(85), 'icon-85')
+        with mock.patch('os.fsync', side_effect=OSError(28, 'No space left on device')):
+            self.assertFalse(store.save(reading(84), 'icon-84'))
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(85), 'icon-85'))
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+        # 失败的写入不算保存过，下一次重新写
+        self.assertTrue(store.save(reading(84), 'icon-84'))
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(84), 'icon-84'))
+
+    def test_partial_temporary_file_is_ignored(self):
+        store = snapshot.Snapshot(self.path)
+        store.save(reading(85), 'icon-85')
+        # 上次写临时文件时崩溃
+        with open(self.path + '.tmp', 'w') as f:
+            f.write('{"timestamp": 17000')
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(85), 'icon-85'))
+        self.assertTrue(store.save(reading(80), 'icon-80'))
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (reading(80), 'icon-80'))
+
+    def test_missing_or_corrupt_snapshot(self):
+        self.assertEqual(snapshot.Snapshot(self.path).load(), (None, None))
+        for data in ('{"timestamp": 17000', '[]', '{"timestamp": 1}', '{}'):
+            with open(self.path, 'w') as f:
+                f.write(data)
+            self.assertEqual(snapshot.Snapshot(self.path).load(), (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
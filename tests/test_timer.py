@@ -0,0 +1,160 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+
+import rumps
+from rumps import _headless
+
+
+def drain(predicate, timeout=5.0):
+    """运行主线程队列，直到 predicate() 为真；后台回调的结果由工作线程排队到主线程。"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('timed out waiting for the main thread queue')
+        _headless.advance(0)
+        time.sleep(0.001)
+
+
+class TimerTest(unittest.TestCase):
+    def timer(self, callback, interval, **options):
+        timer = rumps.Timer(callback, interval, **options)
+        self.addCleanup(timer.stop)
+        return timer
+
+    def test_tolerance_is_applied_to_the_native_timer(self):
+        timer = self.timer(lambda _: None, 10, tolerance=1.5)
+        timer.start()
+        self.assertEqual(timer._nstimer.tolerance(), 1.5)
+        timer.tolerance = 3
+        self.assertEqual(timer._nstimer.tolerance(), 3)
+        timer.tolerance = None
+        self.assertEqual(timer._nstimer.tolerance(), 0)
+
+    def test_no_tolerance_by_default(self):
+        timer = self.timer(lambda _: None, 10)
+        timer.start()
+        self.assertEqual(timer._nstimer.tolerance(), 0)
+
+    def test_invalid_drift(self):
+        with self.assertRaises(ValueError):
+            rumps.Timer(lambda _: None, 1, drift='catch_up')
+
+    def test_fixed_rate_stays_on_the_grid(self):
+        start = _headless.now()
+        fired = []
+
+        def tick(_):
+            fired.append(_headless.now() - start)
+            if len(fired) == 2:
+                _headless.spend(2.5)
+
+        self.timer(tick, 1).start()
+        _headless.advance(6.5)
+        # 慢的回调之后补一次，之后回到原来的整秒网格，错过的不连续补发
+        self.assertEqual(fired, [0, 1, 3.5, 4, 5, 6])
+
+    def test_fixed_delay_waits_after_each_callback(self):
+        start = _headless.now()
+        fired = []
+
+        def tick(_):
+            fired.append(_headless.now() - start)
+            _headless.spend(0.5)
+
+        self.timer(tick, 1, drift='fixed_delay').start()
+        _headless.advance(6)
+        self.assertEqual(fired, [0, 1.5, 3, 4.5, 6])
+
+    def test_stop_and_restart(self):
+        fired = []
+        timer = self.timer(lambda _: fired.append(_headless.now()), 1, drift='fixed_delay')
+        timer.start()
+        _headless.advance(2.5)
+        timer.stop()
+        _headless.advance(5)
+        self.assertEqual(len(fired), 3)
+        timer.start()
+        _headless.advance(0.5)
+        self.assertEqual(len(fired), 4)
+
+    def test_background_result_on_main_thread(self):
+        results = []
+
+        def work(_):
+            return threading.current_thread()
+
+        def on_result(worker):
+            results.append((worker, threading.current_thread()))
+
+        timer = self.timer(work, 1, background=True, on_result=on_result)
+        timer.start()
+        _headless.advance(0)
+        drain(lambda: results)
+        worker, main = results[0]
+        self.assertIsNot(worker, threading.main_thread())
+        self.assertIs(main, threading.main_thread())
+
+    def test_background_skips_ticks_while_busy(self):
+        release = threading.Event()
+        calls, results = [], []
+
+        def work(_):
+            calls.append(1)
+            release.wait(5)
+            return len(calls)
+
+        timer = self.timer(work, 1, background=True, on_result=results.append)
+        timer.start()
+        _headless.advance(3.5)
+        self.assertEqual(timer.skipped, 3)
+        release.set()
+        drain(lambda: results)
+        self.assertEqual(results, [1])
+        _headless.advance(1)
+        drain(lambda: len(results) == 2)
+        self.assertEqual(len(calls), 2)
+
+    def test_background_failure_skips_on_result(self):
+        results = []
+
+        def work(_):
+            raise RuntimeError('serial port gone')
+
+        timer = self.timer(work, 1, background=True, drift='fixed_delay', on_result=results.append)
+        timer.start()
+        with contextlib.redirect_stderr(io.StringIO()):
+            _headless.advance(0)
+            drain(lambda: not timer._busy)
+        self.assertEqual(results, [])
+        # fixed_delay 在失败后也重新计时
+        self.assertTrue(timer._nstimer.isValid())
+
+    def test_background_fixed_delay_counts_from_the_result(self):
+        started, release = threading.Event(), threading.Event()
+        calls, results = [], []
+
+        def work(_):
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return len(calls)
+
+        timer = self.timer(work, 1, background=True, drift='fixed_delay', on_result=results.append)
+        timer.start()
+        # 回调还没有结束时不会再调度，也就没有被跳过的 tick
+        _headless.advance(5)
+        started.wait(5)
+        self.assertEqual((len(calls), timer.skipped), (1, 0))
+        release.set()
+        drain(lambda: results)
+        self.assertAlmostEqual(timer._nstimer.fireDate().timeIntervalSinceNow(), 1)
+        _headless.advance(1)
+        drain(lambda: len(results) == 2)
+        self.assertEqual(results, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import collections
+import pickle
+import random
+import unittest
+
+from rumps.utils import ListDict
+
+
+class ListDictTest(unittest.TestCase):
+    def test_keeps_insertion_order(self):
+        d = ListDict([('b', 1), ('a', 2)], c=3)
+        d['d'] = 4
+        d['a'] = 5  # 修改已有的值不改变顺序
+        self.assertEqual(list(d), ['b', 'a', 'c', 'd'])
+        self.assertEqual(list(d.values()), [1, 5, 3, 4])
+        self.assertEqual(list(d.items()), [('b', 1), ('a', 5), ('c', 3), ('d', 4)])
+        self.assertEqual(list(reversed(d)), ['d', 'c', 'a', 'b'])
+        del d['a']
+        d['a'] = 6
+        self.assertEqual(list(d.keys()), ['b', 'c', 'd', 'a'])
+
+    def test_insert_after(self):
+        d = ListDict.fromkeys('abc', 0)
+        d.insert_after('a', ('x', 1))
+        self.assertEqual(list(d), ['a', 'x', 'b', 'c'])
+        d.insert_after('c', ('y', 2))
+        self.assertEqual(list(d), ['a', 'x', 'b', 'c', 'y'])
+        # 已有的键移动到新位置并更新值
+        d.insert_after('y', ('a', 3))
+        self.assertEqual(list(d), ['x', 'b', 'c', 'y', 'a'])
+        self.assertEqual(d['a'], 3)
+        self.assertEqual(len(d), 5)
+
+    def test_insert_before(self):
+        d = ListDict.fromkeys('abc', 0)
+        d.insert_before('a', ('x', 1))
+        self.assertEqual(list(d), ['x', 'a', 'b', 'c'])
+        d.insert_before('c', ('y', 2))
+        self.assertEqual(list(d), ['x', 'a', 'b', 'y', 'c'])
+        d.insert_before('x', ('c', 3))
+        self.assertEqual(list(d), ['c', 'x', 'a', 'b', 'y'])
+        self.assertEqual(d['c'], 3)
+
+    def test_insert_next_to_itself(self):
+        d = ListDict.fromkeys('abc', 0)
+        d.insert_after('b', ('b', 1))
+        d.insert_before('b', ('b', 2))
+        d.insert_after('a', ('b', 3))
+        d.insert_before('c', ('b', 4))
+        self.assertEqual(list(d), ['a', 'b', 'c'])
+        self.assertEqual(d['b'], 4)
+
+    def test_insert_missing_key(self):
+        d = ListDict.fromkeys('ab')
+        with self.assertRaises(KeyError):
+            d.insert_after('z', ('x', 1))
+        with self.assertRaises(KeyError):
+            d.insert_before('z', ('x', 1))
+        self.assertEqual(list(d), ['a', 'b'])
+
+    def test_pop_and_popitem(self):
+        d = ListDict.fromkeys('abcd', 0)
+        self.assertEqual(d.pop('b'), 0)
+        self.assertEqual(d.pop('b', None), None)
+        with self.assertRaises(KeyError):
+            d.pop('b')
+        self.assertEqual(d.popitem(), ('d', 0))
+        self.assertEqual(d.popitem(last=False), ('a', 0))
+        self.assertEqual(list(d), ['c'])
+        d.clear()
+        with self.assertRaises(KeyError):
+            d.popitem()
+        d['e'] = 1
+        self.assertEqual(list(d), ['e'])
+
+    def test_equality_is_order_sensitive(self):
+        a = ListDict([('x', 1), ('y', 2)])
+        b = ListDict([('y', 2), ('x', 1)])
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, {'y': 2, 'x': 1})
+        self.assertEqual(a, a.copy())
+        with self.assertRaises(TypeError):
+            hash(a)
+
+    def test_copy_pickle_and_repr(self):
+        d = ListDict.fromkeys('cab', 1)
+        d.insert_before('c', ('z', 2))
+        self.assertEqual(list(d.copy()), ['z', 'c', 'a', 'b'])
+        self.assertEqual(list(pickle.loads(pickle.dumps(d))), ['z', 'c', 'a', 'b'])
+        self.assertEqual(repr(ListDict([('a', 1)])), "ListDict([('a', 1)])")
+        self.assertEqual(d.setdefault('z', 5), 2)
+        self.assertEqual(d.setdefault('w', 5), 5)
+        self.assertEqual(list(d)[-1], 'w')
+
+    def test_matches_a_list_model(self):
+        # 随机操作，和用列表维护顺序的简单实现比较
+        rng = random.Random(5)
+        d = ListDict()
+        order, values = [], {}
+        for step in range(3000):
+            key = rng.randrange(20)
+            op = rng.randrange(5)
+            if op == 0:
+                d[key] = step
+                if key not in values:
+                    order.append(key)
+                values[key] = step
+            elif op == 1 and key in values:
+                del d[key]
+                order.remove(key)
+                del values[key]
+            elif op in (2, 3) and order:
+                existing = rng.choice(order)
+                if op == 2:
+                    d.insert_after(existing, (key, step))
+                else:
+                    d.insert_before(existing, (key, step))
+                if key != existing:
+                    if key in values:
+                        order.remove(key)
+                    index = order.index(existing)
+                    order.insert(index + 1 if op == 2 else index, key)
+                values[key] = step
+            elif op == 4 and order:
+                last = rng.random() < 0.5
+                key = order.pop(-1 if last else 0)
+                self.assertEqual(d.popitem(last), (key, values.pop(key)))
+            self.assertEqual(list(d), order)
+            self.assertEqual(dict(d), values)
+        self.assertEqual(list(d.items()), list(collections.OrderedDict((k, values[k]) for k in order).items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+import history
+import ringbuffer
+import sessions
+import wear
+
+
+class AnalyzeTest(unittest.TestCase):
+    def setUp(self):
+        # 放电 8 小时、充电 2 小时，重复 4 次；电量有 ±1 跳动，电压和电流有小的波动
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        rng = random.Random(7)
+        t, percentage = 1700006400, 100.0
+        samples, charges = [], []
+        for _ in range(4):
+            for seconds, rate, current in ((8 * 3600, -1 / 360.0, -120), (2 * 3600, 1 / 90.0, 500)):
+                begin, first = t, int(percentage)
+                for _ in range(seconds):
+                    percentage = min(max(percentage + rate, 0.0), 100.0)
+                    value = int(percentage) + (rng.random() < 0.02) * rng.choice((-1, 1))
+                    samples.append((t, (0, value, 3950 + rng.randint(0, 1), current + rng.randint(-3, 3), 25, 0)))
+                    t += 1
+                if current > 0:
+                    charges.append(sessions.Session(sessions.CHARGE, begin, t - 1, first, int(percentage), 0.0, 0.0,
+                                                    seconds))
+        segments = {}
+        for sample in samples:
+            segments.setdefault(history.segment_name(sample[0]), []).append(sample)
+        for name, part in segments.items():
+            with open(os.path.join(self.directory, name), 'wb') as f:
+                f.write(history.encode_segment(part))
+        self.sessions_path = os.path.join(self.directory, 'sessions.bin')
+        with open(self.sessions_path, 'wb') as f:
+            for session in charges:
+                f.write(sessions._record(session))
+        self.readings = len(samples)
+
+    def analyze(self):
+        store = history.HistoryStore(self.directory)
+        return wear.analyze(store, sessions.SessionStore(self.directory, store, readonly=True))
+
+    def test_numpy_and_pure_python_agree(self):
+        if not wear.load_numpy():
+            self.skipTest('needs numpy')
+        vectorized = self.analyze()
+        self.addCleanup(setattr, ringbuffer, '_numpy', ringbuffer._numpy)
+        ringbuffer._numpy = False
+        self.assertEqual(self.analyze(), vectorized)
+        self.assertEqual(vectorized['readings'], self.readings)
+        self.assertEqual(vectorized['capacity_points'], 4)
+
+    def test_cli_leaves_sessions_alone(self):
+        with open(self.sessions_path, 'rb') as f:
+            before = f.read()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(wear.main([self.directory]), 0)
+        self.assertEqual(json.loads(out.getvalue())['capacity_points'], 4)
+        with open(self.sessions_path, 'rb') as f:
+            self.assertEqual(f.read(), before)
+
+    def test_readonly_store_does_not_append(self):
+        store = sessions.SessionStore(self.directory, history.HistoryStore(self.directory), readonly=True)
+        with self.assertRaises(ValueError):
+            store.add([(1700006400, (0, 50, 3950, -120, 25, 0))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,317 @@
+import json
+import os
+import sys
+import threading
+from array import array
+
+from ringbuffer import load_numpy
+
+# 电池损耗：用雨流计数（rainflow）统计电量的充放电循环，换算成等效完整循环次数（100% 的变化算一次），
+# 再从充电过程中积分电流估算容量，拟合容量随时间下降的趋势
+# 电量先经过 hysteresis 的回差过滤，±1% 的跳动（最多相差 2%）不算循环。numpy 可选：有 numpy 时历史按列解码
+# （history.read_columns），拐点用向量运算提取，只有拐点进入计数；没有时逐个读数处理，结果相同
+# RainflowCounter 可以逐个读数增量更新，菜单中的损耗显示不需要离线批处理
+
+HYSTERESIS = 3
+RATED_CYCLES = 500
+# 容量估算只使用电量变化至少这么多的充电过程
+MIN_CAPACITY_SPAN = 20
+SAVE_INTERVAL = 10 * 60
+
+def turning_points(values):
+    """去掉连续重复的值和单调区间中间的值，只保留首尾和局部极值；有 numpy 时向量化。"""
+    numpy = load_numpy()
+    if numpy and len(values) > 2:
+        values = numpy.asarray(values)
+        keep = numpy.empty(len(values), dtype=bool)
+        keep[0] = True
+        keep[1:] = values[1:] != values[:-1]
+        values = values[keep]
+        if len(values) <= 2:
+            return values.tolist()
+        direction = numpy.sign(numpy.diff(values))
+        keep = numpy.empty(len(values), dtype=bool)
+        keep[0] = keep[-1] = True
+        keep[1:-1] = direction[1:] != direction[:-1]
+        return values[keep].tolist()
+    result = []
+    for value in values:
+        if result and value == result[-1]:
+            continue
+        if len(result) >= 2 and (result[-1] - result[-2]) * (value - result[-1]) > 0:
+            result[-1] = value
+        else:
+            result.append(value)
+    return result
+
+
+class RainflowCounter(object):
+    """增量雨流计数（ASTM E1049 的三点法），每个读数 O(1) 均摊。"""
+
+    def __init__(self, hysteresis=HYSTERESIS):
+        self.hysteresis = hysteresis
+        self.reset()
+
+    def reset(self):
+        self.closed = 0.0  # 已经闭合的循环折算成的等效完整循环
+        self.full_cycles = 0
+        self.half_cycles = 0
+        self._stack = []  # 还没有闭合的拐点
+        self._extreme = None  # 正在跟踪的极值，回落超过 hysteresis 时确认为拐点
+        self._direction = 0
+
+    def update(self, value):
+        if self._extreme is None:
+            self._extreme = value
+            self._push(value)
+            return
+        if not self._direction:
+            # 离开起点超过回差之后才确定方向
+            if abs(value - self._stack[-1]) >= self.hysteresis:
+                self._direction = 1 if value > self._stack[-1] else -1
+                self._extreme = value
+        elif (value - self._extreme) * self._direction > 0:
+            self._extreme = value
+        elif abs(value - self._extreme) >= self.hysteresis:
+            self._push(self._extreme)
+            self._direction = -self._direction
+            self._extreme = value
+
+    def extend(self, values):
+        """批量加入读数，拐点提取可以向量化。"""
+        for value in turning_points(values):
+            self.update(value)
+
+    def _push(self, value):
+        stack = self._stack
+        stack.append(value)
+        while len(stack) >= 3:
+            x = abs(stack[-1] - stack[-2])
+            y = abs(stack[-2] - stack[-3])
+            if x < y:
+                break
+            if len(stack) == 3:
+                # 包含起点的范围只算半个循环
+                self.closed += y / 200.0
+                self.half_cycles += 1
+                del stack[0]
+            else:
+                self.closed += y / 100.0
+                self.full_cycles += 1
+                del stack[-3:-1]
+
+    def residual(self):
+        """还没有闭合的拐点（包括正在跟踪的极值），每一段算半个循环。"""
+        points = list(self._stack)
+        if self._direction and self._extreme != points[-1]:
+            points.append(self._extreme)
+        return points
+
+    def cycles(self):
+        """等效完整循环次数，包括残余的半循环。"""
+        points = self.residual()
+        return self.closed + sum(abs(b - a) for a, b in zip(points, points[1:])) / 200.0
+
+    def state(self):
+        return {
+            'closed': self.closed,
+            'full_cycles': self.full_cycles,
+            'half_cycles': self.half_cycles,
+            'stack': self._stack,
+            'extreme': self._extreme,
+            'direction': self._direction,
+        }
+
+    def load(self, state):
+        self.closed = state['closed']
+        self.full_cycles = state['full_cycles']
+        self.half_cycles = state['half_cycles']
+        self._stack = list(state['stack'])
+        self._extreme = state['extreme']
+        self._direction = state['direction']
+
+
+def capacity(samples):
+    """一个充电过程的容量估算（mAh）：积分电流（+BATCG 第 4 个字段，mA），除以电量变化的比例。
+    samples 为 [(秒, 字段), ...]，电量变化小于 MIN_CAPACITY_SPAN 时返回 None。"""
+    if len(samples) < 2:
+        return None
+    change = samples[-1][1][1] - samples[0][1][1]
+    if change < MIN_CAPACITY_SPAN:
+        return None
+    charge = 0.0
+    for (t0, f0), (t1, f1) in zip(samples, samples[1:]):
+        charge += (f0[3] + f1[3]) * (t1 - t0) / 2.0
+    return charge / 3600.0 * 100.0 / change
+
+
+def _capacity_columns(numpy, columns):
+    # capacity() 的向量化版本，columns 为 history.Columns
+    from history import expand
+    t, fields = expand(columns)
+    if len(t) < 2:
+        return None
+    change = fields[-1, 1] - fields[0, 1]
+    if change < MIN_CAPACITY_SPAN:
+        return None
+    current = fields[:, 3].astype(numpy.float64)
+    charge = float(numpy.sum((current[1:] + current[:-1]) * numpy.diff(t))) / 2.0
+    return charge / 3600.0 * 100.0 / float(change)
+
+
+def trend(points):
+    """对 [(时间, 容量), ...] 做最小二乘拟合，返回 (每 30 天的变化比例, 最新的拟合容量)；点数不足时返回 (None, None)。"""
+    if len(points) < 2:
+        return None, None
+    n = float(len(points))
+    mean_t = sum(t for t, _ in points) / n
+    mean_c = sum(c for _, c in points) / n
+    sxx = sum((t - mean_t) ** 2 for t, _ in points)
+    if not sxx:
+        return None, None
+    slope = sum((t - mean_t) * (c - mean_c) for t, c in points) / sxx
+    latest = mean_c + slope * (points[-1][0] - mean_t)
+    first = mean_c + slope * (points[0][0] - mean_t)
+    return slope * 30 * 86400 / first if first else None, latest
+
+
+def read_percentages(history, start=None):
+    """从 start 开始读取历史中的电量，返回 (电量, 最后一个读数的时间, 读数个数)。
+    有 numpy 时按列解码，连续相同的电量只返回一次（不影响循环计数）；没有时逐个读数返回 array。"""
+    numpy = load_numpy()
+    if numpy:
+        columns = history.read_columns(start)
+        if not len(columns.count):
+            return numpy.zeros(0, dtype=numpy.int64), None, 0
+        last = int(columns.start[-1] + columns.step[-1] * (columns.count[-1] - 1))
+        return columns.fields[:, 1], last, int(columns.count.sum())
+    percentages = array('h')
+    last = None
+    for reading in history.read(start):
+        percentages.append(reading.percentage)
+        last = int(reading.timestamp)
+    return percentages, last, len(percentages)
+
+
+def analyze(history, sessions=None, hysteresis=HYSTERESIS):
+    """从历史计算等效循环次数，有充放电过程时再估算容量和趋势。
+    有 numpy 时历史按列解码，拐点用向量运算提取，只有拐点进入雨流计数。"""
+    numpy = load_numpy()
+    if numpy:
+        # 整个历史只解码一次，电量和每个充电过程的电流都从同一份按列数据中取
+        columns = history.read_columns()
+        percentages, readings = columns.fields[:, 1], int(columns.count.sum())
+    else:
+        percentages, _, readings = read_percentages(history)
+    counter = RainflowCounter(hysteresis)
+    counter.extend(percentages)
+    result = {
+        'readings': readings,
+        'cycles': counter.cycles(),
+        'full_cycles': counter.full_cycles,
+        'half_cycles': counter.half_cycles,
+        'wear': counter.cycles() / RATED_CYCLES,
+    }
+    if sessions is not None:
+        from history import select
+        ordered = bool(numpy) and bool(numpy.all(columns.start[1:] >= columns.start[:-1]))
+        points = []
+        for session in sessions.query(kind='charge'):
+            if session.end_percentage - session.start_percentage < MIN_CAPACITY_SPAN:
+                continue
+            if numpy:
+                value = _capacity_columns(numpy, select(columns, session.start, session.end + 1, ordered))
+            else:
+                value = capacity([(r.timestamp, r.fields) for r in history.read(session.start, session.end + 1)])
+            if value is not None:
+                points.append((session.start, value))
+        fade, latest = trend(points)
+        result.update(capacity_points=len(points), capacity_mah=latest, fade_per_30_days=fade)
+    return result
+
+
+class WearTracker(object):
+    """增量模式：由历史的提交回调更新，状态定期保存到 wear.json，重启后从保存的位置继续。"""
+
+    def __init__(self, directory, history=None, hysteresis=HYSTERESIS):
+        self.path = os.path.join(directory, 'wear.json')
+        self.history = history
+        self.counter = RainflowCounter(hysteresis)
+        self.last = None  # 处理过的最后一个读数时间
+        self._saved = None
+        self._lock = threading.Lock()
+        self._loaded = False
+        # 最近一次计算的等效循环次数，主线程直接读取，不等待第一次加载时的批量计算
+        self.value = None
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            self.counter.load(data['counter'])
+            self.last = self._saved = data['last']
+        except (IOError, ValueError, KeyError, TypeError):
+            self.counter.reset()
+            self.last = None
+        if self.history is not None:
+            # 上次保存之后的读数从历史中补上，批量处理
+            start = None if self.last is None else self.last + 1
+            percentages, last, _ = read_percentages(self.history, start)
+            self.counter.extend(percentages)
+            if last is not None:
+                self.last = last
+        self.value = self.counter.cycles()
+
+    def add(self, samples):
+        """HistoryStore.on_commit 的回调：samples 为 [(秒, 字段), ...]。"""
+        with self._lock:
+            self._load()
+            for t, fields in samples:
+                if self.last is not None and t <= self.last:
+                    continue
+                self.counter.update(fields[1])
+                self.last = t
+            self.value = self.counter.cycles()
+            if self.last is not None and (self._saved is None or self.last - self._saved >= SAVE_INTERVAL):
+                self._save()
+
+    def _save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'last': self.last, 'counter': self.counter.state()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._saved = self.last
+
+    def close(self):
+        with self._lock:
+            if self._loaded and self.last is not None and self.last != self._saved:
+                self._save()
+
+
+def format_wear(cycles):
+    """例如“电池循环 12.3 次（损耗约 2%）”，还没有数据时返回 None。"""
+    if cycles is None:
+        return None
+    return '电池循环 {0:.1f} 次（损耗约 {1:.0f}%）'.format(cycles, cycles * 100.0 / RATED_CYCLES)
+
+
+def main(argv):
+    """用法：python wear.py 历史目录"""
+    import history
+    import sessions
+    if not argv:
+        print(main.__doc__)
+        return 2
+    store = history.HistoryStore(argv[0])
+    json.dump(analyze(store, sessions.SessionStore(argv[0], store, readonly=True)), sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))